@@ -0,0 +1,162 @@
+"""Optional HNSW index for semantic document search.
+
+A brute-force scan over every chunk embedding is linear in collection size.
+When hnswlib is installed (``pip install radar[ann]``), collections with at
+least ``ANN_MIN_CHUNKS`` embedded chunks get a per-collection HNSW index,
+rebuilt after indexing and stored under the data directory. Without hnswlib
+every function here is a no-op and search falls back to the full scan.
+"""
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+from radar.config import get_data_paths
+
+# Collections smaller than this are scanned directly
+ANN_MIN_CHUNKS = 10000
+
+# HNSW graph parameters
+_HNSW_M = 16
+_HNSW_EF_CONSTRUCTION = 200
+
+# Loaded indexes keyed by (collection ID, dimension), with the file mtime
+# they were loaded from and a lock held around each query, since the search
+# width (ef) is a setting on the shared index
+_loaded: dict[tuple[int, int], tuple[float, Any, threading.Lock]] = {}
+_loaded_lock = threading.Lock()
+
+
+def _import_hnswlib():
+    """Import hnswlib, or return None if it is not installed."""
+    try:
+        import hnswlib
+        return hnswlib
+    except ImportError:
+        return None
+
+
+def index_path(collection_id: int, dim: int) -> Path:
+    """Get the on-disk path of a collection's HNSW index.
+
+    hnswlib files do not record their dimension, so it is part of the name;
+    a query from a model with a different dimension simply finds no index.
+    """
+    return get_data_paths().ann_indexes / f"collection-{collection_id}-{dim}.hnsw"
+
+
+def remove_index(collection_id: int) -> None:
+    """Delete a collection's HNSW indexes, if any."""
+    with _loaded_lock:
+        for key in [key for key in _loaded if key[0] == collection_id]:
+            del _loaded[key]
+    for path in get_data_paths().ann_indexes.glob(f"collection-{collection_id}-*.hnsw"):
+        path.unlink(missing_ok=True)
+
+
+def build_index(conn: sqlite3.Connection, collection_id: int) -> bool:
+    """(Re)build the HNSW index for a collection from its stored embeddings.
+
+    Collections below ``ANN_MIN_CHUNKS`` have any existing index removed.
+
+    Returns:
+        True if an index was written
+    """
+    from radar.semantic import _decode_embedding
+
+    hnswlib = _import_hnswlib()
+    if hnswlib is None:
+        return False
+
+    rows = conn.execute(
+        """
+        SELECT dc.id, dc.embedding, dc.embedding_scale
+        FROM document_chunks dc
+        JOIN document_files df ON dc.file_id = df.id
+        WHERE df.collection_id = ? AND dc.embedding IS NOT NULL
+        """,
+        (collection_id,),
+    ).fetchall()
+    if len(rows) < ANN_MIN_CHUNKS:
+        remove_index(collection_id)
+        return False
+
+    # Cosine space, so int8 rows need no rescaling
+    vectors = [list(_decode_embedding(row[1], row[2])) for row in rows]
+    dim = len(vectors[0])
+    keep = [i for i, vector in enumerate(vectors) if len(vector) == dim]
+
+    index = hnswlib.Index(space="cosine", dim=dim)
+    index.init_index(
+        max_elements=len(keep), M=_HNSW_M, ef_construction=_HNSW_EF_CONSTRUCTION
+    )
+    index.add_items([vectors[i] for i in keep], [rows[i][0] for i in keep])
+
+    # Write beside the target and swap in, so readers never see a partial file
+    path = index_path(collection_id, dim)
+    tmp_path = path.with_suffix(".tmp")
+    index.save_index(os.fspath(tmp_path))
+    for stale in path.parent.glob(f"collection-{collection_id}-*.hnsw"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+    tmp_path.replace(path)
+    return True
+
+
+def _load_index(collection_id: int, dim: int) -> tuple[Any, threading.Lock] | None:
+    """Load a collection's HNSW index, reusing it until the file changes.
+
+    Returns:
+        The index and the lock to hold while querying it, or None
+    """
+    hnswlib = _import_hnswlib()
+    if hnswlib is None:
+        return None
+
+    path = index_path(collection_id, dim)
+    try:
+        mtime = path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+    with _loaded_lock:
+        cached = _loaded.get((collection_id, dim))
+        if cached is not None and cached[0] == mtime:
+            return cached[1], cached[2]
+
+        index = hnswlib.Index(space="cosine", dim=dim)
+        index.load_index(os.fspath(path))
+        query_lock = threading.Lock()
+        _loaded[(collection_id, dim)] = (mtime, index, query_lock)
+        return index, query_lock
+
+
+def query_index(
+    collection_id: int,
+    query_embedding: list[float],
+    k: int,
+) -> list[tuple[float, int]] | None:
+    """Find approximate nearest chunks in a collection's HNSW index.
+
+    Returns:
+        List of (cosine similarity, chunk ID) pairs, most similar first, or
+        None if the collection has no usable index
+    """
+    loaded = _load_index(collection_id, len(query_embedding))
+    if loaded is None:
+        return None
+    index, query_lock = loaded
+
+    k = min(k, index.get_current_count())
+    if k <= 0:
+        return []
+    # Another thread's set_ef must not land between these two calls
+    with query_lock:
+        index.set_ef(max(k * 4, 50))
+        labels, distances = index.knn_query([query_embedding], k=k)
+    return [
+        (1.0 - float(distance), int(label))
+        for label, distance in zip(labels[0], distances[0])
+    ]
@@ -1,5 +1,6 @@
 """CLI interface for Radar."""
 
+import dataclasses
 import os
 import shutil
 import signal
@@ -14,7 +15,7 @@ from rich.markdown import Markdown
 from rich.panel import Panel
 
 from radar import __version__
-from radar.config import get_config, get_data_paths
+from radar.config import get_config, get_data_paths, set_config
 from radar.memory import get_recent_conversations
 
 console = Console()
@@ -222,22 +223,27 @@ def history(limit: int):
 @click.option("--output", "-o", "output_file", default=None, help="Write to file instead of stdout")
 def export(conversation_id: str, fmt: str, output_file: str | None):
     """Export a conversation as JSON or Markdown."""
-    from radar.export import export_json, export_markdown
+    from radar.export import iter_export_json, iter_export_markdown
 
     try:
         if fmt == "json":
-            content = export_json(conversation_id)
+            chunks = iter_export_json(conversation_id)
         else:
-            content = export_markdown(conversation_id)
+            chunks = iter_export_markdown(conversation_id)
     except ValueError as e:
         console.print(f"[red]Error: {e}[/red]")
         raise SystemExit(1)
 
+    # Write chunks as they are produced so long conversations are never
+    # held in memory as a single string
     if output_file:
-        Path(output_file).write_text(content)
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.writelines(chunks)
         console.print(f"[green]Exported to {output_file}[/green]")
     else:
-        console.print(content)
+        for chunk in chunks:
+            click.echo(chunk, nl=False)
+        click.echo()
 
 
 @cli.command()
@@ -280,15 +286,15 @@ def start(host: str | None, port: int | None, foreground: bool):
 
     # Use CLI args if provided, otherwise fall back to config
     # Also update the config so middleware can check the actual host
-    if host:
-        config.web.host = host
-    else:
-        host = config.web.host
-
-    if port:
-        config.web.port = port
-    else:
-        port = config.web.port
+    if host or port:
+        web = dataclasses.replace(
+            config.web,
+            host=host or config.web.host,
+            port=port or config.web.port,
+        )
+        config = set_config(dataclasses.replace(config, web=web))
+    host = config.web.host
+    port = config.web.port
 
     # Security warning for non-localhost binding
     is_localhost = host in ("127.0.0.1", "localhost", "::1")
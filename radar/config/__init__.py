@@ -45,6 +45,7 @@ __all__ = [
     "_apply_env_overrides",
     # Singleton
     "get_config",
+    "set_config",
     "reload_config",
     "config_file_changed",
 ]
@@ -93,6 +94,18 @@ def get_config() -> Config:
     return _config
 
 
+def set_config(config: Config) -> Config:
+    """Replace the global config instance.
+
+    Configs are frozen, so callers that need to change a setting for the
+    running process (e.g. CLI flags) build a new Config with
+    ``dataclasses.replace()`` and install it here.
+    """
+    global _config
+    _config = config
+    return _config
+
+
 def reload_config() -> Config:
     """Reload configuration from file."""
     global _config
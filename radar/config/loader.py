@@ -1,8 +1,10 @@
 """Configuration loading and environment overrides for Radar."""
 
+import dataclasses
 import os
 import warnings
 from pathlib import Path
+from typing import Any
 
 import yaml
 
@@ -11,28 +13,38 @@ from .schema import Config
 
 
 def _apply_env_overrides(config: Config) -> Config:
-    """Apply environment variable overrides."""
+    """Apply environment variable overrides.
+
+    Config dataclasses are frozen, so overrides are collected per section
+    and applied with ``dataclasses.replace()``, returning a new Config.
+    """
+    # Section name -> field overrides ("" holds top-level fields)
+    overrides: dict[str, dict[str, Any]] = {}
+
+    def override(section: str, name: str, value: Any) -> None:
+        overrides.setdefault(section, {})[name] = value
+
     # New LLM config env vars
     if api_key := os.environ.get("RADAR_API_KEY"):
-        config.llm.api_key = api_key
+        override("llm", "api_key", api_key)
     if llm_provider := os.environ.get("RADAR_LLM_PROVIDER"):
-        config.llm.provider = llm_provider
+        override("llm", "provider", llm_provider)
     if base_url := os.environ.get("RADAR_LLM_BASE_URL"):
-        config.llm.base_url = base_url
+        override("llm", "base_url", base_url)
     if model := os.environ.get("RADAR_LLM_MODEL"):
-        config.llm.model = model
+        override("llm", "model", model)
     if fallback_model := os.environ.get("RADAR_LLM_FALLBACK_MODEL"):
-        config.llm.fallback_model = fallback_model
+        override("llm", "fallback_model", fallback_model)
 
     # New embedding config env vars
     if emb_provider := os.environ.get("RADAR_EMBEDDING_PROVIDER"):
-        config.embedding.provider = emb_provider
+        override("embedding", "provider", emb_provider)
     if emb_model := os.environ.get("RADAR_EMBEDDING_MODEL"):
-        config.embedding.model = emb_model
+        override("embedding", "model", emb_model)
     if emb_base_url := os.environ.get("RADAR_EMBEDDING_BASE_URL"):
-        config.embedding.base_url = emb_base_url
+        override("embedding", "base_url", emb_base_url)
     if emb_api_key := os.environ.get("RADAR_EMBEDDING_API_KEY"):
-        config.embedding.api_key = emb_api_key
+        override("embedding", "api_key", emb_api_key)
 
     # Backward compatibility: old Ollama env vars (deprecated)
     if url := os.environ.get("RADAR_OLLAMA_URL"):
@@ -41,50 +53,56 @@ def _apply_env_overrides(config: Config) -> Config:
             DeprecationWarning,
             stacklevel=2,
         )
-        config.llm.base_url = url
-        config.ollama.base_url = url
+        override("llm", "base_url", url)
+        override("ollama", "base_url", url)
     if ollama_model := os.environ.get("RADAR_OLLAMA_MODEL"):
         warnings.warn(
             "RADAR_OLLAMA_MODEL is deprecated. Use RADAR_LLM_MODEL instead.",
             DeprecationWarning,
             stacklevel=2,
         )
-        config.llm.model = ollama_model
-        config.ollama.model = ollama_model
+        override("llm", "model", ollama_model)
+        override("ollama", "model", ollama_model)
 
     # Notification env vars
     if ntfy_url := os.environ.get("RADAR_NTFY_URL"):
-        config.notifications.url = ntfy_url
+        override("notifications", "url", ntfy_url)
     if ntfy_topic := os.environ.get("RADAR_NTFY_TOPIC"):
-        config.notifications.topic = ntfy_topic
+        override("notifications", "topic", ntfy_topic)
 
     # Web server env vars
     if web_host := os.environ.get("RADAR_WEB_HOST"):
-        config.web.host = web_host
+        override("web", "host", web_host)
     if web_port := os.environ.get("RADAR_WEB_PORT"):
-        config.web.port = int(web_port)
+        override("web", "port", int(web_port))
     if web_auth := os.environ.get("RADAR_WEB_AUTH_TOKEN"):
-        config.web.auth_token = web_auth
+        override("web", "auth_token", web_auth)
 
     # Personality
     if personality := os.environ.get("RADAR_PERSONALITY"):
-        config.personality = personality
+        override("", "personality", personality)
 
     # Data directory (env var takes precedence - handled in DataPaths)
     # We still store in config for introspection, but DataPaths._resolve_base_dir()
     # checks the env var first
     if data_dir := os.environ.get("RADAR_DATA_DIR"):
-        config.data_dir = data_dir
+        override("", "data_dir", data_dir)
 
     # Web search env vars
     if search_provider := os.environ.get("RADAR_SEARCH_PROVIDER"):
-        config.search.provider = search_provider
+        override("search", "provider", search_provider)
     if brave_api_key := os.environ.get("RADAR_BRAVE_API_KEY"):
-        config.search.brave_api_key = brave_api_key
+        override("search", "brave_api_key", brave_api_key)
     if searxng_url := os.environ.get("RADAR_SEARXNG_URL"):
-        config.search.searxng_url = searxng_url
+        override("search", "searxng_url", searxng_url)
 
-    return config
+    if not overrides:
+        return config
+
+    top_level = overrides.pop("", {})
+    for section, values in overrides.items():
+        top_level[section] = dataclasses.replace(getattr(config, section), **values)
+    return dataclasses.replace(config, **top_level)
 
 
 def get_config_path() -> Path | None:
@@ -122,7 +140,7 @@ def load_config() -> Config:
     if config_path:
         with open(config_path) as f:
             data = yaml.safe_load(f) or {}
-        config = Config.from_dict(data)
+        config = Config.from_dict_cached(data)
         config = _apply_env_overrides(config)
     else:
         # Return defaults if no config file found
@@ -4,6 +4,13 @@ import os
 from pathlib import Path
 
 
+def _expand_path(path: str) -> Path:
+    """Build a Path, only expanding ``~`` when the path actually uses it."""
+    if path.startswith("~"):
+        return Path(path).expanduser()
+    return Path(path)
+
+
 class DataPaths:
     """Centralized data path management.
 
@@ -11,21 +18,28 @@ class DataPaths:
     Priority: RADAR_DATA_DIR env var > config file data_dir > default (~/.local/share/radar)
     """
 
-    _base_dir: Path | None = None
+    def __init__(self) -> None:
+        self._base_dir: Path | None = None
+        self._base_created = False
+        # Resolved sub-paths, memoized on first access (directories are
+        # created at that point, so later hits skip the mkdir syscall)
+        self._subpaths: dict[str, Path] = {}
 
     @property
     def base(self) -> Path:
         """Get the base data directory, creating if needed."""
         if self._base_dir is None:
             self._base_dir = self._resolve_base_dir()
-        self._base_dir.mkdir(parents=True, exist_ok=True)
+        if not self._base_created:
+            self._base_dir.mkdir(parents=True, exist_ok=True)
+            self._base_created = True
         return self._base_dir
 
     def _resolve_base_dir(self) -> Path:
         """Resolve the base directory from env var, config, or default."""
         # Priority 1: Environment variable
         if env_dir := os.environ.get("RADAR_DATA_DIR"):
-            return Path(env_dir).expanduser()
+            return _expand_path(env_dir)
         # Priority 2/3: Config file value or default (handled by caller)
         # This is the default; config override happens via set_base_dir()
         return Path.home() / ".local" / "share" / "radar"
@@ -33,68 +47,91 @@ class DataPaths:
     def set_base_dir(self, path: str) -> None:
         """Set base directory from config file value."""
         if path:
-            self._base_dir = Path(path).expanduser()
+            self._base_dir = _expand_path(path)
+            self._base_created = False
+            self._subpaths.clear()
 
     def reset(self) -> None:
         """Reset cached base directory (for testing)."""
         self._base_dir = None
+        self._base_created = False
+        self._subpaths.clear()
+
+    def _subdir(self, name: str) -> Path:
+        """Get a subdirectory of the base directory, creating it on first access."""
+        path = self._subpaths.get(name)
+        if path is None:
+            path = self.base / name
+            path.mkdir(parents=True, exist_ok=True)
+            self._subpaths[name] = path
+        return path
+
+    def _file(self, name: str) -> Path:
+        """Get a file path directly under the base directory."""
+        path = self._subpaths.get(name)
+        if path is None:
+            path = self._subpaths[name] = self.base / name
+        return path
+
+    @property
+    def ann_indexes(self) -> Path:
+        """Get directory for approximate nearest-neighbour search indexes."""
+        return self._subdir("ann_indexes")
 
     @property
     def conversations(self) -> Path:
         """Get conversations directory."""
-        path = self.base / "conversations"
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return self._subdir("conversations")
 
     @property
     def db(self) -> Path:
         """Get memory database path."""
-        return self.base / "memory.db"
+        return self._file("memory.db")
+
+    @property
+    def db_str(self) -> str:
+        """Get memory database path as a string, for sqlite3.connect()."""
+        return os.fspath(self.db)
+
+    @property
+    def llm_cache(self) -> Path:
+        """Get LLM reply cache directory (one file per cached reply)."""
+        return self._subdir("llm_cache")
 
     @property
     def personalities(self) -> Path:
         """Get personalities directory."""
-        path = self.base / "personalities"
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return self._subdir("personalities")
 
     @property
     def plugins(self) -> Path:
         """Get plugins directory."""
-        path = self.base / "plugins"
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return self._subdir("plugins")
 
     @property
     def skills(self) -> Path:
         """Get skills directory."""
-        path = self.base / "skills"
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return self._subdir("skills")
 
     @property
     def summaries(self) -> Path:
         """Get summaries directory."""
-        path = self.base / "summaries"
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return self._subdir("summaries")
 
     @property
     def tools(self) -> Path:
         """Get user tools directory."""
-        path = self.base / "tools"
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return self._subdir("tools")
 
     @property
     def log_file(self) -> Path:
         """Get log file path."""
-        return self.base / "radar.log"
+        return self._file("radar.log")
 
     @property
     def pid_file(self) -> Path:
         """Get PID file path."""
-        return self.base / "radar.pid"
+        return self._file("radar.pid")
 
 
 # Global paths instance
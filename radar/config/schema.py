@@ -1,20 +1,63 @@
 """Configuration dataclasses for Radar."""
 
 import dataclasses
+import sys
 import warnings
 from dataclasses import dataclass, field
-from typing import Any
-
-
-def _dc_from_dict(cls, data: dict[str, Any]):
-    """Construct a dataclass from a dict, using class defaults for missing keys."""
-    return cls(**{
-        f.name: data.get(f.name, f.default if f.default is not dataclasses.MISSING else f.default_factory())
-        for f in dataclasses.fields(cls)
-    })
-
-
-@dataclass
+from typing import Any, Callable, Sequence, get_type_hints
+
+
+def _intern(value: Any) -> Any:
+    """Intern string config values so repeated parses share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _make_section_builder(cls: type) -> Callable[[dict[str, Any]], Any]:
+    """Generate a ``dict -> cls`` constructor for a config section.
+
+    Field names and defaults are baked into straight-line source (the same
+    trick dataclasses uses for ``__init__``), so building a section is a run
+    of dict probes with no ``fields()`` iteration. Missing keys use the
+    class defaults.
+    """
+    namespace: dict[str, Any] = {"cls": cls, "_intern": _intern}
+    args = []
+    for f in dataclasses.fields(cls):
+        if f.default is not dataclasses.MISSING:
+            namespace[f"_d_{f.name}"] = f.default
+            default = f"_d_{f.name}"
+        else:
+            namespace[f"_f_{f.name}"] = f.default_factory
+            default = f"_f_{f.name}()"
+        args.append(f"        {f.name}=_intern(data[{f.name!r}]) if {f.name!r} in data else {default},")
+    source = "def build(data):\n    return cls(\n" + "\n".join(args) + "\n    )\n"
+    exec(compile(source, f"<config builder {cls.__name__}>", "exec"), namespace)
+    return namespace["build"]
+
+
+# Keys of config warnings already emitted; each fires once per process
+# rather than on every hot reload
+_warned: set[str] = set()
+
+
+def _warn_once(key: str, message: str, category: type[Warning]) -> None:
+    """Emit a warning the first time it is raised for ``key``.
+
+    The warning is attributed to the first caller outside this module, however
+    many of its frames (from_dict_cached, from_dict, _migrate) are in between.
+    """
+    if key in _warned:
+        return
+    _warned.add(key)
+    stacklevel = 1
+    frame = sys._getframe()
+    while frame is not None and frame.f_globals.get("__name__") == __name__:
+        frame = frame.f_back
+        stacklevel += 1
+    warnings.warn(message, category, stacklevel=stacklevel)
+
+
+@dataclass(frozen=True, slots=True)
 class LLMConfig:
     """LLM provider configuration."""
 
@@ -38,8 +81,24 @@ class LLMConfig:
     # When the primary model returns 429/503, automatically retry with this model
     fallback_model: str = ""
 
+    # Replay stored replies for repeated identical requests (opt-in). Only
+    # turns that ran no tools are cached, so tool side effects always happen.
+    cache_enabled: bool = False
+    # Maximum cached replies kept (least recently used are evicted)
+    cache_max_entries: int = 1000
+
+    # Run a turn's tool calls concurrently when they are all read-only
+    parallel_tool_calls: bool = True
+
+    # Stream Ollama replies, assembling the message as chunks arrive
+    stream: bool = False
+
+    # Mark the system prompt as a cacheable prefix (Anthropic cache_control),
+    # for Anthropic models behind an OpenAI-compatible proxy such as LiteLLM
+    prompt_cache_hints: bool = False
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class EmbeddingConfig:
     """Embedding provider configuration."""
 
@@ -63,7 +122,7 @@ class EmbeddingConfig:
     api_key: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OllamaConfig:
     """Ollama API configuration (deprecated, use LLMConfig)."""
 
@@ -71,7 +130,7 @@ class OllamaConfig:
     model: str = "qwen3:latest"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NotifyConfig:
     """Notification (ntfy) configuration."""
 
@@ -79,7 +138,7 @@ class NotifyConfig:
     topic: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolsConfig:
     """Tools configuration."""
 
@@ -90,11 +149,13 @@ class ToolsConfig:
     # - block_dangerous: Block known dangerous patterns, allow others (default)
     # - allow_all: No restrictions (dangerous!)
     exec_mode: str = "block_dangerous"
-    # Extra directories to scan for user-local tool files
-    extra_dirs: list[str] = field(default_factory=list)
+    # Extra directories to scan for user-local tool files.
+    # Sequence fields default to a shared empty tuple rather than a fresh
+    # list per instance; values from the config file stay YAML lists.
+    extra_dirs: Sequence[str] = ()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HeartbeatConfig:
     """Heartbeat/scheduler configuration."""
 
@@ -104,7 +165,7 @@ class HeartbeatConfig:
     personality: str = ""  # Optional personality override for heartbeats
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WebConfig:
     """Web server configuration."""
 
@@ -115,7 +176,7 @@ class WebConfig:
     auth_token: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PluginsConfig:
     """Plugin system configuration."""
 
@@ -133,15 +194,15 @@ class PluginsConfig:
     auto_approve_if_tests_pass: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HooksConfig:
     """Hook system configuration."""
 
     enabled: bool = True
-    rules: list[dict] = field(default_factory=list)
+    rules: Sequence[dict] = ()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PersonalityEvolutionConfig:
     """Personality evolution/feedback configuration."""
 
@@ -153,7 +214,7 @@ class PersonalityEvolutionConfig:
     min_feedback_for_analysis: int = 10
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WebSearchConfig:
     """Web search configuration."""
 
@@ -169,7 +230,7 @@ class WebSearchConfig:
     safe_search: str = "moderate"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WebMonitorConfig:
     """URL monitor configuration."""
 
@@ -182,7 +243,7 @@ class WebMonitorConfig:
     max_error_count: int = 5
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SummariesConfig:
     """Conversation summary configuration."""
 
@@ -194,7 +255,7 @@ class SummariesConfig:
     max_conversations_per_summary: int = 50
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DocumentsConfig:
     """Document indexing configuration."""
 
@@ -202,10 +263,10 @@ class DocumentsConfig:
     chunk_size: int = 800
     chunk_overlap_pct: float = 0.1
     generate_embeddings: bool = True
-    collections: list[dict] = field(default_factory=list)
+    collections: Sequence[dict] = ()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RetryConfig:
     """Retry with exponential backoff configuration."""
 
@@ -217,15 +278,15 @@ class RetryConfig:
     url_monitor_retries: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SkillsConfig:
     """Agent Skills configuration."""
 
     enabled: bool = True
-    dirs: list[str] = field(default_factory=list)  # Extra skill directories
+    dirs: Sequence[str] = ()  # Extra skill directories
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """Main configuration container."""
 
@@ -246,7 +307,7 @@ class Config:
     retry: RetryConfig = field(default_factory=RetryConfig)
     system_prompt: str = ""
     max_tool_iterations: int = 10
-    watch_paths: list[dict] = field(default_factory=list)
+    watch_paths: Sequence[dict] = ()
     personality: str = "default"  # Personality file name or path
     data_dir: str = ""  # Custom data directory path (prefer RADAR_DATA_DIR env var)
 
@@ -258,60 +319,122 @@ class Config:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Config":
         """Create Config from dictionary."""
-        llm_data = data.get("llm", {})
-        embedding_data = data.get("embedding", {})
-        ollama_data = data.get("ollama", {})
-
-        # Backward compatibility: if 'ollama' section exists but not 'llm', migrate
-        if ollama_data and not llm_data:
-            warnings.warn(
-                "Config 'ollama' section is deprecated. Use 'llm' with provider='ollama' instead.",
-                DeprecationWarning,
-                stacklevel=2,
-            )
-            llm_data = {
-                "provider": "ollama",
-                "base_url": ollama_data.get("base_url", LLMConfig.base_url),
-                "model": ollama_data.get("model", LLMConfig.model),
-            }
-
-        # Backward compatibility: if 'embedding_model' exists but not 'embedding', migrate
-        old_embedding_model = data.get("embedding_model")
-        if old_embedding_model and not embedding_data:
-            warnings.warn(
-                "Config 'embedding_model' is deprecated. Use 'embedding.model' instead.",
-                DeprecationWarning,
-                stacklevel=2,
-            )
-            embedding_data = {"model": old_embedding_model}
-
-        # Security warning: API key in config file
-        if llm_data.get("api_key") or embedding_data.get("api_key"):
-            warnings.warn(
-                "API key found in config file. For security, use RADAR_API_KEY "
-                "environment variable instead to avoid committing secrets.",
-                UserWarning,
-                stacklevel=2,
-            )
-
-        # Build section overrides for fields with non-matching config keys
-        section_data = {
-            "llm": llm_data,
-            "embedding": embedding_data,
-            "notifications": data.get("notifications", {}),
-            "ollama": ollama_data,
-        }
-
-        # Build all dataclass-typed fields generically
+        # Single walk over the input, splitting sections from scalar fields
+        section_data: dict[str, Any] = {}
         kwargs: dict[str, Any] = {}
-        for f in dataclasses.fields(cls):
-            if dataclasses.is_dataclass(f.type if isinstance(f.type, type) else None):
-                dc_cls = f.type
-                dc_data = section_data.get(f.name) if f.name in section_data else data.get(f.name, {})
-                kwargs[f.name] = _dc_from_dict(dc_cls, dc_data)
+        for key, value in data.items():
+            if key in _CONFIG_SECTIONS:
+                section_data[key] = value
+            elif key in _CONFIG_SCALARS:
+                kwargs[key] = _intern(value)
+
+        _migrate(section_data, kwargs)
+
+        # Build all dataclass-typed fields; absent sections use plain defaults.
+        # Absent scalars are left out so the class defaults apply.
+        for name, dc_cls in _CONFIG_SECTIONS.items():
+            if name in section_data:
+                kwargs[name] = _SECTION_BUILDERS[name](section_data[name])
             else:
-                # Scalar fields (system_prompt, max_tool_iterations, etc.)
-                default = f.default if f.default is not dataclasses.MISSING else f.default_factory()
-                kwargs[f.name] = data.get(f.name, default)
+                kwargs[name] = dc_cls()
 
         return cls(**kwargs)
+
+    @classmethod
+    def from_dict_cached(cls, data: dict[str, Any]) -> "Config":
+        """Create Config from dictionary, reusing the parse of identical data.
+
+        Used on the reload path, where the config file usually hasn't changed.
+        Deprecation warnings only fire on a cache miss. The cached instance is
+        returned as-is and shared between callers: configs are frozen, but
+        list and dict fields inside them must not be mutated.
+        """
+        key = _freeze(data)
+        config = _parse_cache.get(key)
+        if config is None:
+            config = cls.from_dict(data)
+            if len(_parse_cache) >= _PARSE_CACHE_MAX:
+                _parse_cache.clear()
+            _parse_cache[key] = config
+        return config
+
+
+def _migrate(section_data: dict[str, Any], scalars: dict[str, Any]) -> None:
+    """Migrate deprecated config keys in place and warn about inline secrets.
+
+    Runs as a pre-pass over the split input so from_dict() itself only
+    has to construct dataclasses.
+    """
+    llm_data = section_data.get("llm", {})
+    embedding_data = section_data.get("embedding", {})
+    ollama_data = section_data.get("ollama", {})
+
+    # Backward compatibility: if 'ollama' section exists but not 'llm', migrate
+    if ollama_data and not llm_data:
+        _warn_once(
+            "ollama",
+            "Config 'ollama' section is deprecated. Use 'llm' with provider='ollama' instead.",
+            DeprecationWarning,
+        )
+        # Slotted classes don't expose field defaults as class attributes
+        llm_defaults = LLMConfig()
+        llm_data = {
+            "provider": "ollama",
+            "base_url": ollama_data.get("base_url", llm_defaults.base_url),
+            "model": ollama_data.get("model", llm_defaults.model),
+        }
+
+    # Backward compatibility: if 'embedding_model' exists but not 'embedding', migrate
+    old_embedding_model = scalars.get("embedding_model")
+    if old_embedding_model and not embedding_data:
+        _warn_once(
+            "embedding_model",
+            "Config 'embedding_model' is deprecated. Use 'embedding.model' instead.",
+            DeprecationWarning,
+        )
+        embedding_data = {"model": old_embedding_model}
+
+    # Security warning: API key in config file
+    if llm_data.get("api_key") or embedding_data.get("api_key"):
+        _warn_once(
+            "api_key",
+            "API key found in config file. For security, use RADAR_API_KEY "
+            "environment variable instead to avoid committing secrets.",
+            UserWarning,
+        )
+
+    # Migrated sections replace whatever was read from the file
+    section_data["llm"] = llm_data
+    section_data["embedding"] = embedding_data
+
+
+# Dataclass-typed Config fields (name -> class) and the remaining scalar
+# fields, resolved once so from_dict doesn't re-inspect fields per call.
+# get_type_hints() resolves string annotations, which a raw f.type check
+# would silently treat as scalars.
+_CONFIG_SECTIONS: dict[str, type] = {
+    name: hint
+    for name, hint in get_type_hints(Config).items()
+    if dataclasses.is_dataclass(hint)
+}
+_CONFIG_SCALARS = frozenset(f.name for f in dataclasses.fields(Config)) - _CONFIG_SECTIONS.keys()
+_SECTION_BUILDERS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    name: _make_section_builder(dc_cls) for name, dc_cls in _CONFIG_SECTIONS.items()
+}
+
+# Parsed configs keyed by frozen input data (see Config.from_dict_cached)
+_PARSE_CACHE_MAX = 8
+_parse_cache: dict[Any, Config] = {}
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists into hashable equivalents.
+
+    Scalars are paired with their type, since True, 1 and 1.0 compare (and
+    hash) equal but parse into differently typed configs.
+    """
+    if isinstance(value, dict):
+        return frozenset((_freeze(k), _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return (type(value), value)
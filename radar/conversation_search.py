@@ -4,6 +4,7 @@ Converts JSONL conversations to structured markdown, indexes them as a
 document collection, and provides hybrid search (FTS5 + semantic embeddings).
 """
 
+import io
 import json
 from pathlib import Path
 from typing import Any
@@ -26,19 +27,20 @@ def conversation_to_text(conversation_id: str) -> str:
     Returns empty string for empty or missing conversations.
     """
     conv_path = get_data_paths().conversations / f"{conversation_id}.jsonl"
-    if not conv_path.exists():
+    try:
+        data = conv_path.read_bytes()
+    except FileNotFoundError:
         return ""
 
+    # One read and one C-level split; json.loads takes bytes directly
     messages = []
-    with open(conv_path) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                messages.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
+    for line in data.split(b"\n"):
+        if not line or line.isspace():
+            continue
+        try:
+            messages.append(json.loads(line))
+        except ValueError:  # JSONDecodeError or invalid UTF-8
+            continue
 
     if not messages:
         return ""
@@ -48,7 +50,9 @@ def conversation_to_text(conversation_id: str) -> str:
     date_str = first_ts[:10] if first_ts else "unknown"
     short_id = conversation_id[:8]
 
-    parts = [f"# Conversation {short_id} - {date_str}\n"]
+    # Sections are separated by a blank line; each ends with its own newline
+    buf = io.StringIO()
+    buf.write(f"# Conversation {short_id} - {date_str}\n")
 
     for msg in messages:
         role = msg.get("role", "")
@@ -58,14 +62,17 @@ def conversation_to_text(conversation_id: str) -> str:
 
         if role == "user":
             content = msg.get("content") or ""
-            parts.append(f"## User\n{content}\n")
+            buf.write(f"\n## User\n{content}\n")
 
         elif role == "assistant":
             content = msg.get("content") or ""
+            tool_calls = msg.get("tool_calls") or []
+            if not content and not tool_calls:
+                continue
 
-            # Append compact tool call summaries
-            tool_summaries = []
-            for tc in msg.get("tool_calls") or []:
+            buf.write("\n## Assistant\n")
+            # Compact tool call summaries, then the reply text
+            for idx, tc in enumerate(tool_calls):
                 func = tc.get("function", {})
                 name = func.get("name", "unknown")
                 args = func.get("arguments", {})
@@ -76,14 +83,14 @@ def conversation_to_text(conversation_id: str) -> str:
                     )
                 else:
                     args_str = str(args)
-                tool_summaries.append(f"[Tool: {name}({args_str})]")
+                if idx:
+                    buf.write("\n")
+                buf.write(f"[Tool: {name}({args_str})]")
+            if tool_calls and content:
+                buf.write("\n")
+            buf.write(f"{content}\n")
 
-            tool_text = "\n".join(tool_summaries)
-            body = "\n".join(filter(None, [tool_text, content]))
-            if body:
-                parts.append(f"## Assistant\n{body}\n")
-
-    return "\n".join(parts)
+    return buf.getvalue()
 
 
 def ensure_conversations_collection() -> None:
@@ -118,12 +125,19 @@ def index_conversations() -> dict[str, int]:
 
     Returns dict with 'indexed', 'skipped', 'removed' counts.
     """
+    from radar import ann_index
     from radar.config import get_config
     from radar.documents import (
+        _apply_bulk_pragmas,
+        _begin_bulk,
+        _commit_bulk_batch,
+        _end_bulk,
         _get_connection,
         _remove_stale_files,
+        clear_search_cache,
         get_collection,
         index_file,
+        is_file_unchanged,
     )
 
     ensure_conversations_collection()
@@ -136,6 +150,7 @@ def index_conversations() -> dict[str, int]:
     docs_config = get_config().documents
 
     conn = _get_connection()
+    _apply_bulk_pragmas(conn)
     try:
         indexed = 0
         skipped = 0
@@ -145,28 +160,36 @@ def index_conversations() -> dict[str, int]:
             if file_path.is_file():
                 matched_files.add(file_path.resolve())
 
-        for file_path in sorted(matched_files):
-            conversation_id = file_path.stem
-            text = conversation_to_text(conversation_id)
-            if not text:
+        rebuild_fts = collection["last_indexed"] is None
+        _begin_bulk(conn, rebuild_fts)
+        for files_done, file_path in enumerate(sorted(matched_files), 1):
+            # Skip the JSONL-to-markdown conversion for untouched files
+            if is_file_unchanged(conn, file_path):
                 skipped += 1
-                continue
-
-            chunks = index_file(
-                conn,
-                collection["id"],
-                file_path,
-                chunk_size=docs_config.chunk_size,
-                overlap_pct=docs_config.chunk_overlap_pct,
-                generate_embeddings=docs_config.generate_embeddings,
-                text_override=text,
-            )
-            if chunks > 0:
-                indexed += 1
-            else:
+            elif not (text := conversation_to_text(file_path.stem)):
                 skipped += 1
+            else:
+                chunks = index_file(
+                    conn,
+                    collection["id"],
+                    file_path,
+                    chunk_size=docs_config.chunk_size,
+                    overlap_pct=docs_config.chunk_overlap_pct,
+                    generate_embeddings=docs_config.generate_embeddings,
+                    text_override=text,
+                )
+                if chunks > 0:
+                    indexed += 1
+                else:
+                    skipped += 1
+            # Counted for every file, skipped or not, so no batch is missed
+            _commit_bulk_batch(conn, files_done, rebuild_fts)
 
         removed = _remove_stale_files(conn, collection["id"], matched_files)
+        _end_bulk(conn, rebuild_fts)
+        if indexed or removed:
+            ann_index.build_index(conn, collection["id"])
+            clear_search_cache()
 
         conn.execute(
             "UPDATE document_collections SET last_indexed = CURRENT_TIMESTAMP WHERE id = ?",
@@ -203,7 +226,7 @@ def search_conversations(query: str, limit: int = 10) -> list[dict[str, Any]]:
 
 def remove_conversation_index(conversation_id: str) -> None:
     """Remove index entries for a deleted conversation."""
-    from radar.documents import _get_connection
+    from radar.documents import _get_connection, clear_search_cache
 
     conv_path = get_data_paths().conversations / f"{conversation_id}.jsonl"
     resolved = str(conv_path.resolve())
@@ -221,5 +244,6 @@ def remove_conversation_index(conversation_id: str) -> None:
         conn.execute("DELETE FROM document_chunks WHERE file_id = ?", (row["id"],))
         conn.execute("DELETE FROM document_files WHERE id = ?", (row["id"],))
         conn.commit()
+        clear_search_cache()
     finally:
         conn.close()
@@ -5,14 +5,78 @@ across indexed documents using BM25 (FTS5) and cosine similarity.
 """
 
 import hashlib
+import heapq
+import math
+import operator
+import os
 import re
 import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from radar import ann_index
 from radar.config import get_config, get_data_paths
 from radar.semantic import _get_connection as _get_base_connection
 
+# Files indexed per transaction during bulk indexing
+INDEX_COMMIT_BATCH = 50
+
+# Worker threads issuing embedding requests during collection indexing
+INDEX_EMBED_WORKERS = 4
+
+# Start of each markdown heading line (chunk_markdown split points)
+_HEADING_RE = re.compile(r"^#{1,6}\s", re.MULTILINE)
+
+# Columns added to existing databases on first connect. document_chunks:
+# embeddings are stored int8 with a per-vector scale (NULL scale = legacy
+# float32) and the stored vector's L2 norm (NULL = compute at query time).
+# document_files: stat fingerprint checked before hashing.
+_ADDED_COLUMNS = {
+    "document_chunks": {"embedding_scale": "REAL", "embedding_norm": "REAL"},
+    "document_files": {"file_size": "INTEGER", "file_mtime_ns": "INTEGER"},
+}
+
+# search_hybrid results, keyed by database, embedding model and query
+# arguments. Entries expire after a TTL; local index changes clear it.
+_SEARCH_CACHE_MAX = 1024
+_SEARCH_CACHE_TTL = 300.0  # seconds
+_search_cache: OrderedDict[tuple, tuple[float, list[dict[str, Any]]]] = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+# Database paths whose document tables exist, so the CREATE statements
+# run once per process rather than on every connection
+_initialized_dbs: set[str] = set()
+
+
+# Triggers keeping document_chunks_fts in sync with document_chunks
+_FTS_TRIGGERS = {
+    "document_chunks_ai": """
+        CREATE TRIGGER IF NOT EXISTS document_chunks_ai AFTER INSERT ON document_chunks BEGIN
+            INSERT INTO document_chunks_fts(rowid, content) VALUES (new.id, new.content);
+        END
+    """,
+    "document_chunks_ad": """
+        CREATE TRIGGER IF NOT EXISTS document_chunks_ad AFTER DELETE ON document_chunks BEGIN
+            INSERT INTO document_chunks_fts(document_chunks_fts, rowid, content)
+            VALUES ('delete', old.id, old.content);
+        END
+    """,
+    "document_chunks_au": """
+        CREATE TRIGGER IF NOT EXISTS document_chunks_au AFTER UPDATE ON document_chunks BEGIN
+            INSERT INTO document_chunks_fts(document_chunks_fts, rowid, content)
+            VALUES ('delete', old.id, old.content);
+            INSERT INTO document_chunks_fts(rowid, content) VALUES (new.id, new.content);
+        END
+    """,
+}
+
 
 def _init_document_tables(conn: sqlite3.Connection) -> None:
     """Initialize document indexing tables."""
@@ -34,6 +98,8 @@ def _init_document_tables(conn: sqlite3.Connection) -> None:
             collection_id INTEGER NOT NULL,
             file_path TEXT NOT NULL UNIQUE,
             file_hash TEXT NOT NULL,
+            file_size INTEGER,
+            file_mtime_ns INTEGER,
             last_indexed TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (collection_id) REFERENCES document_collections(id) ON DELETE CASCADE
         )
@@ -46,10 +112,46 @@ def _init_document_tables(conn: sqlite3.Connection) -> None:
             chunk_index INTEGER NOT NULL,
             content TEXT NOT NULL,
             embedding BLOB,
+            embedding_scale REAL,
+            embedding_norm REAL,
             FOREIGN KEY (file_id) REFERENCES document_files(id) ON DELETE CASCADE
         )
     """)
 
+    # Foreign-key lookups: per-collection counts, stale-file removal, search joins
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_document_files_collection "
+        "ON document_files(collection_id)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_document_chunks_file ON document_chunks(file_id)"
+    )
+    # Semantic search only visits chunks that have an embedding
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_document_chunks_embedded "
+        "ON document_chunks(file_id) WHERE embedding IS NOT NULL"
+    )
+
+    # Columns added after the tables first shipped
+    for table, added in _ADDED_COLUMNS.items():
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        for column, column_type in added.items():
+            if column not in columns:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+
+    # Embeddings keyed by content, so re-indexing a changed file only embeds
+    # the chunks whose text actually changed
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS embedding_cache (
+            provider TEXT NOT NULL,
+            model TEXT NOT NULL,
+            content_hash BLOB NOT NULL,
+            embedding BLOB NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (provider, model, content_hash)
+        )
+    """)
+
     # FTS5 virtual table for full-text search
     # Check if FTS table exists before creating (can't use IF NOT EXISTS with virtual tables)
     cursor = conn.execute(
@@ -66,24 +168,7 @@ def _init_document_tables(conn: sqlite3.Connection) -> None:
         """)
 
         # Triggers to keep FTS in sync
-        conn.execute("""
-            CREATE TRIGGER IF NOT EXISTS document_chunks_ai AFTER INSERT ON document_chunks BEGIN
-                INSERT INTO document_chunks_fts(rowid, content) VALUES (new.id, new.content);
-            END
-        """)
-        conn.execute("""
-            CREATE TRIGGER IF NOT EXISTS document_chunks_ad AFTER DELETE ON document_chunks BEGIN
-                INSERT INTO document_chunks_fts(document_chunks_fts, rowid, content)
-                VALUES ('delete', old.id, old.content);
-            END
-        """)
-        conn.execute("""
-            CREATE TRIGGER IF NOT EXISTS document_chunks_au AFTER UPDATE ON document_chunks BEGIN
-                INSERT INTO document_chunks_fts(document_chunks_fts, rowid, content)
-                VALUES ('delete', old.id, old.content);
-                INSERT INTO document_chunks_fts(rowid, content) VALUES (new.id, new.content);
-            END
-        """)
+        enable_fts_triggers(conn)
 
     conn.commit()
 
@@ -91,10 +176,53 @@ def _init_document_tables(conn: sqlite3.Connection) -> None:
 def _get_connection() -> sqlite3.Connection:
     """Get a database connection with document tables initialized."""
     conn = _get_base_connection()
-    _init_document_tables(conn)
+    db_path = get_data_paths().db_str
+    if db_path not in _initialized_dbs:
+        _init_document_tables(conn)
+        _initialized_dbs.add(db_path)
     return conn
 
 
+@contextmanager
+def _use_connection(conn: sqlite3.Connection | None = None) -> Iterator[sqlite3.Connection]:
+    """Yield the given connection, or open (and close) a fresh one."""
+    if conn is not None:
+        yield conn
+        return
+    conn = _get_connection()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def clear_search_cache() -> None:
+    """Drop cached search_hybrid results (after the index changes)."""
+    with _search_cache_lock:
+        _search_cache.clear()
+
+
+def disable_fts_triggers(conn: sqlite3.Connection) -> None:
+    """Drop the FTS sync triggers ahead of a bulk write.
+
+    Callers must call enable_fts_triggers() and rebuild_fts_index() before
+    committing, so other connections never see the triggers missing.
+    """
+    for name in _FTS_TRIGGERS:
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+
+def enable_fts_triggers(conn: sqlite3.Connection) -> None:
+    """(Re)create the FTS sync triggers."""
+    for sql in _FTS_TRIGGERS.values():
+        conn.execute(sql)
+
+
+def rebuild_fts_index(conn: sqlite3.Connection) -> None:
+    """Rebuild the FTS index from document_chunks in one pass."""
+    conn.execute("INSERT INTO document_chunks_fts(document_chunks_fts) VALUES('rebuild')")
+
+
 # --- Chunking ---
 
 
@@ -116,30 +244,46 @@ def chunk_markdown(
     if not text.strip():
         return []
 
-    # Split on headings (keep heading with its content)
-    sections = re.split(r"(?=^#{1,6}\s)", text, flags=re.MULTILINE)
-    sections = [s for s in sections if s.strip()]
+    # Split on headings (keep heading with its content), slicing between
+    # heading offsets rather than materializing every split piece up front
+    bounds = [m.start() for m in _HEADING_RE.finditer(text)]
+    if not bounds or bounds[0] != 0:
+        bounds.insert(0, 0)
+    bounds.append(len(text))
+    sections = [
+        section
+        for start, end in zip(bounds, bounds[1:])
+        if (section := text[start:end]).strip()
+    ]
 
     if not sections:
         return [text.strip()]
 
     chunks = []
-    current_chunk = ""
+    # Accumulate the current chunk as parts plus a running length, joining
+    # only when it is flushed
+    current_parts: list[str] = []
+    current_len = 0
     overlap_size = int(chunk_size * overlap_pct)
 
     for section in sections:
-        if len(current_chunk) + len(section) <= chunk_size:
-            current_chunk += section
+        if current_len + len(section) <= chunk_size:
+            current_parts.append(section)
+            current_len += len(section)
         else:
+            current_chunk = "".join(current_parts)
             if current_chunk.strip():
                 chunks.append(current_chunk.strip())
             # Start new chunk with overlap from end of previous
             if overlap_size > 0 and current_chunk:
                 overlap_text = current_chunk[-overlap_size:]
-                current_chunk = overlap_text + section
+                current_parts = [overlap_text, section]
+                current_len = len(overlap_text) + len(section)
             else:
-                current_chunk = section
+                current_parts = [section]
+                current_len = len(section)
 
+    current_chunk = "".join(current_parts)
     if current_chunk.strip():
         chunks.append(current_chunk.strip())
 
@@ -206,35 +350,19 @@ def list_collections() -> list[dict[str, Any]]:
     conn = _get_connection()
     try:
         cursor = conn.execute(
-            "SELECT id, name, base_path, patterns, description, created_at, last_indexed "
-            "FROM document_collections ORDER BY name"
+            """
+            SELECT dcol.id, dcol.name, dcol.base_path, dcol.patterns,
+                   dcol.description, dcol.created_at, dcol.last_indexed,
+                   COUNT(DISTINCT df.id) AS file_count,
+                   COUNT(dc.id) AS chunk_count
+            FROM document_collections dcol
+            LEFT JOIN document_files df ON df.collection_id = dcol.id
+            LEFT JOIN document_chunks dc ON dc.file_id = df.id
+            GROUP BY dcol.id
+            ORDER BY dcol.name
+            """
         )
-        rows = cursor.fetchall()
-        results = []
-        for row in rows:
-            # Count files and chunks
-            file_count = conn.execute(
-                "SELECT COUNT(*) FROM document_files WHERE collection_id = ?",
-                (row["id"],),
-            ).fetchone()[0]
-            chunk_count = conn.execute(
-                "SELECT COUNT(*) FROM document_chunks dc "
-                "JOIN document_files df ON dc.file_id = df.id "
-                "WHERE df.collection_id = ?",
-                (row["id"],),
-            ).fetchone()[0]
-            results.append({
-                "id": row["id"],
-                "name": row["name"],
-                "base_path": row["base_path"],
-                "patterns": row["patterns"],
-                "description": row["description"],
-                "created_at": row["created_at"],
-                "last_indexed": row["last_indexed"],
-                "file_count": file_count,
-                "chunk_count": chunk_count,
-            })
-        return results
+        return [dict(row) for row in cursor.fetchall()]
     finally:
         conn.close()
 
@@ -285,6 +413,8 @@ def delete_collection(name: str) -> bool:
             (collection_id,),
         )
         conn.commit()
+        ann_index.remove_index(collection_id)
+        clear_search_cache()
         return True
     finally:
         conn.close()
@@ -295,11 +425,209 @@ def delete_collection(name: str) -> bool:
 
 def _file_hash(path: Path) -> str:
     """Compute SHA-256 hash of a file."""
-    h = hashlib.sha256()
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+# Max content hashes per embedding_cache lookup (SQLite variable limit)
+_EMBEDDING_LOOKUP_BATCH = 500
+
+
+@dataclass
+class _PreparedFile:
+    """A changed file, hashed and chunked but not yet written."""
+
+    path: Path
+    file_hash: str
+    file_size: int
+    file_mtime_ns: int
+    existing_id: int | None
+    chunks: list[str]
+
+
+@dataclass
+class _EmbeddingLookup:
+    """Chunk embeddings found in embedding_cache, and the chunks still missing."""
+
+    hashes: list[bytes]
+    found: dict[bytes, bytes]
+    missing: list[int]
+
+
+def _prepare_file(
+    conn: sqlite3.Connection,
+    file_path: Path,
+    chunk_size: int,
+    overlap_pct: float,
+    text_override: str | None = None,
+) -> _PreparedFile | None:
+    """Hash and chunk a file, or return None if it is unchanged since last index."""
+    st = file_path.stat()
+    existing = _indexed_file(conn, file_path)
+    if existing and _stat_matches(existing, st):
+        return None  # Size and mtime unchanged, skip without hashing
+    current_hash = _file_hash(file_path)
+
+    if existing and existing["file_hash"] == current_hash:
+        # Touched but not modified: remember the new stat, skip
+        conn.execute(
+            "UPDATE document_files SET file_size = ?, file_mtime_ns = ? WHERE id = ?",
+            (st.st_size, st.st_mtime_ns, existing["id"]),
+        )
+        return None
+
+    # Read and chunk the file
+    text = text_override if text_override is not None else file_path.read_text(errors="replace")
+    chunks = chunk_markdown(text, chunk_size=chunk_size, overlap_pct=overlap_pct)
+    return _PreparedFile(
+        file_path,
+        current_hash,
+        st.st_size,
+        st.st_mtime_ns,
+        existing["id"] if existing else None,
+        chunks,
+    )
+
+
+def _indexed_file(conn: sqlite3.Connection, file_path: Path) -> sqlite3.Row | None:
+    """Get a file's index record, if it has been indexed."""
+    return conn.execute(
+        "SELECT id, file_hash, file_size, file_mtime_ns FROM document_files WHERE file_path = ?",
+        (str(file_path),),
+    ).fetchone()
+
+
+def _stat_matches(record: sqlite3.Row, st: os.stat_result) -> bool:
+    """Check whether a file's size and mtime match its index record."""
+    return record["file_size"] == st.st_size and record["file_mtime_ns"] == st.st_mtime_ns
+
+
+def is_file_unchanged(conn: sqlite3.Connection, file_path: Path) -> bool:
+    """Check by size and mtime whether a file is unchanged since it was indexed.
+
+    Lets callers that pre-convert text (``text_override``) skip the
+    conversion for files index_file() would skip anyway.
+    """
+    file_path = Path(file_path).resolve()
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        return False
+    existing = _indexed_file(conn, file_path)
+    return existing is not None and _stat_matches(existing, st)
+
+
+def _lookup_chunk_embeddings(conn: sqlite3.Connection, chunks: list[str]) -> _EmbeddingLookup:
+    """Find cached embeddings for chunks under the current provider/model."""
+    embedding_config = get_config().embedding
+    provider, model = embedding_config.provider, embedding_config.model
+    hashes = [hashlib.sha256(chunk.encode()).digest() for chunk in chunks]
+
+    found: dict[bytes, bytes] = {}
+    unique = list(dict.fromkeys(hashes))
+    for start in range(0, len(unique), _EMBEDDING_LOOKUP_BATCH):
+        batch = unique[start:start + _EMBEDDING_LOOKUP_BATCH]
+        placeholders = ",".join("?" * len(batch))
+        rows = conn.execute(
+            "SELECT content_hash, embedding FROM embedding_cache "
+            f"WHERE provider = ? AND model = ? AND content_hash IN ({placeholders})",
+            (provider, model, *batch),
+        )
+        found.update((row["content_hash"], row["embedding"]) for row in rows)
+
+    missing = [idx for idx, h in enumerate(hashes) if h not in found]
+    return _EmbeddingLookup(hashes, found, missing)
+
+
+def _fetch_embeddings(texts: list[str]) -> list[bytes]:
+    """Embed texts with the provider and serialize them. Touches no database."""
+    from radar.semantic import _serialize_embedding, get_embeddings_cached
+
+    return [_serialize_embedding(e) for e in get_embeddings_cached(texts)]
+
+
+def _complete_embeddings(
+    conn: sqlite3.Connection,
+    lookup: _EmbeddingLookup,
+    fresh: list[bytes],
+) -> list[bytes]:
+    """Store freshly fetched embeddings in embedding_cache and return all of them."""
+    embedding_config = get_config().embedding
+    new_rows = []
+    for idx, blob in zip(lookup.missing, fresh):
+        lookup.found[lookup.hashes[idx]] = blob
+        new_rows.append((embedding_config.provider, embedding_config.model, lookup.hashes[idx], blob))
+    if new_rows:
+        conn.executemany(
+            "INSERT OR IGNORE INTO embedding_cache (provider, model, content_hash, embedding) "
+            "VALUES (?, ?, ?, ?)",
+            new_rows,
+        )
+    return [lookup.found[h] for h in lookup.hashes]
+
+
+def _embed_chunks(conn: sqlite3.Connection, chunks: list[str]) -> list[bytes]:
+    """Get serialized embeddings for chunks, via the persistent embedding cache.
+
+    Cached embeddings for the current provider/model are reused; the rest are
+    embedded in one batch and stored for next time.
+    """
+    lookup = _lookup_chunk_embeddings(conn, chunks)
+    fresh = _fetch_embeddings([chunks[idx] for idx in lookup.missing]) if lookup.missing else []
+    return _complete_embeddings(conn, lookup, fresh)
+
+
+def _persist_file(
+    conn: sqlite3.Connection,
+    collection_id: int,
+    prepared: _PreparedFile,
+    embeddings: list[bytes | None],
+) -> None:
+    """Write a prepared file's row and chunks, replacing any previous chunks.
+
+    Embeddings arrive as float32 blobs and are stored int8-quantized, a
+    quarter of the size, which keeps most chunk rows off overflow pages.
+    The quantized vector's norm is stored too, so search never recomputes it.
+    """
+    from radar.semantic import _decode_embedding, _deserialize_embedding, _quantize_embedding
+
+    # Remove old chunks if re-indexing
+    if prepared.existing_id is not None:
+        conn.execute(
+            "DELETE FROM document_chunks WHERE file_id = ?",
+            (prepared.existing_id,),
+        )
+        conn.execute(
+            "UPDATE document_files SET file_hash = ?, file_size = ?, file_mtime_ns = ?, "
+            "last_indexed = CURRENT_TIMESTAMP WHERE id = ?",
+            (prepared.file_hash, prepared.file_size, prepared.file_mtime_ns, prepared.existing_id),
+        )
+        file_id = prepared.existing_id
+    else:
+        cursor = conn.execute(
+            "INSERT INTO document_files (collection_id, file_path, file_hash, file_size, file_mtime_ns) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (collection_id, str(prepared.path), prepared.file_hash, prepared.file_size, prepared.file_mtime_ns),
+        )
+        file_id = cursor.lastrowid
+
+    stored: list[tuple[bytes | None, float | None, float | None]] = []
+    for blob in embeddings:
+        if blob is None:
+            stored.append((None, None, None))
+            continue
+        data, scale = _quantize_embedding(_deserialize_embedding(blob))
+        stored.append((data, scale, math.hypot(*_decode_embedding(data, scale))))
+
+    conn.executemany(
+        "INSERT INTO document_chunks "
+        "(file_id, chunk_index, content, embedding, embedding_scale, embedding_norm) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (file_id, idx, chunk_text, *stored[idx])
+            for idx, chunk_text in enumerate(prepared.chunks)
+        ],
+    )
 
 
 def index_file(
@@ -327,59 +655,120 @@ def index_file(
         Number of chunks created (0 if skipped)
     """
     file_path = Path(file_path).resolve()
-    current_hash = _file_hash(file_path)
-
-    # Check if already indexed with same hash
-    cursor = conn.execute(
-        "SELECT id, file_hash FROM document_files WHERE file_path = ?",
-        (str(file_path),),
-    )
-    existing = cursor.fetchone()
+    prepared = _prepare_file(conn, file_path, chunk_size, overlap_pct, text_override)
+    if prepared is None:
+        return 0
+
+    chunks = prepared.chunks
+    embeddings: list[bytes | None] = [None] * len(chunks)
+    if generate_embeddings and chunks:
+        try:
+            embeddings = _embed_chunks(conn, chunks)
+        except Exception:
+            pass  # Skip embeddings on failure
+
+    _persist_file(conn, collection_id, prepared, embeddings)
+    return len(chunks)
 
-    if existing and existing["file_hash"] == current_hash:
-        return 0  # Unchanged, skip
 
-    # Remove old chunks if re-indexing
-    if existing:
-        conn.execute(
-            "DELETE FROM document_chunks WHERE file_id = ?",
-            (existing["id"],),
-        )
-        conn.execute(
-            "UPDATE document_files SET file_hash = ?, last_indexed = CURRENT_TIMESTAMP "
-            "WHERE id = ?",
-            (current_hash, existing["id"]),
-        )
-        file_id = existing["id"]
-    else:
-        cursor = conn.execute(
-            "INSERT INTO document_files (collection_id, file_path, file_hash) VALUES (?, ?, ?)",
-            (collection_id, str(file_path), current_hash),
-        )
-        file_id = cursor.lastrowid
+def _index_files_concurrently(
+    conn: sqlite3.Connection,
+    collection_id: int,
+    file_paths: Iterable[Path],
+    chunk_size: int = 800,
+    overlap_pct: float = 0.1,
+    generate_embeddings: bool = True,
+) -> Iterator[int]:
+    """Index files like index_file(), overlapping their embedding requests.
 
-    # Read and chunk the file
-    text = text_override if text_override is not None else file_path.read_text(errors="replace")
-    chunks = chunk_markdown(text, chunk_size=chunk_size, overlap_pct=overlap_pct)
+    Hashing, chunking and every database access stay on the calling thread,
+    which owns the connection; only provider calls for chunks missing from
+    embedding_cache run on worker threads. Files are written in input order.
 
-    for idx, chunk_text in enumerate(chunks):
-        embedding_bytes = None
-        if generate_embeddings:
+    Yields:
+        Number of chunks created for each file (0 if skipped)
+    """
+    # Local models are CPU-bound and not helped by threads
+    workers = 1 if get_config().embedding.provider == "local" else INDEX_EMBED_WORKERS
+    pending: deque[tuple[_PreparedFile, _EmbeddingLookup | None, Future | None]] = deque()
+
+    def finish() -> int:
+        prepared, lookup, future = pending.popleft()
+        embeddings: list[bytes | None] = [None] * len(prepared.chunks)
+        if lookup is not None:
             try:
-                from radar.semantic import _serialize_embedding, get_embedding
-
-                embedding = get_embedding(chunk_text)
-                embedding_bytes = _serialize_embedding(embedding)
+                fresh = future.result() if future is not None else []
+                embeddings = _complete_embeddings(conn, lookup, fresh)
             except Exception:
-                pass  # Skip embedding on failure
+                pass  # Skip embeddings on failure
+        _persist_file(conn, collection_id, prepared, embeddings)
+        return len(prepared.chunks)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for file_path in file_paths:
+            prepared = _prepare_file(conn, file_path, chunk_size, overlap_pct)
+            if prepared is None:
+                yield 0
+                continue
+
+            lookup = future = None
+            if generate_embeddings and prepared.chunks:
+                try:
+                    lookup = _lookup_chunk_embeddings(conn, prepared.chunks)
+                    if lookup.missing:
+                        future = pool.submit(
+                            _fetch_embeddings,
+                            [prepared.chunks[idx] for idx in lookup.missing],
+                        )
+                except Exception:
+                    lookup = future = None
+            pending.append((prepared, lookup, future))
+
+            # Keep a bounded window of files in flight
+            while len(pending) >= workers * 2:
+                yield finish()
+
+        while pending:
+            yield finish()
+
+
+def _apply_bulk_pragmas(conn: sqlite3.Connection) -> None:
+    """Tune a connection for bulk indexing.
+
+    Only per-connection settings are changed, and bulk connections are closed
+    when indexing ends, so nothing needs restoring. Journal and sync modes are
+    left alone: memory.db also holds memories, feedback and tasks, which must
+    survive a crash mid-index.
+    """
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -65536")  # 64 MiB page cache
 
-        conn.execute(
-            "INSERT INTO document_chunks (file_id, chunk_index, content, embedding) "
-            "VALUES (?, ?, ?, ?)",
-            (file_id, idx, chunk_text, embedding_bytes),
-        )
 
-    return len(chunks)
+def _begin_bulk(conn: sqlite3.Connection, rebuild_fts: bool = False) -> None:
+    """Open an explicit write transaction for bulk indexing.
+
+    With ``rebuild_fts`` (first-time indexing of a collection), the per-row
+    FTS triggers are dropped and the whole run stays in one transaction;
+    _end_bulk() restores them and rebuilds the FTS index once. A failed run
+    rolls back with the triggers intact.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    if rebuild_fts:
+        disable_fts_triggers(conn)
+
+
+def _commit_bulk_batch(conn: sqlite3.Connection, files_done: int, rebuild_fts: bool = False) -> None:
+    """Commit every INDEX_COMMIT_BATCH files so interrupted runs keep progress."""
+    if not rebuild_fts and files_done % INDEX_COMMIT_BATCH == 0:
+        conn.commit()
+        _begin_bulk(conn)
+
+
+def _end_bulk(conn: sqlite3.Connection, rebuild_fts: bool = False) -> None:
+    """Restore FTS triggers and rebuild the index after a trigger-less run."""
+    if rebuild_fts:
+        enable_fts_triggers(conn)
+        rebuild_fts_index(conn)
 
 
 def index_collection(name: str) -> dict[str, int]:
@@ -402,6 +791,7 @@ def index_collection(name: str) -> dict[str, int]:
     patterns = [p.strip() for p in collection["patterns"].split(",")]
 
     conn = _get_connection()
+    _apply_bulk_pragmas(conn)
     try:
         files_indexed = 0
         files_skipped = 0
@@ -414,24 +804,32 @@ def index_collection(name: str) -> dict[str, int]:
                 if file_path.is_file():
                     matched_files.add(file_path.resolve())
 
-        # Index each file
-        for file_path in sorted(matched_files):
-            chunks = index_file(
-                conn,
-                collection["id"],
-                file_path,
-                chunk_size=docs_config.chunk_size,
-                overlap_pct=docs_config.chunk_overlap_pct,
-                generate_embeddings=docs_config.generate_embeddings,
-            )
+        # Index each file, one transaction per batch of files. The first
+        # index of a collection skips per-row FTS triggers and rebuilds once.
+        rebuild_fts = collection["last_indexed"] is None
+        _begin_bulk(conn, rebuild_fts)
+        file_results = _index_files_concurrently(
+            conn,
+            collection["id"],
+            sorted(matched_files),
+            chunk_size=docs_config.chunk_size,
+            overlap_pct=docs_config.chunk_overlap_pct,
+            generate_embeddings=docs_config.generate_embeddings,
+        )
+        for files_done, chunks in enumerate(file_results, 1):
             if chunks > 0:
                 files_indexed += 1
                 chunks_created += chunks
             else:
                 files_skipped += 1
+            _commit_bulk_batch(conn, files_done, rebuild_fts)
 
         # Remove stale files
         files_removed = _remove_stale_files(conn, collection["id"], matched_files)
+        _end_bulk(conn, rebuild_fts)
+        if files_indexed or files_removed:
+            ann_index.build_index(conn, collection["id"])
+            clear_search_cache()
 
         # Update last_indexed timestamp
         conn.execute(
@@ -456,22 +854,20 @@ def _remove_stale_files(
     current_files: set[Path],
 ) -> int:
     """Remove indexed files that no longer exist on disk."""
-    cursor = conn.execute(
-        "SELECT id, file_path FROM document_files WHERE collection_id = ?",
+    # Diff in SQL against a temp table of the current paths
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS _current_paths (path TEXT PRIMARY KEY)")
+    conn.execute("DELETE FROM _current_paths")
+    conn.executemany(
+        "INSERT OR IGNORE INTO _current_paths (path) VALUES (?)",
+        [(str(path),) for path in current_files],
+    )
+    stale = "collection_id = ? AND file_path NOT IN (SELECT path FROM _current_paths)"
+    conn.execute(
+        f"DELETE FROM document_chunks WHERE file_id IN (SELECT id FROM document_files WHERE {stale})",
         (collection_id,),
     )
-    removed = 0
-    for row in cursor.fetchall():
-        if Path(row["file_path"]) not in current_files:
-            conn.execute(
-                "DELETE FROM document_chunks WHERE file_id = ?",
-                (row["id"],),
-            )
-            conn.execute(
-                "DELETE FROM document_files WHERE id = ?",
-                (row["id"],),
-            )
-            removed += 1
+    removed = conn.execute(f"DELETE FROM document_files WHERE {stale}", (collection_id,)).rowcount
+    conn.execute("DELETE FROM _current_paths")
     return removed
 
 
@@ -482,6 +878,7 @@ def search_fts(
     query: str,
     collection: str | None = None,
     limit: int = 10,
+    conn: sqlite3.Connection | None = None,
 ) -> list[dict[str, Any]]:
     """Search documents using FTS5 (BM25 ranking).
 
@@ -489,12 +886,12 @@ def search_fts(
         query: Search query
         collection: Optional collection name filter
         limit: Maximum results
+        conn: Optional open connection to reuse
 
     Returns:
         List of result dicts with content, rank, file_path, collection
     """
-    conn = _get_connection()
-    try:
+    with _use_connection(conn) as conn:
         collection_filter = "AND dcol.name = ?" if collection else ""
         params = (query, collection, limit) if collection else (query, limit)
         cursor = conn.execute(
@@ -526,14 +923,13 @@ def search_fts(
             }
             for row in cursor.fetchall()
         ]
-    finally:
-        conn.close()
 
 
 def search_semantic(
     query: str,
     collection: str | None = None,
     limit: int = 10,
+    conn: sqlite3.Connection | None = None,
 ) -> list[dict[str, Any]]:
     """Search documents using semantic similarity.
 
@@ -541,53 +937,88 @@ def search_semantic(
         query: Search query
         collection: Optional collection name filter
         limit: Maximum results
+        conn: Optional open connection to reuse
 
     Returns:
         List of result dicts with content, similarity, file_path, collection
     """
-    from radar.semantic import (
-        _deserialize_embedding,
-        cosine_similarity,
-        get_embedding,
-    )
+    from radar.semantic import _decode_embedding, get_embedding_cached, top_similar
 
-    query_embedding = get_embedding(query)
+    query_embedding = get_embedding_cached(query)
 
-    conn = _get_connection()
-    try:
-        collection_filter = "AND dcol.name = ?" if collection else ""
-        params = (collection,) if collection else ()
-        cursor = conn.execute(
-            f"""
-            SELECT dc.id AS chunk_id, dc.content, dc.embedding,
-                   df.file_path,
-                   dcol.name AS collection_name
-            FROM document_chunks dc
-            JOIN document_files df ON dc.file_id = df.id
-            JOIN document_collections dcol ON df.collection_id = dcol.id
-            WHERE dc.embedding IS NOT NULL
-            {collection_filter}
-            """,
-            params,
-        )
+    with _use_connection(conn) as conn:
+        if collection:
+            collection_ids = [
+                row["id"] for row in conn.execute(
+                    "SELECT id FROM document_collections WHERE name = ?", (collection,)
+                )
+            ]
+        else:
+            collection_ids = [
+                row["id"] for row in conn.execute("SELECT id FROM document_collections")
+            ]
+
+        # Large collections answer from their HNSW index (over-fetching, since
+        # it may name chunks deleted since the last build); the rest are scanned
+        candidates: list[tuple[float, int]] = []
+        scan_ids = []
+        for collection_id in collection_ids:
+            hits = ann_index.query_index(collection_id, query_embedding, limit * 2)
+            if hits is None:
+                scan_ids.append(collection_id)
+            else:
+                candidates.extend(hits)
+
+        if scan_ids:
+            # Stream only ids and embeddings; content is fetched for the winners
+            scan_placeholders = ",".join("?" * len(scan_ids))
+            cursor = conn.execute(
+                f"""
+                SELECT dc.id, dc.embedding, dc.embedding_scale, dc.embedding_norm
+                FROM document_chunks dc
+                JOIN document_files df ON dc.file_id = df.id
+                WHERE dc.embedding IS NOT NULL
+                AND df.collection_id IN ({scan_placeholders})
+                """,
+                scan_ids,
+            )
+            vectors = ((row[0], _decode_embedding(row[1], row[2]), row[3]) for row in cursor)
+            candidates.extend(top_similar(query_embedding, vectors, limit))
+
+        if not candidates:
+            return []
+        candidates.sort(key=lambda c: c[0], reverse=True)
+
+        placeholders = ",".join("?" * len(candidates))
+        details = {
+            row["chunk_id"]: row
+            for row in conn.execute(
+                f"""
+                SELECT dc.id AS chunk_id, dc.content,
+                       df.file_path,
+                       dcol.name AS collection_name
+                FROM document_chunks dc
+                JOIN document_files df ON dc.file_id = df.id
+                JOIN document_collections dcol ON df.collection_id = dcol.id
+                WHERE dc.id IN ({placeholders})
+                """,
+                [chunk_id for _, chunk_id in candidates],
+            )
+        }
 
-        results = []
-        for row in cursor.fetchall():
-            chunk_embedding = _deserialize_embedding(row["embedding"])
-            similarity = cosine_similarity(query_embedding, chunk_embedding)
-            results.append({
-                "content": row["content"],
-                "chunk_id": row["chunk_id"],
+        results = [
+            {
+                "content": details[chunk_id]["content"],
+                "chunk_id": chunk_id,
                 "similarity": similarity,
-                "file_path": row["file_path"],
-                "collection": row["collection_name"],
+                "file_path": details[chunk_id]["file_path"],
+                "collection": details[chunk_id]["collection_name"],
                 "search_type": "semantic",
-            })
-
-        results.sort(key=lambda x: x["similarity"], reverse=True)
+            }
+            for similarity, chunk_id in candidates
+            if chunk_id in details
+        ]
         return results[:limit]
-    finally:
-        conn.close()
 
 
 def search_hybrid(
@@ -609,45 +1040,91 @@ def search_hybrid(
     Returns:
         Merged and ranked results
     """
-    k = 60  # RRF constant
-
-    # Get FTS results
-    fts_results = search_fts(query, collection=collection, limit=limit * 2)
-
-    # Try semantic search
-    semantic_results = []
-    try:
-        from radar.semantic import is_embedding_available
-
-        if is_embedding_available():
-            semantic_results = search_semantic(
-                query, collection=collection, limit=limit * 2
-            )
-    except Exception:
-        pass
+    embedding_config = get_config().embedding
+    cache_key = (
+        get_data_paths().db_str,
+        embedding_config.provider,
+        embedding_config.model,
+        query,
+        collection,
+        limit,
+        fts_weight,
+        semantic_weight,
+    )
+    now = time.monotonic()
+    with _search_cache_lock:
+        cached = _search_cache.get(cache_key)
+        if cached is not None and now - cached[0] < _SEARCH_CACHE_TTL:
+            _search_cache.move_to_end(cache_key)
+            return [dict(result) for result in cached[1]]
+
+    merged, complete = _search_hybrid_uncached(
+        query, collection, limit, fts_weight, semantic_weight
+    )
+    if not complete:
+        # FTS-only fallback; rerun once embeddings are back
+        return merged
 
-    # Reciprocal Rank Fusion
-    scores: dict[int, dict[str, Any]] = {}
+    with _search_cache_lock:
+        _search_cache[cache_key] = (now, merged)
+        _search_cache.move_to_end(cache_key)
+        if len(_search_cache) > _SEARCH_CACHE_MAX:
+            _search_cache.popitem(last=False)
+    return [dict(result) for result in merged]
 
-    for rank, result in enumerate(fts_results):
-        chunk_id = result["chunk_id"]
-        rrf_score = fts_weight * (1.0 / (k + rank + 1))
-        if chunk_id in scores:
-            scores[chunk_id]["score"] += rrf_score
-        else:
-            scores[chunk_id] = {**result, "score": rrf_score, "search_type": "hybrid"}
 
-    for rank, result in enumerate(semantic_results):
-        chunk_id = result["chunk_id"]
-        rrf_score = semantic_weight * (1.0 / (k + rank + 1))
-        if chunk_id in scores:
-            scores[chunk_id]["score"] += rrf_score
-        else:
-            scores[chunk_id] = {**result, "score": rrf_score, "search_type": "hybrid"}
+def _search_hybrid_uncached(
+    query: str,
+    collection: str | None,
+    limit: int,
+    fts_weight: float,
+    semantic_weight: float,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Run search_hybrid's FTS and semantic searches and fuse the results.
+
+    Returns the fused results and whether they are complete, i.e. False if
+    semantic search was configured but failed.
+    """
+    k = 60  # RRF constant
 
-    # Sort by combined score
-    merged = sorted(scores.values(), key=lambda x: x["score"], reverse=True)
-    return merged[:limit]
+    with _use_connection() as conn:
+        # Get FTS results
+        fts_results = search_fts(query, collection=collection, limit=limit * 2, conn=conn)
+
+        # Try semantic search
+        semantic_results = []
+        complete = True
+        try:
+            from radar.semantic import is_embedding_available
+
+            if is_embedding_available():
+                semantic_results = search_semantic(
+                    query, collection=collection, limit=limit * 2, conn=conn
+                )
+        except Exception:
+            complete = False
+
+    # Reciprocal Rank Fusion: accumulate plain float scores per chunk and
+    # build result dicts only for the chunks that make the cut
+    scores: dict[int, float] = {}
+    first_seen: dict[int, dict[str, Any]] = {}
+
+    for results, weight in ((fts_results, fts_weight), (semantic_results, semantic_weight)):
+        for rank, result in enumerate(results):
+            chunk_id = result["chunk_id"]
+            rrf_score = weight * (1.0 / (k + rank + 1))
+            if chunk_id in scores:
+                scores[chunk_id] += rrf_score
+            else:
+                scores[chunk_id] = rrf_score
+                first_seen[chunk_id] = result
+
+    top = heapq.nlargest(limit, scores.items(), key=operator.itemgetter(1))
+    merged = [
+        {**first_seen[chunk_id], "score": score, "search_type": "hybrid"}
+        for chunk_id, score in top
+    ]
+    return merged, complete
 
 
 def ensure_summaries_collection() -> None:
@@ -1,8 +1,42 @@
 """Conversation export in JSON and Markdown formats."""
 
+import io
 import json
+from collections.abc import Callable, Iterator
+from typing import Any, TextIO
 
-from radar.memory import _get_conversation_path, get_messages, get_messages_for_display
+from radar.memory import (
+    _get_conversation_path,
+    iter_messages,
+    iter_messages_for_display,
+)
+
+
+def _import_orjson():
+    """Import orjson if the optional 'fast-json' extra is installed."""
+    try:
+        import orjson
+        return orjson
+    except ImportError:
+        return None
+
+
+_orjson = _import_orjson()
+
+
+def _dumps_indented(obj: Any) -> str:
+    """Serialize obj as JSON indented by two spaces.
+
+    Uses orjson when installed, falling back to the stdlib json module. The
+    output is equivalent JSON either way, but orjson writes non-ASCII text
+    as UTF-8 rather than \\u escapes.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits, which the stdlib handles
+    return json.dumps(obj, indent=2)
 
 
 def _require_conversation(conversation_id: str) -> None:
@@ -14,69 +48,128 @@ def _require_conversation(conversation_id: str) -> None:
 def export_json(conversation_id: str) -> str:
     """Export conversation as a JSON array string.
 
+    Raises ValueError if the conversation does not exist.
+    """
+    return "".join(iter_export_json(conversation_id))
+
+
+def iter_export_json(conversation_id: str) -> Iterator[str]:
+    """Export conversation as a JSON array, one message at a time.
+
+    Joined, the chunks equal the whole message list serialized with a
+    two-space indent, i.e. export_json(). The existence check runs immediately.
+
     Raises ValueError if the conversation does not exist.
     """
     _require_conversation(conversation_id)
+    return _json_chunks(conversation_id)
 
-    messages = get_messages(conversation_id)
-    # Strip internal 'id' field added by get_messages
-    cleaned = [{k: v for k, v in msg.items() if k != "id"} for msg in messages]
-    return json.dumps(cleaned, indent=2)
+
+def _json_chunks(conversation_id: str) -> Iterator[str]:
+    """Generate export_json() output in per-message chunks."""
+    yield "["
+    separator = "\n  "
+    for msg in iter_messages(conversation_id):
+        # Strip internal 'id' field added by iter_messages
+        msg.pop("id", None)
+        # Re-indent one level to sit inside the array; JSON escapes newlines
+        # within strings, so every raw newline here is structural
+        yield separator + _dumps_indented(msg).replace("\n", "\n  ")
+        separator = ",\n  "
+    yield "]" if separator == "\n  " else "\n]"
 
 
 def export_markdown(conversation_id: str) -> str:
     """Export conversation as a Markdown string.
 
+    Raises ValueError if the conversation does not exist.
+    """
+    return "".join(iter_export_markdown(conversation_id))
+
+
+def write_export_markdown(conversation_id: str, out: TextIO) -> None:
+    """Write the Markdown export of a conversation to a file-like object.
+
+    Raises ValueError if the conversation does not exist.
+    """
+    for chunk in iter_export_markdown(conversation_id):
+        out.write(chunk)
+
+
+def iter_export_markdown(conversation_id: str) -> Iterator[str]:
+    """Export conversation as Markdown, one message block at a time.
+
+    Joined, the chunks equal export_markdown(). The existence check runs
+    immediately, so ValueError is raised before any chunk is produced.
+
     Raises ValueError if the conversation does not exist.
     """
     _require_conversation(conversation_id)
+    return _markdown_chunks(conversation_id)
+
 
-    # Build a {line_id: timestamp} map from raw messages
-    raw_messages = get_messages(conversation_id)
-    timestamps = {msg["id"]: msg.get("timestamp", "") for msg in raw_messages}
-
-    # Use display messages for merged tool results
-    display_messages = get_messages_for_display(conversation_id)
-
-    lines = [f"# Conversation {conversation_id[:8]}"]
-
-    for msg in display_messages:
-        role = msg.get("role", "unknown")
-        heading = role.capitalize()
-        msg_id = msg.get("id")
-        timestamp = timestamps.get(msg_id, "")
-
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-        lines.append(f"## {heading}")
-
-        if timestamp:
-            display_ts = timestamp[:19].replace("T", " ")
-            lines.append(f"_{display_ts}_")
-
-        # Tool calls
-        if msg.get("tool_calls"):
-            for tc in msg["tool_calls"]:
-                name = tc.get("name", "unknown")
-                args = tc.get("args", {})
-                result = tc.get("result", "")
-
-                lines.append("")
-                lines.append(f"**Tool call: {name}**")
-                lines.append("```json")
-                lines.append(json.dumps(args, indent=2))
-                lines.append("```")
-
-                if result:
-                    # Indent each line of the result as a blockquote
-                    for result_line in result.split("\n"):
-                        lines.append(f"> {result_line}")
-
-        # Message content
-        content = msg.get("content", "")
-        if content:
-            lines.append("")
-            lines.append(content)
-
-    return "\n".join(lines) + "\n"
+def _markdown_chunks(conversation_id: str) -> Iterator[str]:
+    """Generate export_markdown() output in per-message chunks."""
+    yield f"# Conversation {conversation_id[:8]}\n"
+
+    # Display messages have tool results merged into their calls
+    args_json: dict[str, str] = {}
+    for msg in iter_messages_for_display(conversation_id):
+        buf = io.StringIO()
+        _write_markdown_message(buf.write, msg, args_json)
+        yield buf.getvalue()
+
+
+def _dump_args(args: Any, cache: dict[str, str]) -> str:
+    """Pretty-print tool-call arguments, reusing output for repeated arguments.
+
+    Indented serialization is the slow part, while repr() of JSON-decoded data
+    is cheap and distinguishes every value that would serialize differently,
+    so it is a safe key for the cache shared across one export.
+    """
+    key = repr(args)
+    dumped = cache.get(key)
+    if dumped is None:
+        dumped = cache[key] = _dumps_indented(args)
+    return dumped
+
+
+def _write_markdown_message(
+    w: Callable[[str], Any],
+    msg: dict[str, Any],
+    args_json: dict[str, str],
+) -> None:
+    """Write one display message as a Markdown block, every line newline-terminated.
+
+    args_json caches serialized tool-call arguments for the whole export.
+    """
+    role = msg.get("role", "unknown")
+    heading = role.capitalize()
+    timestamp = msg.get("timestamp", "")
+
+    w(f"\n---\n\n## {heading}\n")
+
+    if timestamp:
+        display_ts = timestamp[:19].replace("T", " ")
+        w(f"_{display_ts}_\n")
+
+    # Tool calls
+    if msg.get("tool_calls"):
+        for tc in msg["tool_calls"]:
+            name = tc.get("name", "unknown")
+            args = tc.get("args", {})
+            result = tc.get("result", "")
+
+            w(f"\n**Tool call: {name}**\n```json\n")
+            w(_dump_args(args, args_json))
+            w("\n```\n")
+
+            if result:
+                # Indent each line of the result as a blockquote
+                for result_line in result.split("\n"):
+                    w(f"> {result_line}\n")
+
+    # Message content
+    content = msg.get("content", "")
+    if content:
+        w(f"\n{content}\n")
@@ -1,11 +1,17 @@
 """Feedback and personality suggestion management."""
 
+import os
+import shutil
 import sqlite3
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from radar.semantic import _get_connection
+from radar.semantic import _get_shared_connection
+
+# Block size for the bounded reads of personality files in approve_suggestion
+_READ_CHUNK = 8192
 
 
 def _preserve_front_matter(original: str, new_body: str) -> str:
@@ -18,21 +24,91 @@ def _preserve_front_matter(original: str, new_body: str) -> str:
     Returns:
         new_body with original front matter prepended if needed.
     """
-    if not original.startswith("---"):
+    # Both checks are prefix compares; do them before scanning original.
+    # If new body already starts with front matter, leave it alone.
+    if not original.startswith("---") or new_body.startswith("---"):
         return new_body
 
+    # Same closing-marker rule as parse_personality(), so no scan limit
     end = original.find("---", 3)
     if end == -1:
         return new_body
 
     # Original has front matter
     front_matter_block = original[:end + 3]
+    return front_matter_block + "\n" + new_body
 
-    # If new body already starts with front matter, leave it alone
-    if new_body.startswith("---"):
-        return new_body
 
-    return front_matter_block + "\n" + new_body
+def _read_front_matter(path: Path) -> str:
+    """Read only the front matter block at the start of a personality file.
+
+    Returns the same prefix _preserve_front_matter() would keep (up to and
+    including the closing "---"), or "" if there is none. The file is read in
+    chunks, so the body is never loaded when the front matter closes early.
+    """
+    with open(path) as f:
+        head = f.read(3)
+        if head != "---":
+            return ""
+        search_from = 3
+        while True:
+            end = head.find("---", search_from)
+            if end != -1:
+                return head[:end + 3]
+            chunk = f.read(_READ_CHUNK)
+            if not chunk:
+                return ""
+            # A closing marker may straddle the previous chunk boundary
+            search_from = max(3, len(head) - 2)
+            head += chunk
+
+
+def _append_section(path: Path, content: str) -> None:
+    """Append content as a new paragraph, trimming trailing whitespace first.
+
+    Only the whitespace at the end of the file is read. Unlike rewriting
+    text.rstrip() + "\n\n" + content, this trims ASCII whitespace only, so a
+    trailing non-ASCII space such as U+00A0 is kept, and existing line
+    endings are left alone: in a file whose tail uses CRLF, the appended
+    paragraph uses CRLF too instead of the whole file being converted to LF.
+    """
+    newline = b"\n"
+    with open(path, "rb+") as f:
+        pos = f.seek(0, os.SEEK_END)
+        while pos > 0:
+            step = min(pos, _READ_CHUNK)
+            f.seek(pos - step)
+            block = f.read(step)
+            if b"\r\n" in block:
+                newline = b"\r\n"
+            stripped = block.rstrip()
+            if stripped:
+                pos = pos - step + len(stripped)
+                break
+            pos -= step
+        f.seek(pos)
+        f.truncate()
+        body = content.encode()
+        if newline != b"\n":
+            body = body.replace(b"\r\n", b"\n").replace(b"\n", newline)
+        f.write(newline * 2 + body + newline)
+
+
+def _replace_file(path: Path, text: str) -> None:
+    """Atomically replace a file's contents via a temp file and rename.
+
+    Symlinks are followed, so a linked personality file stays a link and its
+    target is replaced. The new file keeps the old one's permission bits.
+    """
+    target = path.resolve()
+    tmp_path = target.with_name(f".{target.name}.tmp")
+    tmp_path.write_text(text)
+    try:
+        shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def store_feedback(
@@ -57,8 +133,8 @@ def store_feedback(
     if sentiment not in ("positive", "negative"):
         raise ValueError("sentiment must be 'positive' or 'negative'")
 
-    conn = _get_connection()
-    try:
+    conn = _get_shared_connection()
+    with conn:
         cursor = conn.execute(
             """
             INSERT INTO feedback (conversation_id, message_index, sentiment, response_content, user_comment)
@@ -66,10 +142,44 @@ def store_feedback(
             """,
             (conversation_id, message_index, sentiment, response_content, user_comment),
         )
-        conn.commit()
-        return cursor.lastrowid
-    finally:
-        conn.close()
+    return cursor.lastrowid
+
+
+def store_feedback_many(records: Iterable[dict[str, Any]]) -> int:
+    """Store many feedback records in a single transaction.
+
+    Args:
+        records: Dicts with the keyword arguments of store_feedback()
+            (conversation_id, message_index, sentiment, and optionally
+            response_content and user_comment)
+
+    Returns:
+        Number of feedback records stored
+    """
+    rows = []
+    for record in records:
+        if record["sentiment"] not in ("positive", "negative"):
+            raise ValueError("sentiment must be 'positive' or 'negative'")
+        rows.append((
+            record["conversation_id"],
+            record["message_index"],
+            record["sentiment"],
+            record.get("response_content"),
+            record.get("user_comment"),
+        ))
+    if not rows:
+        return 0
+
+    conn = _get_shared_connection()
+    with conn:
+        conn.executemany(
+            """
+            INSERT INTO feedback (conversation_id, message_index, sentiment, response_content, user_comment)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+    return len(rows)
 
 
 def get_unprocessed_feedback(limit: int = 50) -> list[dict[str, Any]]:
@@ -81,22 +191,35 @@ def get_unprocessed_feedback(limit: int = 50) -> list[dict[str, Any]]:
     Returns:
         List of feedback records
     """
-    conn = _get_connection()
-    try:
-        cursor = conn.execute(
-            """
-            SELECT id, conversation_id, message_index, sentiment, response_content,
-                   user_comment, created_at
-            FROM feedback
-            WHERE processed = FALSE
-            ORDER BY created_at DESC
-            LIMIT ?
-            """,
-            (limit,),
-        )
-        return [dict(row) for row in cursor.fetchall()]
-    finally:
-        conn.close()
+    return list(iter_unprocessed_feedback(limit))
+
+
+def iter_unprocessed_feedback(limit: int = 50) -> Iterator[dict[str, Any]]:
+    """Iterate over feedback that hasn't been processed yet.
+
+    Rows are read from the cursor as they are consumed, on this thread's
+    shared connection, so the iterator must be consumed on the same thread.
+
+    Args:
+        limit: Maximum number of records to return
+
+    Yields:
+        Feedback records, one dict per row
+    """
+    conn = _get_shared_connection()
+    cursor = conn.execute(
+        """
+        SELECT id, conversation_id, message_index, sentiment, response_content,
+               user_comment, created_at
+        FROM feedback
+        WHERE processed = FALSE
+        ORDER BY created_at DESC
+        LIMIT ?
+        """,
+        (limit,),
+    )
+    for row in cursor:
+        yield dict(row)
 
 
 def get_all_feedback(limit: int = 100) -> list[dict[str, Any]]:
@@ -108,21 +231,31 @@ def get_all_feedback(limit: int = 100) -> list[dict[str, Any]]:
     Returns:
         List of feedback records
     """
-    conn = _get_connection()
-    try:
-        cursor = conn.execute(
-            """
-            SELECT id, conversation_id, message_index, sentiment, response_content,
-                   user_comment, created_at, processed
-            FROM feedback
-            ORDER BY created_at DESC
-            LIMIT ?
-            """,
-            (limit,),
-        )
-        return [dict(row) for row in cursor.fetchall()]
-    finally:
-        conn.close()
+    return list(iter_all_feedback(limit))
+
+
+def iter_all_feedback(limit: int = 100) -> Iterator[dict[str, Any]]:
+    """Iterate over all feedback records.
+
+    Args:
+        limit: Maximum number of records to return
+
+    Yields:
+        Feedback records, one dict per row
+    """
+    conn = _get_shared_connection()
+    cursor = conn.execute(
+        """
+        SELECT id, conversation_id, message_index, sentiment, response_content,
+               user_comment, created_at, processed
+        FROM feedback
+        ORDER BY created_at DESC
+        LIMIT ?
+        """,
+        (limit,),
+    )
+    for row in cursor:
+        yield dict(row)
 
 
 def mark_feedback_processed(feedback_ids: list[int]) -> int:
@@ -137,17 +270,14 @@ def mark_feedback_processed(feedback_ids: list[int]) -> int:
     if not feedback_ids:
         return 0
 
-    conn = _get_connection()
-    try:
+    conn = _get_shared_connection()
+    with conn:
         placeholders = ",".join("?" * len(feedback_ids))
         cursor = conn.execute(
             f"UPDATE feedback SET processed = TRUE WHERE id IN ({placeholders})",
             feedback_ids,
         )
-        conn.commit()
-        return cursor.rowcount
-    finally:
-        conn.close()
+    return cursor.rowcount
 
 
 def store_suggestion(
@@ -172,8 +302,8 @@ def store_suggestion(
     if suggestion_type not in ("add", "remove", "modify"):
         raise ValueError("suggestion_type must be 'add', 'remove', or 'modify'")
 
-    conn = _get_connection()
-    try:
+    conn = _get_shared_connection()
+    with conn:
         cursor = conn.execute(
             """
             INSERT INTO personality_suggestions
@@ -182,10 +312,45 @@ def store_suggestion(
             """,
             (personality_name, suggestion_type, content, reason, source),
         )
-        conn.commit()
-        return cursor.lastrowid
-    finally:
-        conn.close()
+    return cursor.lastrowid
+
+
+def store_suggestions_many(records: Iterable[dict[str, Any]]) -> int:
+    """Store many personality suggestions in a single transaction.
+
+    Args:
+        records: Dicts with the keyword arguments of store_suggestion()
+            (personality_name, suggestion_type, content, and optionally
+            reason and source)
+
+    Returns:
+        Number of suggestions stored
+    """
+    rows = []
+    for record in records:
+        if record["suggestion_type"] not in ("add", "remove", "modify"):
+            raise ValueError("suggestion_type must be 'add', 'remove', or 'modify'")
+        rows.append((
+            record["personality_name"],
+            record["suggestion_type"],
+            record["content"],
+            record.get("reason"),
+            record.get("source", "llm_tool"),
+        ))
+    if not rows:
+        return 0
+
+    conn = _get_shared_connection()
+    with conn:
+        conn.executemany(
+            """
+            INSERT INTO personality_suggestions
+            (personality_name, suggestion_type, content, reason, source)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+    return len(rows)
 
 
 def get_pending_suggestions() -> list[dict[str, Any]]:
@@ -194,19 +359,26 @@ def get_pending_suggestions() -> list[dict[str, Any]]:
     Returns:
         List of pending suggestion records
     """
-    conn = _get_connection()
-    try:
-        cursor = conn.execute(
-            """
-            SELECT id, personality_name, suggestion_type, content, reason, source, created_at
-            FROM personality_suggestions
-            WHERE status = 'pending'
-            ORDER BY created_at DESC
-            """
-        )
-        return [dict(row) for row in cursor.fetchall()]
-    finally:
-        conn.close()
+    return list(iter_pending_suggestions())
+
+
+def iter_pending_suggestions() -> Iterator[dict[str, Any]]:
+    """Iterate over all pending personality suggestions.
+
+    Yields:
+        Pending suggestion records, one dict per row
+    """
+    conn = _get_shared_connection()
+    cursor = conn.execute(
+        """
+        SELECT id, personality_name, suggestion_type, content, reason, source, created_at
+        FROM personality_suggestions
+        WHERE status = 'pending'
+        ORDER BY created_at DESC
+        """
+    )
+    for row in cursor:
+        yield dict(row)
 
 
 def get_suggestion(suggestion_id: int) -> dict[str, Any] | None:
@@ -218,21 +390,18 @@ def get_suggestion(suggestion_id: int) -> dict[str, Any] | None:
     Returns:
         Suggestion record or None if not found
     """
-    conn = _get_connection()
-    try:
-        cursor = conn.execute(
-            """
-            SELECT id, personality_name, suggestion_type, content, reason, source,
-                   status, created_at, applied_at
-            FROM personality_suggestions
-            WHERE id = ?
-            """,
-            (suggestion_id,),
-        )
-        row = cursor.fetchone()
-        return dict(row) if row else None
-    finally:
-        conn.close()
+    conn = _get_shared_connection()
+    cursor = conn.execute(
+        """
+        SELECT id, personality_name, suggestion_type, content, reason, source,
+               status, created_at, applied_at
+        FROM personality_suggestions
+        WHERE id = ?
+        """,
+        (suggestion_id,),
+    )
+    row = cursor.fetchone()
+    return dict(row) if row else None
 
 
 def approve_suggestion(suggestion_id: int) -> tuple[bool, str]:
@@ -267,28 +436,25 @@ def approve_suggestion(suggestion_id: int) -> tuple[bool, str]:
             personality_file.write_text(f"# {personality_name.title()}\n\n{content}\n")
         else:
             return False, f"Personality '{personality_name}' not found"
-    else:
-        # Read existing content
+    elif suggestion_type == "add":
+        # Append new content without reading the existing body
+        _append_section(personality_file, content)
+    elif suggestion_type == "remove":
+        # Remove the specified content
         existing_content = personality_file.read_text()
-
-        if suggestion_type == "add":
-            # Append new content
-            new_content = existing_content.rstrip() + "\n\n" + content + "\n"
-        elif suggestion_type == "remove":
-            # Remove the specified content
-            new_content = existing_content.replace(content, "")
-        elif suggestion_type == "modify":
-            # For modify, the content is the full replacement body.
-            # Preserve any existing front matter from the original file.
-            new_content = _preserve_front_matter(existing_content, content)
-        else:
-            return False, f"Unknown suggestion type: {suggestion_type}"
-
-        personality_file.write_text(new_content)
+        personality_file.write_text(existing_content.replace(content, ""))
+    elif suggestion_type == "modify":
+        # For modify, the content is the full replacement body.
+        # Preserve any existing front matter from the original file.
+        # A body with its own front matter replaces the old one, so skip the read
+        front_matter = "" if content.startswith("---") else _read_front_matter(personality_file)
+        _replace_file(personality_file, _preserve_front_matter(front_matter, content))
+    else:
+        return False, f"Unknown suggestion type: {suggestion_type}"
 
     # Update suggestion status
-    conn = _get_connection()
-    try:
+    conn = _get_shared_connection()
+    with conn:
         conn.execute(
             """
             UPDATE personality_suggestions
@@ -297,9 +463,6 @@ def approve_suggestion(suggestion_id: int) -> tuple[bool, str]:
             """,
             (suggestion_id,),
         )
-        conn.commit()
-    finally:
-        conn.close()
 
     return True, f"Applied {suggestion_type} to personality '{personality_name}'"
 
@@ -321,8 +484,8 @@ def reject_suggestion(suggestion_id: int, reason: str | None = None) -> tuple[bo
     if suggestion["status"] != "pending":
         return False, f"Suggestion is already {suggestion['status']}"
 
-    conn = _get_connection()
-    try:
+    conn = _get_shared_connection()
+    with conn:
         # Update status and optionally append reason
         if reason:
             new_reason = f"{suggestion.get('reason') or ''}\nRejected: {reason}".strip()
@@ -339,9 +502,6 @@ def reject_suggestion(suggestion_id: int, reason: str | None = None) -> tuple[bo
                 "UPDATE personality_suggestions SET status = 'rejected' WHERE id = ?",
                 (suggestion_id,),
             )
-        conn.commit()
-    finally:
-        conn.close()
 
     return True, "Suggestion rejected"
 
@@ -352,27 +512,21 @@ def get_feedback_summary() -> dict[str, Any]:
     Returns:
         Dictionary with feedback statistics
     """
-    conn = _get_connection()
-    try:
-        cursor = conn.execute(
-            """
-            SELECT
-                COUNT(*) as total,
-                SUM(CASE WHEN sentiment = 'positive' THEN 1 ELSE 0 END) as positive,
-                SUM(CASE WHEN sentiment = 'negative' THEN 1 ELSE 0 END) as negative,
-                SUM(CASE WHEN processed = FALSE THEN 1 ELSE 0 END) as unprocessed
-            FROM feedback
-            """
-        )
-        row = cursor.fetchone()
-        return {
-            "total": row["total"] or 0,
-            "positive": row["positive"] or 0,
-            "negative": row["negative"] or 0,
-            "unprocessed": row["unprocessed"] or 0,
-        }
-    finally:
-        conn.close()
+    conn = _get_shared_connection()
+    cursor = conn.execute(
+        """
+        SELECT sentiment, processed, COUNT(*) as count
+        FROM feedback
+        GROUP BY sentiment, processed
+        """
+    )
+    summary = {"total": 0, "positive": 0, "negative": 0, "unprocessed": 0}
+    for sentiment, processed, count in cursor:
+        summary["total"] += count
+        summary[sentiment] += count
+        if processed == 0:
+            summary["unprocessed"] += count
+    return summary
 
 
 def delete_feedback(feedback_id: int) -> bool:
@@ -384,10 +538,7 @@ def delete_feedback(feedback_id: int) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    conn = _get_connection()
-    try:
+    conn = _get_shared_connection()
+    with conn:
         cursor = conn.execute("DELETE FROM feedback WHERE id = ?", (feedback_id,))
-        conn.commit()
-        return cursor.rowcount > 0
-    finally:
-        conn.close()
+    return cursor.rowcount > 0
@@ -1,6 +1,9 @@
 """Hook system for intercepting tool execution and filtering tool lists."""
 
+import bisect
 import logging
+import threading
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable
@@ -23,7 +26,7 @@ class HookPoint(Enum):
     HEARTBEAT_COLLECT = "heartbeat_collect"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HookResult:
     """Result from a pre-tool hook."""
 
@@ -31,9 +34,17 @@ class HookResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HookRegistration:
-    """A registered hook callback."""
+    """A registered hook callback.
+
+    What the callback returns depends on the hook point. Pre-* hooks block by
+    returning a HookResult with blocked=True; filter_tools and
+    post_memory_search hooks return a replacement list; post_agent_run hooks
+    return a replacement string; heartbeat_collect hooks return a list of
+    event dicts or a single dict. Any other return value (including None) is
+    ignored, so a hook that only observes need not return anything.
+    """
 
     name: str
     hook_point: HookPoint
@@ -43,29 +54,76 @@ class HookRegistration:
     description: str = ""
 
 
-# Global registry: hook point -> sorted list of registrations
-_hooks: dict[HookPoint, list[HookRegistration]] = {
-    HookPoint.PRE_TOOL_CALL: [],
-    HookPoint.POST_TOOL_CALL: [],
-    HookPoint.FILTER_TOOLS: [],
-    HookPoint.PRE_AGENT_RUN: [],
-    HookPoint.POST_AGENT_RUN: [],
-    HookPoint.PRE_MEMORY_STORE: [],
-    HookPoint.POST_MEMORY_SEARCH: [],
-    HookPoint.PRE_HEARTBEAT: [],
-    HookPoint.POST_HEARTBEAT: [],
-    HookPoint.HEARTBEAT_COLLECT: [],
+# Global registry: hook point -> sorted list of registrations. Entries are
+# created on first registration, so points nobody hooks cost nothing
+_hooks: defaultdict[HookPoint, list[HookRegistration]] = defaultdict(list)
+
+# One bit per hook point, set in _populated while that point has hooks, so
+# the run_* functions can skip empty points with a single integer test
+_HOOK_BITS: dict[HookPoint, int] = {point: 1 << i for i, point in enumerate(HookPoint)}
+_PRE_TOOL_CALL_BIT = _HOOK_BITS[HookPoint.PRE_TOOL_CALL]
+_POST_TOOL_CALL_BIT = _HOOK_BITS[HookPoint.POST_TOOL_CALL]
+_FILTER_TOOLS_BIT = _HOOK_BITS[HookPoint.FILTER_TOOLS]
+_PRE_AGENT_RUN_BIT = _HOOK_BITS[HookPoint.PRE_AGENT_RUN]
+_POST_AGENT_RUN_BIT = _HOOK_BITS[HookPoint.POST_AGENT_RUN]
+_PRE_MEMORY_STORE_BIT = _HOOK_BITS[HookPoint.PRE_MEMORY_STORE]
+_POST_MEMORY_SEARCH_BIT = _HOOK_BITS[HookPoint.POST_MEMORY_SEARCH]
+_PRE_HEARTBEAT_BIT = _HOOK_BITS[HookPoint.PRE_HEARTBEAT]
+_POST_HEARTBEAT_BIT = _HOOK_BITS[HookPoint.POST_HEARTBEAT]
+_HEARTBEAT_COLLECT_BIT = _HOOK_BITS[HookPoint.HEARTBEAT_COLLECT]
+_populated = 0
+
+# Per hook point, parallel (callbacks, names) tuples in priority order. The
+# run_* loops iterate these rather than the registrations, touching only the
+# callbacks, and read a name only when a hook blocks or raises
+_dispatch: dict[HookPoint, tuple[tuple[Callable, ...], tuple[str, ...]]] = {
+    point: ((), ()) for point in HookPoint
 }
 
+# list_hooks() result, rebuilt on the first call after any registry change
+_list_cache: list[dict[str, Any]] | None = None
+
+# Serializes registry mutations. The run_* functions never take it: they
+# read the immutable _dispatch tuples, which mutations replace wholesale
+_lock = threading.RLock()
+
+
+def _invalidate() -> None:
+    """Drop the cached list_hooks() result after a registry change."""
+    global _list_cache
+    _list_cache = None
+
+
+def _sync_dispatch() -> None:
+    """Rebuild the dispatch tuples and populated bitmask from the registry.
+
+    Called with _lock held.
+    """
+    global _populated
+    populated = 0
+    for hook_point in HookPoint:
+        hooks_list = _hooks.get(hook_point, ())
+        _dispatch[hook_point] = (
+            tuple(h.callback for h in hooks_list),
+            tuple(h.name for h in hooks_list),
+        )
+        if hooks_list:
+            populated |= _HOOK_BITS[hook_point]
+    # Publish the mask in one assignment so readers never see it half-built
+    _populated = populated
+
 
 def register_hook(registration: HookRegistration) -> None:
     """Register a hook callback.
 
-    Hooks are kept sorted by priority (lower numbers run first).
+    Hooks are kept sorted by priority (lower numbers run first); hooks with
+    equal priority run in registration order.
     """
-    hooks_list = _hooks[registration.hook_point]
-    hooks_list.append(registration)
-    hooks_list.sort(key=lambda h: h.priority)
+    with _lock:
+        hooks_list = _hooks[registration.hook_point]
+        bisect.insort(hooks_list, registration, key=lambda h: h.priority)
+        _sync_dispatch()
+        _invalidate()
     logger.debug(
         "Registered hook '%s' at %s (priority %d, source=%s)",
         registration.name,
@@ -75,18 +133,42 @@ def register_hook(registration: HookRegistration) -> None:
     )
 
 
+def _remove_where(hooks_list: list[HookRegistration], attr: str, value: str) -> int:
+    """Remove registrations whose attr equals value, compacting in place.
+
+    Returns the number removed. Nothing is allocated when nothing matches.
+    """
+    write = 0
+    for h in hooks_list:
+        if getattr(h, attr) != value:
+            hooks_list[write] = h
+            write += 1
+    removed = len(hooks_list) - write
+    if removed:
+        del hooks_list[write:]
+    return removed
+
+
+def _drop_empty_points() -> None:
+    """Remove registry entries left empty by an unregister. Called with _lock held."""
+    for hook_point in [p for p, hooks_list in _hooks.items() if not hooks_list]:
+        del _hooks[hook_point]
+
+
 def unregister_hook(name: str) -> bool:
     """Unregister a hook by name.
 
     Returns True if a hook was removed.
     """
-    removed = False
-    for hook_point in _hooks:
-        before = len(_hooks[hook_point])
-        _hooks[hook_point] = [h for h in _hooks[hook_point] if h.name != name]
-        if len(_hooks[hook_point]) < before:
-            removed = True
-    return removed
+    removed = 0
+    with _lock:
+        for hooks_list in _hooks.values():
+            removed += _remove_where(hooks_list, "name", name)
+        if removed:
+            _drop_empty_points()
+            _sync_dispatch()
+            _invalidate()
+    return removed > 0
 
 
 def unregister_hooks_by_source(source: str) -> int:
@@ -95,32 +177,43 @@ def unregister_hooks_by_source(source: str) -> int:
     Returns count of hooks removed.
     """
     count = 0
-    for hook_point in _hooks:
-        before = len(_hooks[hook_point])
-        _hooks[hook_point] = [h for h in _hooks[hook_point] if h.source != source]
-        count += before - len(_hooks[hook_point])
+    with _lock:
+        for hooks_list in _hooks.values():
+            count += _remove_where(hooks_list, "source", source)
+        if count:
+            _drop_empty_points()
+            _sync_dispatch()
+            _invalidate()
     return count
 
 
 def clear_all_hooks() -> None:
     """Remove all registered hooks."""
-    for hook_point in _hooks:
-        _hooks[hook_point].clear()
+    with _lock:
+        _hooks.clear()
+        _sync_dispatch()
+        _invalidate()
 
 
 def list_hooks() -> list[dict[str, Any]]:
     """List all registered hooks for introspection."""
-    result = []
-    for hook_point, hooks_list in _hooks.items():
-        for h in hooks_list:
-            result.append({
-                "name": h.name,
-                "hook_point": hook_point.value,
-                "priority": h.priority,
-                "source": h.source,
-                "description": h.description,
-            })
-    return result
+    global _list_cache
+    cache = _list_cache
+    if cache is None:
+        with _lock:
+            cache = []
+            for hook_point in HookPoint:
+                for h in _hooks.get(hook_point, ()):
+                    cache.append({
+                        "name": h.name,
+                        "hook_point": hook_point.value,
+                        "priority": h.priority,
+                        "source": h.source,
+                        "description": h.description,
+                    })
+            _list_cache = cache
+    # Copy so callers can't mutate the cached entries
+    return [dict(entry) for entry in cache]
 
 
 def run_pre_tool_hooks(tool_name: str, arguments: dict[str, Any]) -> HookResult:
@@ -128,23 +221,23 @@ def run_pre_tool_hooks(tool_name: str, arguments: dict[str, Any]) -> HookResult:
 
     Returns a HookResult. If any hook blocks, short-circuits immediately.
     """
-    hooks_list = _hooks[HookPoint.PRE_TOOL_CALL]
-    if not hooks_list:
+    if not _populated & _PRE_TOOL_CALL_BIT:
         return HookResult()
+    callbacks, names = _dispatch[HookPoint.PRE_TOOL_CALL]
 
-    for hook in hooks_list:
+    for i, callback in enumerate(callbacks):
         try:
-            result = hook.callback(tool_name, arguments)
+            result = callback(tool_name, arguments)
             if isinstance(result, HookResult) and result.blocked:
                 logger.info(
                     "Hook '%s' blocked tool '%s': %s",
-                    hook.name, tool_name, result.message,
+                    names[i], tool_name, result.message,
                 )
                 return result
         except Exception:
             logger.warning(
                 "Hook '%s' raised an exception (skipping)",
-                hook.name,
+                names[i],
                 exc_info=True,
             )
 
@@ -158,17 +251,17 @@ def run_post_tool_hooks(
     success: bool,
 ) -> None:
     """Run all post-tool-call hooks (observe only, cannot block)."""
-    hooks_list = _hooks[HookPoint.POST_TOOL_CALL]
-    if not hooks_list:
+    if not _populated & _POST_TOOL_CALL_BIT:
         return
+    callbacks, names = _dispatch[HookPoint.POST_TOOL_CALL]
 
-    for hook in hooks_list:
+    for i, callback in enumerate(callbacks):
         try:
-            hook.callback(tool_name, arguments, result, success)
+            callback(tool_name, arguments, result, success)
         except Exception:
             logger.warning(
                 "Post-hook '%s' raised an exception (skipping)",
-                hook.name,
+                names[i],
                 exc_info=True,
             )
 
@@ -178,19 +271,19 @@ def run_filter_tools_hooks(tools: list[dict]) -> list[dict]:
 
     Each hook receives the tool list and returns a (possibly filtered) list.
     """
-    hooks_list = _hooks[HookPoint.FILTER_TOOLS]
-    if not hooks_list:
+    if not _populated & _FILTER_TOOLS_BIT:
         return tools
+    callbacks, names = _dispatch[HookPoint.FILTER_TOOLS]
 
-    for hook in hooks_list:
+    for i, callback in enumerate(callbacks):
         try:
-            filtered = hook.callback(tools)
+            filtered = callback(tools)
             if isinstance(filtered, list):
                 tools = filtered
         except Exception:
             logger.warning(
                 "Filter hook '%s' raised an exception (skipping)",
-                hook.name,
+                names[i],
                 exc_info=True,
             )
 
@@ -202,23 +295,23 @@ def run_pre_agent_hooks(user_message: str, conversation_id: str | None) -> HookR
 
     Returns a HookResult. If any hook blocks, short-circuits immediately.
     """
-    hooks_list = _hooks[HookPoint.PRE_AGENT_RUN]
-    if not hooks_list:
+    if not _populated & _PRE_AGENT_RUN_BIT:
         return HookResult()
+    callbacks, names = _dispatch[HookPoint.PRE_AGENT_RUN]
 
-    for hook in hooks_list:
+    for i, callback in enumerate(callbacks):
         try:
-            result = hook.callback(user_message, conversation_id)
+            result = callback(user_message, conversation_id)
             if isinstance(result, HookResult) and result.blocked:
                 logger.info(
                     "Hook '%s' blocked agent run: %s",
-                    hook.name, result.message,
+                    names[i], result.message,
                 )
                 return result
         except Exception:
             logger.warning(
                 "Hook '%s' raised an exception (skipping)",
-                hook.name,
+                names[i],
                 exc_info=True,
             )
 
@@ -231,19 +324,19 @@ def run_post_agent_hooks(
     conversation_id: str | None,
 ) -> str:
     """Run all post-agent hooks. Callbacks can return a modified response string."""
-    hooks_list = _hooks[HookPoint.POST_AGENT_RUN]
-    if not hooks_list:
+    if not _populated & _POST_AGENT_RUN_BIT:
         return response
+    callbacks, names = _dispatch[HookPoint.POST_AGENT_RUN]
 
-    for hook in hooks_list:
+    for i, callback in enumerate(callbacks):
         try:
-            result = hook.callback(user_message, response, conversation_id)
+            result = callback(user_message, response, conversation_id)
             if isinstance(result, str):
                 response = result
         except Exception:
             logger.warning(
                 "Post-agent hook '%s' raised an exception (skipping)",
-                hook.name,
+                names[i],
                 exc_info=True,
             )
 
@@ -255,23 +348,23 @@ def run_pre_memory_store_hooks(content: str, source: str | None) -> HookResult:
 
     Returns a HookResult. If any hook blocks, short-circuits immediately.
     """
-    hooks_list = _hooks[HookPoint.PRE_MEMORY_STORE]
-    if not hooks_list:
+    if not _populated & _PRE_MEMORY_STORE_BIT:
         return HookResult()
+    callbacks, names = _dispatch[HookPoint.PRE_MEMORY_STORE]
 
-    for hook in hooks_list:
+    for i, callback in enumerate(callbacks):
         try:
-            result = hook.callback(content, source)
+            result = callback(content, source)
             if isinstance(result, HookResult) and result.blocked:
                 logger.info(
                     "Hook '%s' blocked memory store: %s",
-                    hook.name, result.message,
+                    names[i], result.message,
                 )
                 return result
         except Exception:
             logger.warning(
                 "Hook '%s' raised an exception (skipping)",
-                hook.name,
+                names[i],
                 exc_info=True,
             )
 
@@ -280,19 +373,19 @@ def run_pre_memory_store_hooks(content: str, source: str | None) -> HookResult:
 
 def run_post_memory_search_hooks(query: str, results: list[dict]) -> list[dict]:
     """Run all post-memory-search hooks. Callbacks can filter/rerank results."""
-    hooks_list = _hooks[HookPoint.POST_MEMORY_SEARCH]
-    if not hooks_list:
+    if not _populated & _POST_MEMORY_SEARCH_BIT:
         return results
+    callbacks, names = _dispatch[HookPoint.POST_MEMORY_SEARCH]
 
-    for hook in hooks_list:
+    for i, callback in enumerate(callbacks):
         try:
-            filtered = hook.callback(query, results)
+            filtered = callback(query, results)
             if isinstance(filtered, list):
                 results = filtered
         except Exception:
             logger.warning(
                 "Post-memory hook '%s' raised an exception (skipping)",
-                hook.name,
+                names[i],
                 exc_info=True,
             )
 
@@ -304,23 +397,23 @@ def run_pre_heartbeat_hooks(event_count: int) -> HookResult:
 
     Returns a HookResult. If any hook blocks, short-circuits immediately.
     """
-    hooks_list = _hooks[HookPoint.PRE_HEARTBEAT]
-    if not hooks_list:
+    if not _populated & _PRE_HEARTBEAT_BIT:
         return HookResult()
+    callbacks, names = _dispatch[HookPoint.PRE_HEARTBEAT]
 
-    for hook in hooks_list:
+    for i, callback in enumerate(callbacks):
         try:
-            result = hook.callback(event_count)
+            result = callback(event_count)
             if isinstance(result, HookResult) and result.blocked:
                 logger.info(
                     "Hook '%s' blocked heartbeat: %s",
-                    hook.name, result.message,
+                    names[i], result.message,
                 )
                 return result
         except Exception:
             logger.warning(
                 "Hook '%s' raised an exception (skipping)",
-                hook.name,
+                names[i],
                 exc_info=True,
             )
 
@@ -333,17 +426,17 @@ def run_post_heartbeat_hooks(
     error: str | None,
 ) -> None:
     """Run all post-heartbeat hooks (observe only, cannot block)."""
-    hooks_list = _hooks[HookPoint.POST_HEARTBEAT]
-    if not hooks_list:
+    if not _populated & _POST_HEARTBEAT_BIT:
         return
+    callbacks, names = _dispatch[HookPoint.POST_HEARTBEAT]
 
-    for hook in hooks_list:
+    for i, callback in enumerate(callbacks):
         try:
-            hook.callback(event_count, success, error)
+            callback(event_count, success, error)
         except Exception:
             logger.warning(
                 "Post-heartbeat hook '%s' raised an exception (skipping)",
-                hook.name,
+                names[i],
                 exc_info=True,
             )
 
@@ -354,14 +447,14 @@ def run_heartbeat_collect_hooks() -> list[dict]:
     Each callback should return a list of event dicts (or a single dict).
     Results are merged into a flat list. Failing hooks are logged and skipped.
     """
-    hooks_list = _hooks[HookPoint.HEARTBEAT_COLLECT]
-    if not hooks_list:
+    if not _populated & _HEARTBEAT_COLLECT_BIT:
         return []
+    callbacks, names = _dispatch[HookPoint.HEARTBEAT_COLLECT]
 
     events: list[dict] = []
-    for hook in hooks_list:
+    for i, callback in enumerate(callbacks):
         try:
-            result = hook.callback()
+            result = callback()
             if isinstance(result, list):
                 events.extend(result)
             elif isinstance(result, dict):
@@ -369,7 +462,7 @@ def run_heartbeat_collect_hooks() -> list[dict]:
         except Exception:
             logger.warning(
                 "Heartbeat-collect hook '%s' raised an exception (skipping)",
-                hook.name,
+                names[i],
                 exc_info=True,
             )
 
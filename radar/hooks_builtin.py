@@ -3,45 +3,148 @@
 Reads hooks.rules from radar.yaml and registers hook callbacks.
 """
 
+import functools
+import hashlib
+import json
 import logging
+import os
 import re
-from datetime import datetime
+import sys
+import time
+from collections.abc import Callable, Mapping, Sequence
+from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from radar.hooks import HookPoint, HookRegistration, HookResult, register_hook
+from radar.hooks import (
+    HookPoint,
+    HookRegistration,
+    HookResult,
+    list_hooks,
+    register_hook,
+)
 
 logger = logging.getLogger("radar.hooks")
 
+# Shared non-blocking result; HookResult is frozen, so one instance serves
+# every callback's allow path
+_EMPTY_RESULT = HookResult()
 
-DEFAULT_SAFETY_RULES: list[dict] = [
-    {
+# Default for tools without a "function" entry; read-only so it can be shared
+# instead of building a fresh {} for every tool checked
+_NO_FUNCTION = MappingProxyType({})
+
+# Read-only so the shared defaults cannot be mutated by a caller
+DEFAULT_SAFETY_RULES: tuple[Mapping[str, Any], ...] = (
+    MappingProxyType({
         "name": "block_injection_phrases",
         "hook_point": "pre_agent_run",
         "type": "block_message_pattern",
-        "patterns": [
+        "patterns": (
             "ignore previous instructions",
             "ignore all previous",
             "disregard previous instructions",
             "override system prompt",
             "new system prompt",
-        ],
+        ),
         "message": "Message blocked: detected prompt injection attempt",
         "priority": 10,
-    },
-    {
+    }),
+    MappingProxyType({
         "name": "anti_memory_poisoning",
         "hook_point": "pre_memory_store",
         "type": "block_memory_pattern",
-        "patterns": [
+        "patterns": (
             "ignore previous instructions",
             "override system prompt",
             "you are now",
             "new instructions:",
-        ],
+        ),
         "message": "Memory blocked: contains instruction-like content",
         "priority": 10,
-    },
-]
+    }),
+)
+
+
+def _import_ahocorasick():
+    """Import pyahocorasick if the optional 'fast-match' extra is installed."""
+    try:
+        import ahocorasick
+        return ahocorasick
+    except ImportError:
+        return None
+
+
+def _substring_matcher(
+    patterns: list[str],
+    ignore_case: bool = False,
+) -> Callable[[str], bool]:
+    """Build a predicate reporting whether text contains any of the patterns.
+
+    With pyahocorasick installed the patterns are compiled once into an
+    Aho-Corasick automaton, so each check is a single scan of the text no
+    matter how many patterns there are (case-insensitive matching lowercases
+    the text first). Otherwise they are compiled into one escaped alternation
+    regex, searched in a single call with re.IGNORECASE when ignore_case is
+    set, so no lowercased copy of the text is made.
+
+    Matchers are cached by pattern set, so rules listing the same patterns
+    (in any order) share one compiled matcher.
+    """
+    key = tuple(sorted(set(patterns)))
+    return _compile_substring_matcher(key, ignore_case, _import_ahocorasick())
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_substring_matcher(
+    patterns: tuple[str, ...],
+    ignore_case: bool,
+    ahocorasick: Any,
+) -> Callable[[str], bool]:
+    """Compile a _substring_matcher() predicate; ahocorasick may be None."""
+    if "" in patterns:
+        # The empty string is a substring of everything
+        return lambda text: True
+    if not patterns:
+        return lambda text: False
+
+    if ahocorasick is None:
+        regex = re.compile(
+            "|".join(re.escape(p) for p in patterns),
+            re.IGNORECASE if ignore_case else 0,
+        )
+        return lambda text: regex.search(text) is not None
+
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        if ignore_case:
+            pattern = pattern.lower()
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+
+    def matches(text: str) -> bool:
+        for _ in automaton.iter(text.lower() if ignore_case else text):
+            return True
+        return False
+
+    return matches
+
+
+# Fingerprint of the rules last loaded and the registrations built from them
+_last_load: tuple[str, list[HookRegistration]] | None = None
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize read-only rule mappings as dicts and anything else as str."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+
+def _rules_fingerprint(rules: Sequence[Mapping[str, Any]]) -> str:
+    """Hash a rules list so reloads can tell whether it changed."""
+    encoded = json.dumps(rules, sort_keys=True, default=_json_default).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
 
 
 def load_config_hooks() -> int:
@@ -51,8 +154,12 @@ def load_config_hooks() -> int:
     rules are applied automatically (prompt injection blocking, memory
     anti-poisoning).
 
+    Calling it again with unchanged rules reuses the previously built hooks
+    and does not register duplicates of ones still registered.
+
     Returns count of hooks registered.
     """
+    global _last_load
     try:
         from radar.config import get_config
         config = get_config()
@@ -66,25 +173,55 @@ def load_config_hooks() -> int:
     if not rules:
         rules = DEFAULT_SAFETY_RULES
 
-    count = 0
-    for rule in rules:
-        try:
-            registration = _build_hook(rule)
-            if registration:
-                register_hook(registration)
-                count += 1
-        except Exception:
-            logger.warning(
-                "Failed to build hook from rule: %s",
-                rule.get("name", "(unnamed)"),
-                exc_info=True,
-            )
+    fingerprint = _rules_fingerprint(rules)
+    if _last_load is not None and _last_load[0] == fingerprint:
+        # Unchanged rules: reuse the built callbacks and compiled matchers,
+        # skipping any registration still in place from the previous load
+        registrations = _last_load[1]
+        present = {
+            (h["name"], h["hook_point"], h["priority"], h["description"])
+            for h in list_hooks()
+            if h["source"] == "config"
+        }
+    else:
+        registrations = []
+        for rule in rules:
+            try:
+                registration = _build_hook(rule)
+                if registration:
+                    registrations.append(registration)
+            except Exception:
+                logger.warning(
+                    "Failed to build hook from rule: %s",
+                    rule.get("name", "(unnamed)"),
+                    exc_info=True,
+                )
+        _last_load = (fingerprint, registrations)
+        present = set()
+
+    for registration in registrations:
+        key = (
+            registration.name,
+            registration.hook_point.value,
+            registration.priority,
+            registration.description,
+        )
+        if key not in present:
+            register_hook(registration)
+    count = len(registrations)
 
     if count:
         logger.info("Loaded %d config hook(s)", count)
     return count
 
 
+# Accepts what HookPoint() does: a member's value or the member itself
+_HOOK_POINTS: dict[Any, HookPoint] = {
+    **{p.value: p for p in HookPoint},
+    **{p: p for p in HookPoint},
+}
+
+
 def _build_hook(rule: dict) -> HookRegistration | None:
     """Build a HookRegistration from a config rule dict."""
     name = rule.get("name", "unnamed")
@@ -92,9 +229,8 @@ def _build_hook(rule: dict) -> HookRegistration | None:
     rule_type = rule.get("type", "")
     priority = rule.get("priority", 50)
 
-    try:
-        hook_point = HookPoint(hook_point_str)
-    except ValueError:
+    hook_point = _HOOK_POINTS.get(hook_point_str)
+    if hook_point is None:
         logger.warning("Unknown hook_point '%s' in rule '%s'", hook_point_str, name)
         return None
 
@@ -113,7 +249,8 @@ def _build_hook(rule: dict) -> HookRegistration | None:
     )
 
 
-_CALLBACK_BUILDERS: dict[HookPoint, Any] = {}  # populated after definitions below
+# Rule makers by hook point, then rule type; populated after definitions below
+_CALLBACK_BUILDERS: dict[HookPoint, dict[str, Callable[[dict], Any]]] = {}
 
 
 def _build_callback(
@@ -122,79 +259,98 @@ def _build_callback(
     rule: dict,
 ) -> Any:
     """Build a callback function for a rule type."""
-    builder = _CALLBACK_BUILDERS.get(hook_point)
-    if builder is None:
+    maker = _CALLBACK_BUILDERS.get(hook_point, {}).get(rule_type)
+    if maker is None:
         return None
-    return builder(rule_type, rule)
+    return maker(rule)
 
 
-# --- Pre-tool callbacks ---
+def _tool_names(rule: dict, default: tuple[str, ...] = ()) -> frozenset[str]:
+    """Return a rule's tool names as a frozenset of interned strings."""
+    return frozenset(
+        sys.intern(t) if isinstance(t, str) else t
+        for t in rule.get("tools", default)
+    )
 
 
-def _build_pre_callback(rule_type: str, rule: dict) -> Any:
-    """Build a pre-tool-call callback."""
-    if rule_type == "block_command_pattern":
-        return _make_block_command_pattern(rule)
-    elif rule_type == "block_path_pattern":
-        return _make_block_path_pattern(rule)
-    elif rule_type == "block_tool":
-        return _make_block_tool(rule)
-    return None
+# --- Pre-tool callbacks ---
 
 
 def _make_block_command_pattern(rule: dict) -> Any:
     """Block exec commands matching substring patterns."""
     patterns = rule.get("patterns", [])
-    tools = set(rule.get("tools", ["exec"]))
-    message = rule.get("message", "Command blocked by hook")
+    if not patterns:
+        return lambda tool_name, arguments: _EMPTY_RESULT
+    matches = _substring_matcher(patterns)
+    watches = _tool_names(rule, ("exec",)).__contains__
+    blocked = HookResult(
+        blocked=True,
+        message=rule.get("message", "Command blocked by hook"),
+    )
 
     def callback(tool_name: str, arguments: dict) -> HookResult:
-        if tool_name not in tools:
-            return HookResult()
-        command = arguments.get("command", "")
-        for pattern in patterns:
-            if pattern in command:
-                return HookResult(blocked=True, message=message)
-        return HookResult()
+        if not watches(tool_name):
+            return _EMPTY_RESULT
+        if matches(arguments.get("command", "")):
+            return blocked
+        return _EMPTY_RESULT
 
     return callback
 
 
 def _make_block_path_pattern(rule: dict) -> Any:
     """Block file tools accessing paths under configured directories."""
-    from pathlib import Path
-
-    blocked_dirs = [Path(d).expanduser().resolve() for d in rule.get("paths", [])]
-    tools = set(rule.get("tools", ["read_file", "write_file"]))
-    message = rule.get("message", "Path blocked by hook")
+    # Resolved blocked dirs as normcased strings: a target is blocked if it
+    # equals one or starts with one plus a separator, which is one
+    # str.startswith call instead of walking target.parents per blocked dir
+    blocked_exact = frozenset(
+        os.path.normcase(str(Path(d).expanduser().resolve()))
+        for d in rule.get("paths", [])
+    )
+    if not blocked_exact:
+        return lambda tool_name, arguments: _EMPTY_RESULT
+    # rstrip keeps the filesystem root ("/") a single-separator prefix
+    blocked_prefixes = tuple(b.rstrip(os.sep) + os.sep for b in blocked_exact)
+    watches = _tool_names(rule, ("read_file", "write_file")).__contains__
+    blocked = HookResult(
+        blocked=True,
+        message=rule.get("message", "Path blocked by hook"),
+    )
 
     def callback(tool_name: str, arguments: dict) -> HookResult:
-        if tool_name not in tools:
-            return HookResult()
-        path_str = arguments.get("path", "") or arguments.get("file_path", "")
+        if not watches(tool_name):
+            return _EMPTY_RESULT
+        path_str = arguments.get("path") or arguments.get("file_path")
         if not path_str:
-            return HookResult()
+            return _EMPTY_RESULT
         try:
-            target = Path(path_str).expanduser().resolve()
-            for blocked in blocked_dirs:
-                if target == blocked or blocked in target.parents:
-                    return HookResult(blocked=True, message=message)
+            # Resolved on every call, never cached: a symlink swapped in after
+            # an earlier check must not inherit that check's result
+            target = os.path.normcase(str(Path(path_str).expanduser().resolve()))
+            if target in blocked_exact or target.startswith(blocked_prefixes):
+                return blocked
         except Exception:
             pass
-        return HookResult()
+        return _EMPTY_RESULT
 
     return callback
 
 
 def _make_block_tool(rule: dict) -> Any:
     """Block specific tools entirely."""
-    blocked_tools = set(rule.get("tools", []))
-    message = rule.get("message", "Tool blocked by hook")
+    blocked_tools = _tool_names(rule)
+    if not blocked_tools:
+        return lambda tool_name, arguments: _EMPTY_RESULT
+    is_blocked = blocked_tools.__contains__
+    blocked = HookResult(
+        blocked=True,
+        message=rule.get("message", "Tool blocked by hook"),
+    )
 
     def callback(tool_name: str, arguments: dict) -> HookResult:
-        if tool_name in blocked_tools:
-            return HookResult(blocked=True, message=message)
-        return HookResult()
+        if is_blocked(tool_name):
+            return blocked
+        return _EMPTY_RESULT
 
     return callback
 
@@ -202,15 +358,10 @@ def _make_block_tool(rule: dict) -> Any:
 # --- Post-tool callbacks ---
 
 
-def _build_post_callback(rule_type: str, rule: dict) -> Any:
-    """Build a post-tool-call callback."""
-    if rule_type == "log":
-        return _make_log_callback(rule)
-    return None
-
-
 def _make_log_callback(rule: dict) -> Any:
     """Log tool execution."""
+    from radar.logging import log
+
     log_level = rule.get("log_level", "info")
 
     def callback(
@@ -219,7 +370,6 @@ def _make_log_callback(rule: dict) -> Any:
         result: str,
         success: bool,
     ) -> None:
-        from radar.logging import log
         status = "success" if success else "failure"
         log(log_level, f"Hook log: {tool_name} ({status})", tool=tool_name)
 
@@ -229,39 +379,53 @@ def _make_log_callback(rule: dict) -> Any:
 # --- Filter callbacks ---
 
 
-def _build_filter_callback(rule_type: str, rule: dict) -> Any:
-    """Build a filter-tools callback."""
-    if rule_type == "time_restrict":
-        return _make_time_restrict(rule)
-    elif rule_type == "allowlist":
-        return _make_allowlist(rule)
-    elif rule_type == "denylist":
-        return _make_denylist(rule)
-    return None
+# (start, end) timestamps of the local hour last seen by _local_hour(), and
+# that hour; stored as one tuple so threads never see a torn update
+_hour_cache: tuple[float, float, int] = (0.0, 0.0, 0)
+
+
+def _local_hour() -> int:
+    """Return the current local hour, calling localtime() once per hour."""
+    global _hour_cache
+    now = time.time()
+    start, end, hour = _hour_cache
+    if not start <= now < end:
+        tm = time.localtime(now)
+        # DST shifts happen on the hour, so the hour holds until the next one
+        start = now - (tm.tm_min * 60 + tm.tm_sec + now % 1)
+        end = start + 3600
+        hour = tm.tm_hour
+        _hour_cache = (start, end, hour)
+    return hour
 
 
 def _make_time_restrict(rule: dict) -> Any:
     """Remove tools during a time window."""
     start_hour = rule.get("start_hour", 22)
     end_hour = rule.get("end_hour", 8)
-    restricted_tools = set(rule.get("tools", []))
+    restricted_tools = _tool_names(rule)
+
+    # Decide the window shape once rather than on every call
+    if start_hour > end_hour:
+        # Wraps midnight (e.g., 22:00-08:00)
+        def in_window(hour: int) -> bool:
+            return hour >= start_hour or hour < end_hour
+    else:
+        # Same-day window (e.g., 09:00-17:00)
+        def in_window(hour: int) -> bool:
+            return start_hour <= hour < end_hour
+
+    if not restricted_tools:
+        return lambda tools: tools
+    restricted = restricted_tools.__contains__
 
     def callback(tools: list[dict]) -> list[dict]:
-        hour = datetime.now().hour
-        # Check if current hour falls in restricted window
-        if start_hour > end_hour:
-            # Wraps midnight (e.g., 22:00-08:00)
-            in_window = hour >= start_hour or hour < end_hour
-        else:
-            # Same-day window (e.g., 09:00-17:00)
-            in_window = start_hour <= hour < end_hour
-
-        if not in_window:
+        if not in_window(_local_hour()):
             return tools
 
         return [
             t for t in tools
-            if t.get("function", {}).get("name") not in restricted_tools
+            if not restricted(t.get("function", _NO_FUNCTION).get("name"))
         ]
 
     return callback
@@ -269,12 +433,15 @@ def _make_time_restrict(rule: dict) -> Any:
 
 def _make_allowlist(rule: dict) -> Any:
     """Only keep tools in the allowlist."""
-    allowed = set(rule.get("tools", []))
+    allowed = _tool_names(rule)
+    if not allowed:
+        return lambda tools: []
+    is_allowed = allowed.__contains__
 
     def callback(tools: list[dict]) -> list[dict]:
         return [
             t for t in tools
-            if t.get("function", {}).get("name") in allowed
+            if is_allowed(t.get("function", _NO_FUNCTION).get("name"))
         ]
 
     return callback
@@ -282,12 +449,15 @@ def _make_allowlist(rule: dict) -> Any:
 
 def _make_denylist(rule: dict) -> Any:
     """Remove tools in the denylist."""
-    denied = set(rule.get("tools", []))
+    denied = _tool_names(rule)
+    if not denied:
+        return lambda tools: tools
+    is_denied = denied.__contains__
 
     def callback(tools: list[dict]) -> list[dict]:
         return [
             t for t in tools
-            if t.get("function", {}).get("name") not in denied
+            if not is_denied(t.get("function", _NO_FUNCTION).get("name"))
         ]
 
     return callback
@@ -296,24 +466,22 @@ def _make_denylist(rule: dict) -> Any:
 # --- Pre-agent callbacks ---
 
 
-def _build_pre_agent_callback(rule_type: str, rule: dict) -> Any:
-    """Build a pre-agent callback."""
-    if rule_type == "block_message_pattern":
-        return _make_block_message_pattern(rule)
-    return None
-
-
 def _make_block_message_pattern(rule: dict) -> Any:
     """Block messages matching substring patterns."""
     patterns = rule.get("patterns", [])
-    message = rule.get("message", "Message blocked by hook")
+    if not patterns:
+        return lambda user_message, conversation_id: _EMPTY_RESULT
+
+    matches = _substring_matcher(patterns, ignore_case=True)
+    blocked = HookResult(
+        blocked=True,
+        message=rule.get("message", "Message blocked by hook"),
+    )
 
     def callback(user_message: str, conversation_id: str | None) -> HookResult:
-        lower_msg = user_message.lower()
-        for pattern in patterns:
-            if pattern.lower() in lower_msg:
-                return HookResult(blocked=True, message=message)
-        return HookResult()
+        if matches(user_message):
+            return blocked
+        return _EMPTY_RESULT
 
     return callback
 
@@ -321,20 +489,61 @@ def _make_block_message_pattern(rule: dict) -> Any:
 # --- Post-agent callbacks ---
 
 
-def _build_post_agent_callback(rule_type: str, rule: dict) -> Any:
-    """Build a post-agent callback."""
-    if rule_type == "redact_response":
-        return _make_redact_response(rule)
-    elif rule_type == "log_agent":
-        return _make_log_agent(rule)
-    return None
+def _import_re2():
+    """Import google-re2 if the optional 'safe-regex' extra is installed."""
+    try:
+        import re2
+        return re2
+    except ImportError:
+        return None
+
+
+def _compile_redaction(source: str) -> Any:
+    """Compile a redaction regex, preferring re2's linear-time engine.
+
+    Responses are model output, so a backtracking pattern could stall every
+    agent run on a crafted reply; re2 never backtracks. Constructs re2 does
+    not support (backreferences, lookaround) fall back to re. Returns None
+    if re cannot compile the source either.
+    """
+    re2 = _import_re2()
+    if re2 is not None:
+        try:
+            return re2.compile(source)
+        except Exception:
+            pass
+    try:
+        return re.compile(source)
+    except re.error:
+        return None
 
 
 def _make_redact_response(rule: dict) -> Any:
     """Replace patterns in LLM responses."""
-    patterns = [re.compile(p) for p in rule.get("patterns", [])]
+    sources = rule.get("patterns", [])
+    for source in sources:
+        re.compile(source)  # Invalid patterns fail at build time
+    patterns = [_compile_redaction(p) for p in sources]
     replacement = rule.get("replacement", "[REDACTED]")
 
+    if not patterns:
+        return lambda user_message, response, conversation_id: response
+
+    if len(patterns) == 1:
+        sub = patterns[0].sub
+
+        def callback(
+            user_message: str,
+            response: str,
+            conversation_id: str | None,
+        ) -> str:
+            return sub(replacement, response)
+
+        return callback
+
+    # Each pattern runs over the previous one's output. A single alternation
+    # is not equivalent: where matches overlap it picks the leftmost one,
+    # which can leave part of a secret the later pattern would have caught
     def callback(
         user_message: str,
         response: str,
@@ -349,6 +558,8 @@ def _make_redact_response(rule: dict) -> Any:
 
 def _make_log_agent(rule: dict) -> Any:
     """Log agent interactions."""
+    from radar.logging import log
+
     log_level = rule.get("log_level", "info")
 
     def callback(
@@ -356,7 +567,6 @@ def _make_log_agent(rule: dict) -> Any:
         response: str,
         conversation_id: str | None,
     ) -> None:
-        from radar.logging import log
         log(log_level, f"Hook log: agent run (conversation={conversation_id})")
 
     return callback
@@ -365,24 +575,22 @@ def _make_log_agent(rule: dict) -> Any:
 # --- Pre-memory callbacks ---
 
 
-def _build_pre_memory_callback(rule_type: str, rule: dict) -> Any:
-    """Build a pre-memory-store callback."""
-    if rule_type == "block_memory_pattern":
-        return _make_block_memory_pattern(rule)
-    return None
-
-
 def _make_block_memory_pattern(rule: dict) -> Any:
     """Block storing memories matching patterns."""
     patterns = rule.get("patterns", [])
-    message = rule.get("message", "Memory storage blocked by hook")
+    if not patterns:
+        return lambda content, source: _EMPTY_RESULT
+
+    matches = _substring_matcher(patterns, ignore_case=True)
+    blocked = HookResult(
+        blocked=True,
+        message=rule.get("message", "Memory storage blocked by hook"),
+    )
 
     def callback(content: str, source: str | None) -> HookResult:
-        lower_content = content.lower()
-        for pattern in patterns:
-            if pattern.lower() in lower_content:
-                return HookResult(blocked=True, message=message)
-        return HookResult()
+        if matches(content):
+            return blocked
+        return _EMPTY_RESULT
 
     return callback
 
@@ -390,80 +598,66 @@ def _make_block_memory_pattern(rule: dict) -> Any:
 # --- Post-memory callbacks ---
 
 
-def _build_post_memory_callback(rule_type: str, rule: dict) -> Any:
-    """Build a post-memory-search callback."""
-    if rule_type == "filter_memory_pattern":
-        return _make_filter_memory_pattern(rule)
-    return None
-
-
 def _make_filter_memory_pattern(rule: dict) -> Any:
     """Remove search results matching patterns."""
     exclude_patterns = rule.get("exclude_patterns", [])
+    if not exclude_patterns:
+        return lambda query, results: results
+    excluded = _substring_matcher(exclude_patterns, ignore_case=True)
 
     def callback(query: str, results: list[dict]) -> list[dict]:
-        filtered = []
-        for result in results:
-            content = result.get("content", "").lower()
-            if not any(p.lower() in content for p in exclude_patterns):
-                filtered.append(result)
-        return filtered
+        return [r for r in results if not excluded(r.get("content", ""))]
 
     return callback
 
 
-# --- Pre-heartbeat callbacks ---
-
-
-def _build_pre_heartbeat_callback(rule_type: str, rule: dict) -> Any:
-    """Build a pre-heartbeat callback."""
-    # No config-driven pre-heartbeat rules yet; plugin hooks can fill this.
-    return None
-
-
 # --- Post-heartbeat callbacks ---
 
 
-def _build_post_heartbeat_callback(rule_type: str, rule: dict) -> Any:
-    """Build a post-heartbeat callback."""
-    if rule_type == "log_heartbeat":
-        return _make_log_heartbeat(rule)
-    return None
-
-
 def _make_log_heartbeat(rule: dict) -> Any:
     """Log heartbeat execution."""
+    from radar.logging import log
+
     log_level = rule.get("log_level", "info")
 
     def callback(event_count: int, success: bool, error: str | None) -> None:
-        from radar.logging import log
         status = "success" if success else f"failure: {error}"
         log(log_level, f"Hook log: heartbeat ({status}, {event_count} events)")
 
     return callback
 
 
-# --- Heartbeat-collect callbacks ---
-
-
-def _build_heartbeat_collect_callback(rule_type: str, rule: dict) -> Any:
-    """Build a heartbeat-collect callback.
-
-    No config-driven rules for this hook point; only plugin hooks contribute.
-    """
-    return None
-
-
-# Populate the dispatch dict now that all builder functions are defined.
+# Populate the dispatch dict now that all rule makers are defined.
+# PRE_HEARTBEAT and HEARTBEAT_COLLECT have no config-driven rules yet; only
+# plugin hooks contribute to them.
 _CALLBACK_BUILDERS.update({
-    HookPoint.PRE_TOOL_CALL: _build_pre_callback,
-    HookPoint.POST_TOOL_CALL: _build_post_callback,
-    HookPoint.FILTER_TOOLS: _build_filter_callback,
-    HookPoint.PRE_AGENT_RUN: _build_pre_agent_callback,
-    HookPoint.POST_AGENT_RUN: _build_post_agent_callback,
-    HookPoint.PRE_MEMORY_STORE: _build_pre_memory_callback,
-    HookPoint.POST_MEMORY_SEARCH: _build_post_memory_callback,
-    HookPoint.PRE_HEARTBEAT: _build_pre_heartbeat_callback,
-    HookPoint.POST_HEARTBEAT: _build_post_heartbeat_callback,
-    HookPoint.HEARTBEAT_COLLECT: _build_heartbeat_collect_callback,
+    HookPoint.PRE_TOOL_CALL: {
+        "block_command_pattern": _make_block_command_pattern,
+        "block_path_pattern": _make_block_path_pattern,
+        "block_tool": _make_block_tool,
+    },
+    HookPoint.POST_TOOL_CALL: {
+        "log": _make_log_callback,
+    },
+    HookPoint.FILTER_TOOLS: {
+        "time_restrict": _make_time_restrict,
+        "allowlist": _make_allowlist,
+        "denylist": _make_denylist,
+    },
+    HookPoint.PRE_AGENT_RUN: {
+        "block_message_pattern": _make_block_message_pattern,
+    },
+    HookPoint.POST_AGENT_RUN: {
+        "redact_response": _make_redact_response,
+        "log_agent": _make_log_agent,
+    },
+    HookPoint.PRE_MEMORY_STORE: {
+        "block_memory_pattern": _make_block_memory_pattern,
+    },
+    HookPoint.POST_MEMORY_SEARCH: {
+        "filter_memory_pattern": _make_filter_memory_pattern,
+    },
+    HookPoint.POST_HEARTBEAT: {
+        "log_heartbeat": _make_log_heartbeat,
+    },
 })
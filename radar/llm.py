@@ -1,26 +1,198 @@
 """LLM client with tool call support for Ollama and OpenAI-compatible APIs."""
 
+import atexit
 import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import httpx
 
 from radar.config import get_config
-from radar.retry import compute_delay, is_retryable_httpx_error, is_retryable_openai_error, log_retry
-from radar.tools import execute_tool, get_tools_schema
+from radar.llm_cache import cache_key, cache_stats, get_cached_reply, store_reply
+from radar.logging import increment_api_calls, log
+from radar.retry import (
+    compute_retry_delay,
+    is_retryable_httpx_error,
+    is_retryable_openai_error,
+    log_retry,
+)
+from radar.tools import CACHEABLE_TOOLS, PARALLEL_SAFE_TOOLS, execute_tool, get_tools_schema
+
+
+def _import_orjson():
+    """Import orjson if the optional 'fast-json' extra is installed."""
+    try:
+        import orjson
+        return orjson
+    except ImportError:
+        return None
+
+
+_orjson = _import_orjson()
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _dumpb(obj: Any) -> bytes:
+    """Serialize obj as compact JSON bytes, with orjson when installed."""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj)
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits, which the stdlib handles
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize obj as compact JSON text, with orjson when installed."""
+    return _dumpb(obj).decode()
+
+
+def _loads(text: str | bytes) -> Any:
+    """Parse JSON text, with orjson when installed.
+
+    Raises json.JSONDecodeError on invalid input either way.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(text)
+        except _orjson.JSONDecodeError:
+            pass  # Let the stdlib decide (wide integers) or raise its own error
+    return json.loads(text)
+
+
+def _chat_body(payload: dict, tools_json: bytes | None = None) -> bytes:
+    """Encode an Ollama chat payload as a JSON request body.
+
+    tools_json is the tools list, encoded once per chat() call; it is
+    spliced in as the last member rather than re-serialized on every
+    tool-loop iteration.
+    """
+    body = _dumpb(payload)
+    if tools_json is None:
+        return body
+    return body[:-1] + b',"tools":' + tools_json + b"}"
+
+
+def _iter_ndjson(response: httpx.Response):
+    """Yield each object of a newline-delimited JSON stream.
+
+    Lines are parsed straight from the received bytes, without decoding
+    them to str first.
+    """
+    pending = b""
+    for data in response.iter_bytes():
+        pending += data
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield _loads(line)
+    if pending.strip():
+        yield _loads(pending)
+
+
+def _stream_ollama_chat(client: httpx.Client, url: str, body: bytes) -> dict:
+    """POST a streaming Ollama chat request and assemble the reply.
+
+    Ollama sends one JSON object per line; content is accumulated as it
+    arrives and tool calls are collected from whichever chunks carry them.
+    Returns the same shape as a non-streaming reply ({"message": ...}).
+
+    Raises:
+        httpx.HTTPStatusError: For error status codes (body already read).
+        RuntimeError: If Ollama reports an error mid-stream.
+    """
+    role = "assistant"
+    content_parts = []
+    tool_calls = []
+    with client.stream("POST", url, content=body, headers=_JSON_HEADERS) as response:
+        if response.is_error:
+            response.read()
+            response.raise_for_status()
+        for chunk in _iter_ndjson(response):
+            if "error" in chunk:
+                raise RuntimeError(f"Ollama error: {chunk['error']}")
+            message = chunk.get("message") or {}
+            role = message.get("role") or role
+            if message.get("content"):
+                content_parts.append(message["content"])
+            if message.get("tool_calls"):
+                tool_calls.extend(message["tool_calls"])
+            if chunk.get("done"):
+                break
+
+    message = {"role": role, "content": "".join(content_parts)}
+    if tool_calls:
+        message["tool_calls"] = tool_calls
+    return {"message": message}
+
+
+# Shared client for Ollama requests, so tool-loop iterations and successive
+# chat() calls reuse keep-alive connections instead of reconnecting
+_http_client: httpx.Client | None = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """Get the shared Ollama HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    timeout=120,
+                    limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0),
+                )
+                atexit.register(_http_client.close)
+    return _http_client
+
+
+# OpenAI SDK clients by (base_url, api_key); each keeps its own connection pool
+_openai_clients: dict[tuple[str, str], Any] = {}
+_openai_clients_lock = threading.Lock()
+
+
+def _get_openai_client(base_url: str, api_key: str):
+    """Get the OpenAI SDK client for an endpoint and key, creating it on first use."""
+    key = (base_url, api_key)
+    client = _openai_clients.get(key)
+    if client is None:
+        from openai import OpenAI
+
+        with _openai_clients_lock:
+            client = _openai_clients.get(key)
+            if client is None:
+                client = OpenAI(base_url=base_url, api_key=api_key)
+                _openai_clients[key] = client
+                atexit.register(client.close)
+    return client
 
 
 def _log_api_call(provider: str, model: str) -> None:
     """Log an API call and increment counter."""
     try:
-        from radar.logging import log, increment_api_calls
         increment_api_calls()
-        log("debug", f"LLM API call", provider=provider, model=model)
+        log("debug", "LLM API call", provider=provider, model=model)
     except Exception:
         pass  # Don't fail on logging errors
 
 
+def _log_cache(hit: bool) -> None:
+    """Log an LLM reply cache lookup with the running hit/miss counts."""
+    try:
+        stats = cache_stats()
+        log(
+            "debug",
+            "LLM cache hit" if hit else "LLM cache miss",
+            hits=stats["hits"],
+            misses=stats["misses"],
+        )
+    except Exception:
+        pass
+
+
 def _is_rate_limit_error(status_code: int | None, error_text: str) -> bool:
     """Check if an error indicates rate limiting."""
     if status_code in (429, 503):
@@ -32,7 +204,6 @@ def _is_rate_limit_error(status_code: int | None, error_text: str) -> bool:
 def _log_fallback(primary: str, fallback: str, status_code: int | None, error_text: str) -> None:
     """Log a model fallback event."""
     try:
-        from radar.logging import log
         log(
             "warn",
             f"Rate limited on {primary} (HTTP {status_code}), falling back to {fallback}",
@@ -74,8 +245,26 @@ def chat(
     config = get_config()
     effective_provider = provider_override or config.llm.provider
 
+    key = None
+    if config.llm.cache_enabled:
+        tools = _request_tools(use_tools, tools_include, tools_exclude)
+        key = cache_key(
+            effective_provider,
+            base_url_override or config.llm.base_url,
+            model_override or config.llm.model,
+            messages,
+            tools,
+        )
+        cached = get_cached_reply(key)
+        _log_cache(cached is not None)
+        if cached:
+            return cached[-1], list(messages) + cached
+
+    # Filled in if a rate limit switched the turn to the fallback model
+    fallback_models: list[str] = []
+
     if effective_provider == "openai":
-        return _chat_openai(
+        final_message, all_messages = _chat_openai(
             messages, use_tools, config,
             model_override=model_override,
             fallback_model_override=fallback_model_override,
@@ -83,60 +272,189 @@ def chat(
             tools_exclude=tools_exclude,
             base_url_override=base_url_override,
             api_key_override=api_key_override,
+            on_fallback=fallback_models.append,
         )
     else:
-        return _chat_ollama(
+        final_message, all_messages = _chat_ollama(
             messages, use_tools, config,
             model_override=model_override,
             fallback_model_override=fallback_model_override,
             tools_include=tools_include,
             tools_exclude=tools_exclude,
             base_url_override=base_url_override,
+            on_fallback=fallback_models.append,
         )
 
+    # A fallback model's reply must not be replayed as the primary model's
+    if key is not None and not fallback_models:
+        new_messages = all_messages[len(messages):]
+        # Replaying a turn that ran tools would skip their side effects
+        if new_messages and not any(m.get("role") == "tool" for m in new_messages):
+            store_reply(key, new_messages, config.llm.cache_max_entries)
+
+    return final_message, all_messages
+
+
+def chat_many(
+    conversations: list[list[dict[str, Any]]],
+    use_tools: bool = False,
+    max_concurrency: int = 4,
+    **kwargs: Any,
+) -> list[tuple[dict[str, Any], list[dict[str, Any]]]]:
+    """Run chat() for several independent conversations concurrently.
+
+    Args:
+        conversations: One message list per conversation
+        use_tools: Whether to include tools and handle tool calls
+        max_concurrency: Maximum requests in flight at once
+        **kwargs: Further chat() arguments, applied to every conversation
+
+    Returns:
+        One (final assistant message, full message history) tuple per
+        conversation, in input order. If any conversation fails, the first
+        error in input order is raised once all have finished.
+    """
+    if len(conversations) <= 1 or max_concurrency <= 1:
+        return [chat(messages, use_tools=use_tools, **kwargs) for messages in conversations]
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_concurrency, len(conversations)),
+        thread_name_prefix="radar-chat",
+    ) as pool:
+        futures = [
+            pool.submit(chat, messages, use_tools=use_tools, **kwargs)
+            for messages in conversations
+        ]
+    return [future.result() for future in futures]
+
+
+def _execute_tool_cached(
+    name: str,
+    arguments: dict[str, Any],
+    results: dict[tuple[str, str], tuple[float, str]],
+) -> str:
+    """Execute a tool, reusing an identical earlier call's result if fresh.
+
+    Only tools listed in CACHEABLE_TOOLS are reused, and ``results`` lives
+    for a single chat() turn, so state-changing tools always run. Error
+    results are not kept, letting a repeated call retry.
+    """
+    ttl = CACHEABLE_TOOLS.get(name)
+    if ttl is None:
+        return execute_tool(name, arguments)
+    try:
+        key = (name, json.dumps(arguments, sort_keys=True))
+    except (TypeError, ValueError):
+        return execute_tool(name, arguments)
+
+    now = time.monotonic()
+    cached = results.get(key)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    result = execute_tool(name, arguments)
+    if not result.startswith("Error"):
+        results[key] = (now, result)
+    return result
+
+
+# Worker threads for running read-only tool calls concurrently; threads are
+# only started when a turn first runs calls in parallel
+_tool_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="radar-tool")
+
+
+def _run_tool_calls(
+    calls: list[tuple[str, dict[str, Any]]],
+    results: dict[tuple[str, str], tuple[float, str]],
+    parallel: bool,
+) -> list[str]:
+    """Run a turn's tool calls, returning their results in call order.
+
+    When ``parallel`` is set and every call is to a tool in
+    PARALLEL_SAFE_TOOLS, the calls run concurrently; any batch that could
+    change state runs one call at a time, in order.
+    """
+    if parallel and len(calls) > 1 and all(name in PARALLEL_SAFE_TOOLS for name, _ in calls):
+        futures = [
+            _tool_pool.submit(_execute_tool_cached, name, args, results)
+            for name, args in calls
+        ]
+        return [future.result() for future in futures]
+    return [_execute_tool_cached(name, args, results) for name, args in calls]
+
+
+def _request_tools(
+    use_tools: bool,
+    include: list[str] | None,
+    exclude: list[str] | None,
+) -> list[dict]:
+    """Get the tool schemas to send, sorted by name.
+
+    A stable order keeps the tools part of the request byte-identical from
+    call to call, so providers' prompt prefix caches can match it.
+    """
+    if not use_tools:
+        return []
+    tools = get_tools_schema(include=include, exclude=exclude)
+    return sorted(tools, key=lambda tool: tool["function"]["name"])
+
 
 def _chat_ollama(
     messages, use_tools, config, *,
     model_override=None, fallback_model_override=None,
     tools_include=None, tools_exclude=None,
-    base_url_override=None,
+    base_url_override=None, on_fallback=None,
 ):
-    """Chat using Ollama's native API."""
+    """Chat using Ollama's native API.
+
+    on_fallback, if given, is called with the fallback model's name when a
+    rate limit makes the loop switch to it.
+    """
     effective_base_url = base_url_override or config.llm.base_url
     url = f"{effective_base_url.rstrip('/')}/api/chat"
 
-    tools = get_tools_schema(include=tools_include, exclude=tools_exclude) if use_tools else []
+    tools = _request_tools(use_tools, tools_include, tools_exclude)
     all_messages = list(messages)
+    tool_results: dict[tuple[str, str], tuple[float, str]] = {}
     iterations = 0
     active_model = model_override or config.llm.model
     effective_fallback = fallback_model_override or config.llm.fallback_model
     fell_back = False
     retry_cfg = config.retry
     max_retries = (retry_cfg.max_retries if retry_cfg.llm_retries else 0)
-
-    while iterations < config.max_tool_iterations:
+    stream = config.llm.stream
+    parallel_tools = config.llm.parallel_tool_calls
+    max_iterations = config.max_tool_iterations
+    client = _get_http_client()
+    # The tools never change within a call, so encode them just once
+    tools_json = _dumpb(tools) if tools else None
+
+    while iterations < max_iterations:
         iterations += 1
 
-        payload = {
-            "model": active_model,
-            "messages": all_messages,
-            "stream": False,
-        }
-        if tools:
-            payload["tools"] = tools
+        body = _chat_body(
+            {"model": active_model, "messages": all_messages, "stream": stream},
+            tools_json,
+        )
 
         last_error = None
         for attempt in range(max_retries + 1):
             try:
                 _log_api_call("ollama", active_model)
-                response = httpx.post(url, json=payload, timeout=120)
-                response.raise_for_status()
+                if stream:
+                    data = _stream_ollama_chat(client, url, body)
+                else:
+                    response = client.post(url, content=body, headers=_JSON_HEADERS)
+                    response.raise_for_status()
+                    # Parse the raw bytes: response.json() would also decode
+                    # and keep a str copy of the whole body
+                    data = _loads(response.content)
                 last_error = None
                 break  # success
             except (httpx.TimeoutException, httpx.ConnectError, httpx.HTTPStatusError) as e:
                 last_error = e
                 if attempt < max_retries and is_retryable_httpx_error(e):
-                    delay = compute_delay(
+                    delay = compute_retry_delay(
+                        e,
                         attempt,
                         retry_cfg.base_delay,
                         retry_cfg.max_delay,
@@ -158,6 +476,8 @@ def _chat_ollama(
                     _log_fallback(active_model, effective_fallback, status_code, error_text)
                     active_model = effective_fallback
                     fell_back = True
+                    if on_fallback is not None:
+                        on_fallback(active_model)
                     iterations -= 1  # Don't count failed attempt
                     continue
                 raise RuntimeError(f"Ollama error: {status_code} - {error_text}")
@@ -166,7 +486,6 @@ def _chat_ollama(
             elif isinstance(last_error, httpx.ConnectError):
                 raise RuntimeError(f"Cannot connect to Ollama at {effective_base_url}")
 
-        data = response.json()
         assistant_message = data.get("message", {})
         all_messages.append(assistant_message)
 
@@ -177,6 +496,7 @@ def _chat_ollama(
             return assistant_message, all_messages
 
         # Execute each tool call and add results
+        calls = []
         for tool_call in tool_calls:
             func = tool_call.get("function", {})
             tool_name = func.get("name", "")
@@ -185,12 +505,12 @@ def _chat_ollama(
             # Arguments might be a string that needs parsing
             if isinstance(tool_args, str):
                 try:
-                    tool_args = json.loads(tool_args)
+                    tool_args = _loads(tool_args)
                 except json.JSONDecodeError:
                     tool_args = {}
+            calls.append((tool_name, tool_args))
 
-            result = execute_tool(tool_name, tool_args)
-
+        for result in _run_tool_calls(calls, tool_results, parallel_tools):
             # Add tool result as a message
             tool_message = {
                 "role": "tool",
@@ -211,29 +531,38 @@ def _chat_openai(
     messages, use_tools, config, *,
     model_override=None, fallback_model_override=None,
     tools_include=None, tools_exclude=None,
-    base_url_override=None, api_key_override=None,
+    base_url_override=None, api_key_override=None, on_fallback=None,
 ):
-    """Chat using OpenAI-compatible API."""
-    from openai import OpenAI
+    """Chat using OpenAI-compatible API.
 
-    client = OpenAI(
-        base_url=base_url_override or config.llm.base_url,
-        api_key=api_key_override or config.llm.api_key or "not-needed",
+    on_fallback is called as in _chat_ollama().
+    """
+    client = _get_openai_client(
+        base_url_override or config.llm.base_url,
+        api_key_override or config.llm.api_key or "not-needed",
     )
 
-    tools = get_tools_schema(include=tools_include, exclude=tools_exclude) if use_tools else None
+    tools = _request_tools(use_tools, tools_include, tools_exclude) or None
     all_messages = _convert_messages_to_openai(messages)
+    if config.llm.prompt_cache_hints:
+        all_messages = _mark_cacheable_prefix(all_messages)
+    # The same history in Ollama format, kept in step so returning it needs
+    # no conversion pass over (and JSON re-parse of) the whole conversation
+    ollama_history = list(messages)
+    tool_results: dict[tuple[str, str], tuple[float, str]] = {}
     iterations = 0
     active_model = model_override or config.llm.model
     effective_fallback = fallback_model_override or config.llm.fallback_model
     fell_back = False
     retry_cfg = config.retry
     max_retries = (retry_cfg.max_retries if retry_cfg.llm_retries else 0)
+    parallel_tools = config.llm.parallel_tool_calls
+    max_iterations = config.max_tool_iterations
 
     # Convert tools to OpenAI format
     openai_tools = _convert_tools_to_openai(tools) if tools else None
 
-    while iterations < config.max_tool_iterations:
+    while iterations < max_iterations:
         iterations += 1
 
         kwargs = {
@@ -253,7 +582,8 @@ def _chat_openai(
             except Exception as e:
                 last_error = e
                 if attempt < max_retries and is_retryable_openai_error(e):
-                    delay = compute_delay(
+                    delay = compute_retry_delay(
+                        e,
                         attempt,
                         retry_cfg.base_delay,
                         retry_cfg.max_delay,
@@ -274,75 +604,137 @@ def _chat_openai(
                 _log_fallback(active_model, effective_fallback, status_code, error_text)
                 active_model = effective_fallback
                 fell_back = True
+                if on_fallback is not None:
+                    on_fallback(active_model)
                 iterations -= 1
                 continue
             raise RuntimeError(f"OpenAI API error: {last_error}")
 
         assistant_message = response.choices[0].message
         all_messages.append(_openai_message_to_dict(assistant_message))
+        ollama_message = _convert_openai_to_ollama_format(assistant_message)
+        ollama_history.append(ollama_message)
 
         tool_calls = assistant_message.tool_calls
         if not tool_calls:
-            # No tool calls, convert back to Ollama format and return
-            final_ollama = _convert_openai_to_ollama_format(assistant_message)
-            return final_ollama, _convert_messages_from_openai(all_messages)
+            return ollama_message, ollama_history
 
         # Execute tools and add results
+        calls = []
         for tool_call in tool_calls:
             tool_name = tool_call.function.name
             try:
-                tool_args = json.loads(tool_call.function.arguments)
+                tool_args = _loads(tool_call.function.arguments)
             except json.JSONDecodeError:
                 tool_args = {}
+            calls.append((tool_name, tool_args))
 
-            result = execute_tool(tool_name, tool_args)
-
+        results = _run_tool_calls(calls, tool_results, parallel_tools)
+        for tool_call, result in zip(tool_calls, results):
             tool_message = {
                 "role": "tool",
                 "tool_call_id": tool_call.id,
                 "content": result,
             }
             all_messages.append(tool_message)
+            ollama_history.append({"role": "tool", "content": result})
 
     # Max iterations reached
     final_message = {
         "role": "assistant",
         "content": "I've reached the maximum number of tool call iterations. Please try a simpler request.",
     }
-    all_messages.append(final_message)
-    return final_message, _convert_messages_from_openai(all_messages)
+    ollama_history.append(final_message)
+    return final_message, ollama_history
+
+
+def _mark_cacheable_prefix(messages: list[dict]) -> list[dict]:
+    """Mark a leading system prompt as a cacheable prompt prefix.
+
+    Adds Anthropic's cache_control marker, which OpenAI-compatible proxies
+    such as LiteLLM pass through. The first message is replaced, never
+    mutated, since converted messages can be shared with the caller.
+    """
+    if not messages:
+        return messages
+    first = messages[0]
+    if first.get("role") != "system" or not isinstance(first.get("content"), str):
+        return messages
+    marked = {
+        **first,
+        "content": [
+            {"type": "text", "text": first["content"], "cache_control": {"type": "ephemeral"}},
+        ],
+    }
+    return [marked, *messages[1:]]
+
+
+# OpenAI-format tool definitions keyed by id() of the schema they came from,
+# stored with that schema so a recycled id can never match
+_OPENAI_TOOL_CACHE_MAX = 1024
+_openai_tool_cache: dict[int, tuple[dict, dict]] = {}
 
 
 def _convert_tools_to_openai(ollama_tools: list[dict]) -> list[dict]:
-    """Convert Ollama tool format to OpenAI format."""
-    return [
-        {
-            "type": "function",
-            "function": {
-                "name": tool["function"]["name"],
-                "description": tool["function"]["description"],
-                "parameters": tool["function"]["parameters"],
-            }
-        }
-        for tool in ollama_tools
-    ]
+    """Convert Ollama tool format to OpenAI format.
+
+    Registry schemas are built once per registration, so each one's
+    conversion is memoized and reused on every chat() call.
+    """
+    if len(_openai_tool_cache) > _OPENAI_TOOL_CACHE_MAX:
+        _openai_tool_cache.clear()  # Drop schemas replaced by tool reloads
+    result = []
+    for tool in ollama_tools:
+        cached = _openai_tool_cache.get(id(tool))
+        if cached is None or cached[0] is not tool:
+            cached = (tool, {
+                "type": "function",
+                "function": {
+                    "name": tool["function"]["name"],
+                    "description": tool["function"]["description"],
+                    "parameters": tool["function"]["parameters"],
+                }
+            })
+            _openai_tool_cache[id(tool)] = cached
+        result.append(cached[1])
+    return result
+
+
+# Synthesized tool call IDs for the first few calls of a message
+_CALL_IDS = tuple(f"call_{i}" for i in range(32))
+
+# Keys of a message that converts to OpenAI format unchanged
+_PLAIN_MESSAGE_KEYS = frozenset(("role", "content"))
+
+
+def _call_id(index: int) -> str:
+    """Get the synthesized ID for the index-th tool call of a message."""
+    return _CALL_IDS[index] if index < len(_CALL_IDS) else f"call_{index}"
 
 
 def _convert_messages_to_openai(messages: list[dict]) -> list[dict]:
-    """Convert Ollama message format to OpenAI format."""
+    """Convert Ollama message format to OpenAI format.
+
+    Plain role/content messages are reused rather than copied; callers must
+    not mutate the converted messages in place.
+    """
     result = []
     for msg in messages:
+        if msg.keys() == _PLAIN_MESSAGE_KEYS:
+            result.append(msg)
+            continue
+
         converted = {"role": msg["role"], "content": msg.get("content", "")}
 
         # Handle tool calls in assistant messages
         if msg.get("tool_calls"):
             converted["tool_calls"] = [
                 {
-                    "id": f"call_{i}",
+                    "id": _call_id(i),
                     "type": "function",
                     "function": {
                         "name": tc["function"]["name"],
-                        "arguments": json.dumps(tc["function"].get("arguments", {}))
+                        "arguments": _dumps(tc["function"].get("arguments", {}))
                         if isinstance(tc["function"].get("arguments"), dict)
                         else tc["function"].get("arguments", "{}"),
                     },
@@ -355,18 +747,31 @@ def _convert_messages_to_openai(messages: list[dict]) -> list[dict]:
 
 
 def _convert_messages_from_openai(messages: list[dict]) -> list[dict]:
-    """Convert OpenAI message format back to Ollama format."""
+    """Convert OpenAI message format back to Ollama format.
+
+    Plain role/content messages are reused rather than copied.
+    """
     result = []
     for msg in messages:
+        if msg.keys() == _PLAIN_MESSAGE_KEYS:
+            result.append(msg)
+            continue
+
         converted = {"role": msg["role"], "content": msg.get("content", "")}
 
+        # Tool responses keep only role and content (Ollama doesn't use
+        # tool_call_id)
+        if msg["role"] == "tool" and "tool_call_id" in msg:
+            result.append(converted)
+            continue
+
         # Handle tool calls
         if msg.get("tool_calls"):
             converted["tool_calls"] = [
                 {
                     "function": {
                         "name": tc["function"]["name"],
-                        "arguments": json.loads(tc["function"]["arguments"])
+                        "arguments": _loads(tc["function"]["arguments"])
                         if isinstance(tc["function"]["arguments"], str)
                         else tc["function"]["arguments"],
                     }
@@ -374,10 +779,6 @@ def _convert_messages_from_openai(messages: list[dict]) -> list[dict]:
                 for tc in msg["tool_calls"]
             ]
 
-        # Handle tool responses (drop tool_call_id as Ollama doesn't use it)
-        if msg["role"] == "tool" and "tool_call_id" in msg:
-            converted = {"role": "tool", "content": msg.get("content", "")}
-
         result.append(converted)
     return result
 
@@ -411,7 +812,7 @@ def _convert_openai_to_ollama_format(message) -> dict:
             {
                 "function": {
                     "name": tc.function.name,
-                    "arguments": json.loads(tc.function.arguments)
+                    "arguments": _loads(tc.function.arguments)
                     if isinstance(tc.function.arguments, str)
                     else tc.function.arguments,
                 }
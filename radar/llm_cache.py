@@ -0,0 +1,169 @@
+"""Opt-in on-disk cache of LLM replies.
+
+With ``llm.cache_enabled`` set, chat() looks up each request by a SHA-256 of
+everything that determines the reply (provider, endpoint, model, messages
+and tool schemas) and replays the stored reply instead of calling the model.
+Only turns that ran no tools are stored: replaying a tool-using turn would
+silently skip the tools' side effects.
+
+Each reply is a separate ``{key}.json`` file in the ``llm_cache`` directory
+under the data directory, so storing one never rewrites the others. A
+file's modification time records when it was last used; once the cache
+grows past its limit, the least recently used files are deleted.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from radar.config import get_data_paths
+
+_cache_lock = threading.Lock()
+_hits = 0
+_misses = 0
+# Number of cached replies per cache directory, counted on first use
+_entries: dict[Path, int] = {}
+# Last modification time stamped on an entry, so stamps strictly increase
+_last_stamp = 0
+
+
+def cache_key(
+    provider: str,
+    base_url: str,
+    model: str,
+    messages: list[dict[str, Any]],
+    tools: list[dict[str, Any]],
+) -> str:
+    """Hash an LLM request into a cache key."""
+    payload = json.dumps(
+        {
+            "provider": provider,
+            "base_url": base_url,
+            "model": model,
+            "messages": messages,
+            "tools": tools,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    """Get the file holding a key's cached reply."""
+    return get_data_paths().llm_cache / f"{key}.json"
+
+
+def _stamp(path: Path) -> None:
+    """Mark an entry as just used.
+
+    File systems record modification times coarsely, so entries written or
+    read in quick succession are given strictly increasing times.
+    """
+    global _last_stamp
+    with _cache_lock:
+        _last_stamp = max(time.time_ns(), _last_stamp + 1)
+        stamp = _last_stamp
+    try:
+        os.utime(path, ns=(stamp, stamp))
+    except OSError:
+        pass  # Evicted by another process in the meantime
+
+
+def _count_entries(cache_dir: Path) -> int:
+    """Get the number of cached replies in a directory (call with _cache_lock held)."""
+    count = _entries.get(cache_dir)
+    if count is None:
+        count = _entries[cache_dir] = sum(1 for _ in cache_dir.glob("*.json"))
+    return count
+
+
+def _evict(cache_dir: Path, max_entries: int) -> None:
+    """Delete the least recently used entries (call with _cache_lock held).
+
+    Trims to 90% of max_entries so the directory is not rescanned on every
+    store once the cache is full.
+    """
+    keep = max_entries - max_entries // 10
+    entries = []
+    for path in cache_dir.glob("*.json"):
+        try:
+            entries.append((path.stat().st_mtime_ns, path))
+        except OSError:
+            pass  # Removed by another process
+    entries.sort()
+    for _, path in entries[:max(0, len(entries) - keep)]:
+        path.unlink(missing_ok=True)
+    _entries[cache_dir] = min(len(entries), keep)
+
+
+def get_cached_reply(key: str) -> list[dict[str, Any]] | None:
+    """Return the messages cached for a request key, if any."""
+    global _hits, _misses
+    path = _entry_path(key)
+    try:
+        with open(path, encoding="utf-8") as f:
+            reply = json.load(f)
+    except (OSError, ValueError):
+        reply = None  # Missing or corrupt entry
+    if not isinstance(reply, list):
+        with _cache_lock:
+            _misses += 1
+        return None
+    _stamp(path)
+    with _cache_lock:
+        _hits += 1
+    return reply
+
+
+def store_reply(key: str, reply: list[dict[str, Any]], max_entries: int) -> None:
+    """Cache the messages a turn appended, evicting the least recently used.
+
+    Writes go to a uniquely named temporary file that is then renamed into
+    place, so readers and other processes never see a partial entry. Failures
+    are ignored; the cache is best effort.
+    """
+    path = _entry_path(key)
+    existed = path.exists()
+    try:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{key}.", suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(reply, f)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        Path(tmp).unlink(missing_ok=True)
+        return
+    _stamp(path)
+
+    cache_dir = path.parent
+    with _cache_lock:
+        if cache_dir not in _entries:
+            _count_entries(cache_dir)  # The scan already sees the new file
+        elif not existed:
+            _entries[cache_dir] += 1
+        if _entries[cache_dir] > max_entries:
+            _evict(cache_dir, max_entries)
+
+
+def cache_stats() -> dict[str, int]:
+    """Get hit/miss counters and the number of cached replies."""
+    with _cache_lock:
+        entries = _count_entries(get_data_paths().llm_cache)
+        return {"hits": _hits, "misses": _misses, "entries": entries}
+
+
+def reset_llm_cache() -> None:
+    """Reset the counters and the cached entry counts (files are left in place)."""
+    global _hits, _misses
+    with _cache_lock:
+        _entries.clear()
+        _hits = 0
+        _misses = 0
@@ -8,6 +8,7 @@ Each line in the file is a JSON object representing a message.
 
 import json
 import uuid
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -67,12 +68,25 @@ def get_messages(conversation_id: str, limit: int | None = None) -> list[dict[st
     Returns:
         List of message dicts with role, content, tool_calls, etc.
     """
+    messages = list(iter_messages(conversation_id))
+
+    if limit and len(messages) > limit:
+        messages = messages[-limit:]
+
+    return messages
+
+
+def iter_messages(conversation_id: str) -> Iterator[dict[str, Any]]:
+    """Iterate over a conversation's messages, reading the file forward once.
+
+    Yields the same dicts as get_messages() (including the line-number "id")
+    without holding the whole conversation in memory.
+    """
     conv_path = _get_conversation_path(conversation_id)
 
     if not conv_path.exists():
-        return []
+        return
 
-    messages = []
     with open(conv_path) as f:
         for line_num, line in enumerate(f, start=1):
             line = line.strip()
@@ -80,12 +94,7 @@ def get_messages(conversation_id: str, limit: int | None = None) -> list[dict[st
                 continue
             msg = json.loads(line)
             msg["id"] = line_num
-            messages.append(msg)
-
-    if limit and len(messages) > limit:
-        messages = messages[-limit:]
-
-    return messages
+            yield msg
 
 
 def _get_heartbeat_conversation_id() -> str | None:
@@ -341,62 +350,82 @@ def get_messages_for_display(conversation_id: str) -> list[dict[str, Any]]:
 
     Returns:
         List of messages with tool_calls in display format:
-        {"role": "user"|"assistant", "content": "...", "tool_calls": [{"name": ..., "args": ..., "result": ...}]}
+        {"role": "user"|"assistant", "content": "...", "timestamp": "...", "tool_calls": [{"name": ..., "args": ..., "result": ...}]}
     """
-    raw_messages = get_messages(conversation_id)
-
-    # Build a map of tool_call_id -> result from tool role messages
-    tool_results: dict[str, str] = {}
-    for msg in raw_messages:
-        if msg.get("role") == "tool" and msg.get("tool_call_id"):
-            tool_results[msg["tool_call_id"]] = msg.get("content", "")
+    return list(iter_messages_for_display(conversation_id))
 
-    display_messages: list[dict[str, Any]] = []
 
-    for i, msg in enumerate(raw_messages):
-        role = msg.get("role")
+def iter_messages_for_display(conversation_id: str) -> Iterator[dict[str, Any]]:
+    """Iterate over a conversation's messages in get_messages_for_display() format.
 
-        # Skip tool role messages - their results are merged into assistant messages
-        if role == "tool":
+    Reads the file forward once. Only a message with tool calls is held back,
+    until the tool messages that follow it have been read.
+    """
+    pending: dict[str, Any] | None = None
+    following_tools: list[dict[str, Any]] = []
+
+    for msg in iter_messages(conversation_id):
+        # Tool role messages are merged into the assistant message they follow
+        if msg.get("role") == "tool":
+            if pending is not None:
+                following_tools.append(msg)
             continue
 
-        display_msg: dict[str, Any] = {
-            "role": role,
-            "content": msg.get("content") or "",
-            "id": msg.get("id"),
-        }
+        if pending is not None:
+            yield _display_message(pending, following_tools)
+            pending = None
+            following_tools = []
 
-        # Transform tool_calls to display format
         if msg.get("tool_calls"):
-            display_tool_calls = []
-
-            # Collect tool results that follow this message (for positional matching)
-            following_tool_results = []
-            for j in range(i + 1, len(raw_messages)):
-                if raw_messages[j].get("role") == "tool":
-                    following_tool_results.append(raw_messages[j].get("content", ""))
-                else:
-                    break
-
-            for idx, tc in enumerate(msg["tool_calls"]):
-                # Extract from stored format: {"function": {"name": ..., "arguments": {...}}, "id": ...}
-                func = tc.get("function", {})
-                tool_call_id = tc.get("id", "")
-
-                # Try to get result by tool_call_id first, then by position
-                result = tool_results.get(tool_call_id, "")
-                if not result and idx < len(following_tool_results):
-                    result = following_tool_results[idx]
-
-                display_tool_calls.append({
-                    "name": func.get("name", "unknown"),
-                    "args": func.get("arguments", {}),
-                    "result": result,
-                })
-
-            if display_tool_calls:
-                display_msg["tool_calls"] = display_tool_calls
-
-        display_messages.append(display_msg)
-
-    return display_messages
+            pending = msg
+        else:
+            yield _display_message(msg, following_tools)
+
+    if pending is not None:
+        yield _display_message(pending, following_tools)
+
+
+def _display_message(
+    msg: dict[str, Any], following_tools: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """Convert one stored message to display format.
+
+    following_tools are the tool role messages stored right after msg.
+    """
+    display_msg: dict[str, Any] = {
+        "role": msg.get("role"),
+        "content": msg.get("content") or "",
+        "id": msg.get("id"),
+        "timestamp": msg.get("timestamp", ""),
+    }
+
+    # Transform tool_calls to display format
+    if msg.get("tool_calls"):
+        tool_results: dict[str, str] = {}
+        for tool_msg in following_tools:
+            if tool_msg.get("tool_call_id"):
+                tool_results[tool_msg["tool_call_id"]] = tool_msg.get("content", "")
+        # Results in order, for positional matching
+        following_tool_results = [t.get("content", "") for t in following_tools]
+
+        display_tool_calls = []
+        for idx, tc in enumerate(msg["tool_calls"]):
+            # Extract from stored format: {"function": {"name": ..., "arguments": {...}}, "id": ...}
+            func = tc.get("function", {})
+            tool_call_id = tc.get("id", "")
+
+            # Try to get result by tool_call_id first, then by position
+            result = tool_results.get(tool_call_id, "")
+            if not result and idx < len(following_tool_results):
+                result = following_tool_results[idx]
+
+            display_tool_calls.append({
+                "name": func.get("name", "unknown"),
+                "args": func.get("arguments", {}),
+                "result": result,
+            })
+
+        if display_tool_calls:
+            display_msg["tool_calls"] = display_tool_calls
+
+    return display_msg
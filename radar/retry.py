@@ -2,6 +2,8 @@
 
 import random
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 import httpx
 
@@ -21,6 +23,58 @@ def compute_delay(attempt: int, base_delay: float = 1.0, max_delay: float = 30.0
     return random.uniform(0, ceiling)
 
 
+def retry_after_seconds(exc: Exception) -> float | None:
+    """Get the server's requested wait from an error's Retry-After header.
+
+    Works for httpx.HTTPStatusError and OpenAI SDK status errors, both of
+    which carry the HTTP response. The header may be a number of seconds or
+    an HTTP date.
+
+    Returns:
+        Seconds to wait (never negative), or None if the header is absent
+        or unparseable.
+    """
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        return None
+    try:
+        value = headers.get("retry-after")
+    except Exception:
+        return None
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def compute_retry_delay(
+    exc: Exception,
+    attempt: int,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+) -> float:
+    """Compute the delay before retrying after exc.
+
+    Honors a Retry-After header when the error carries one (capped at
+    max_delay), otherwise falls back to compute_delay().
+    """
+    retry_after = retry_after_seconds(exc)
+    if retry_after is not None:
+        return min(retry_after, max_delay)
+    return compute_delay(attempt, base_delay, max_delay)
+
+
 def is_retryable_httpx_error(exc: Exception) -> bool:
     """Check if an httpx exception is worth retrying.
 
@@ -82,7 +136,8 @@ def retry_call(
         except Exception as e:
             last_error = e
             if attempt < max_retries and is_retryable_fn(e):
-                delay = compute_delay(
+                delay = compute_retry_delay(
+                    e,
                     attempt,
                     retry_cfg.base_delay,
                     retry_cfg.max_delay,
@@ -1,16 +1,40 @@
 """Semantic memory storage with embeddings."""
 
+import atexit
+import hashlib
+import heapq
+import math
+import operator
 import sqlite3
 import struct
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
 
 import httpx
 
 from radar.config import get_config, get_data_paths
 from radar.retry import is_retryable_httpx_error, is_retryable_openai_error, retry_call
 
+# Database paths whose schema exists, so the CREATE statements (and their
+# commit) run once per process rather than on every connection
+_initialized_dbs: set[str] = set()
+
+# Long-lived connection of each thread, with the database path it is for
+_shared_connections: dict[threading.Thread, tuple[str, sqlite3.Connection]] = {}
+_shared_connections_lock = threading.Lock()
+
 # Cache for local embedding model
 _local_model = None
 
+# In-process LRU of computed embeddings, keyed by
+# (provider, model, blake2b(text)) so a model switch never reuses vectors
+_EMBEDDING_CACHE_MAX = 10000
+_embedding_cache: OrderedDict[tuple[str, str, bytes], list[float]] = OrderedDict()
+_embedding_cache_lock = threading.Lock()
+
 
 def _init_db(conn: sqlite3.Connection) -> None:
     """Initialize the database schema."""
@@ -37,6 +61,10 @@ def _init_db(conn: sqlite3.Connection) -> None:
             processed BOOLEAN DEFAULT FALSE
         )
     """)
+    # Covers get_feedback_summary's GROUP BY without touching the table
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_feedback_summary ON feedback(sentiment, processed)"
+    )
 
     # Scheduled tasks
     conn.execute("""
@@ -114,15 +142,60 @@ def _init_db(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
-def _get_connection() -> sqlite3.Connection:
+def _get_connection(check_same_thread: bool = True) -> sqlite3.Connection:
     """Get a database connection, initializing if needed."""
-    db_path = get_data_paths().db
-    conn = sqlite3.connect(db_path)
+    db_path = get_data_paths().db_str
+    conn = sqlite3.connect(db_path, check_same_thread=check_same_thread)
     conn.row_factory = sqlite3.Row
-    _init_db(conn)
+    if db_path not in _initialized_dbs:
+        _init_db(conn)
+        _initialized_dbs.add(db_path)
     return conn
 
 
+def _get_shared_connection() -> sqlite3.Connection:
+    """Get this thread's long-lived connection to the database.
+
+    The connection is reused across calls and must not be closed by the
+    caller. Writes should run inside ``with conn:`` so a failure rolls back
+    rather than leaving a transaction open on the shared connection.
+    """
+    db_path = get_data_paths().db_str
+    thread = threading.current_thread()
+    entry = _shared_connections.get(thread)
+    if entry is not None and entry[0] == db_path:
+        return entry[1]
+
+    # Opened for any thread so close_shared_connections() can close it; it is
+    # still only ever used by this one
+    conn = _get_connection(check_same_thread=False)
+    with _shared_connections_lock:
+        # Drop this thread's connection to a previous data directory and
+        # those of threads that have exited
+        stale = [entry[1]] if entry is not None else []
+        for other in [t for t in _shared_connections if not t.is_alive()]:
+            stale.append(_shared_connections.pop(other)[1])
+        _shared_connections[thread] = (db_path, conn)
+    for old in stale:
+        old.close()
+    return conn
+
+
+def close_shared_connections() -> None:
+    """Close every thread's shared connection (at shutdown, or between tests).
+
+    Threads open a new one on their next call to _get_shared_connection().
+    """
+    with _shared_connections_lock:
+        connections = [conn for _, conn in _shared_connections.values()]
+        _shared_connections.clear()
+    for conn in connections:
+        conn.close()
+
+
+atexit.register(close_shared_connections)
+
+
 def _serialize_embedding(embedding: list[float]) -> bytes:
     """Serialize embedding to bytes for storage."""
     return struct.pack(f"{len(embedding)}f", *embedding)
@@ -134,6 +207,29 @@ def _deserialize_embedding(data: bytes) -> list[float]:
     return list(struct.unpack(f"{count}f", data))
 
 
+def _quantize_embedding(embedding: list[float]) -> tuple[bytes, float]:
+    """Quantize an embedding to int8 with a per-vector scale.
+
+    Returns:
+        (int8 bytes, scale) where each value is approximately int8 * scale
+    """
+    peak = max(map(abs, embedding), default=0.0)
+    if not peak:
+        return bytes(len(embedding)), 0.0
+    scale = peak / 127
+    return array("b", [round(x / scale) for x in embedding]).tobytes(), scale
+
+
+def _decode_embedding(data: bytes, scale: float | None = None) -> Sequence[float]:
+    """Decode a stored embedding for similarity scoring.
+
+    float32 blobs (``scale`` is None) decode as-is; int8 blobs decode to their
+    raw integers, which point the same way as the original vector, so cosine
+    similarity needs no rescaling.
+    """
+    return array("f" if scale is None else "b", data)
+
+
 def is_embedding_available() -> bool:
     """Check if embedding functionality is available.
 
@@ -156,21 +252,90 @@ def get_embedding(text: str) -> list[float]:
     Raises:
         RuntimeError: If embedding provider is 'none' or embedding fails
     """
+    return get_embeddings([text])[0]
+
+
+def get_embeddings(texts: list[str]) -> list[list[float]]:
+    """Get embeddings for several texts in a single provider request.
+
+    Args:
+        texts: Texts to embed
+
+    Returns:
+        One embedding per input text, in the same order
+
+    Raises:
+        RuntimeError: If embedding provider is 'none' or embedding fails
+    """
+    if not texts:
+        return []
+
     config = get_config()
     provider = config.embedding.provider
 
     if provider == "none":
         raise RuntimeError("Embeddings disabled (provider=none)")
     elif provider == "openai":
-        return _get_embedding_openai(text, config)
+        return _get_embeddings_openai(texts, config)
     elif provider == "local":
-        return _get_embedding_local(text, config)
+        return _get_embeddings_local(texts, config)
     else:  # ollama (default)
-        return _get_embedding_ollama(text, config)
+        return _get_embeddings_ollama(texts, config)
+
 
+def get_embeddings_cached(texts: list[str]) -> list[list[float]]:
+    """Get embeddings, reusing ones already computed in this process.
 
-def _get_embedding_ollama(text: str, config) -> list[float]:
-    """Get embedding using Ollama's /api/embed endpoint."""
+    Cache misses are fetched together in one get_embeddings() call. The
+    returned lists are shared with the cache and must not be mutated.
+
+    Raises:
+        RuntimeError: If embedding provider is 'none' or embedding fails
+    """
+    config = get_config()
+    provider = config.embedding.provider
+    model = config.embedding.model
+    keys = [
+        (provider, model, hashlib.blake2b(text.encode(), digest_size=16).digest())
+        for text in texts
+    ]
+
+    results: list[list[float] | None] = [None] * len(texts)
+    missing: list[int] = []
+    with _embedding_cache_lock:
+        for idx, key in enumerate(keys):
+            cached = _embedding_cache.get(key)
+            if cached is None:
+                missing.append(idx)
+            else:
+                _embedding_cache.move_to_end(key)
+                results[idx] = cached
+
+    if missing:
+        fresh = get_embeddings([texts[idx] for idx in missing])
+        with _embedding_cache_lock:
+            for idx, embedding in zip(missing, fresh):
+                results[idx] = embedding
+                _embedding_cache[keys[idx]] = embedding
+            while len(_embedding_cache) > _EMBEDDING_CACHE_MAX:
+                _embedding_cache.popitem(last=False)
+
+    return results
+
+
+def get_embedding_cached(text: str) -> list[float]:
+    """Get embedding for text, reusing one already computed in this process."""
+    return get_embeddings_cached([text])[0]
+
+
+def clear_embedding_cache() -> None:
+    """Drop all in-process cached embeddings."""
+    with _embedding_cache_lock:
+        _embedding_cache.clear()
+
+
+def _get_embeddings_ollama(texts: list[str], config) -> list[list[float]]:
+    """Get embeddings using Ollama's /api/embed endpoint (accepts a list input)."""
     # Use embedding base_url if set, otherwise fall back to LLM base_url
     base_url = config.embedding.base_url or config.llm.base_url
     url = f"{base_url.rstrip('/')}/api/embed"
@@ -179,7 +344,7 @@ def _get_embedding_ollama(text: str, config) -> list[float]:
     max_retries = (retry_cfg.max_retries if retry_cfg.embedding_retries else 0)
 
     def _do_request():
-        resp = httpx.post(url, json={"model": config.embedding.model, "input": text}, timeout=60)
+        resp = httpx.post(url, json={"model": config.embedding.model, "input": texts}, timeout=60)
         resp.raise_for_status()
         return resp
 
@@ -196,16 +361,15 @@ def _get_embedding_ollama(text: str, config) -> list[float]:
 
     data = response.json()
 
-    # Ollama returns embeddings as a list (for batch support)
     embeddings = data.get("embeddings", [])
-    if not embeddings:
+    if len(embeddings) != len(texts):
         raise RuntimeError("No embedding returned from Ollama")
 
-    return embeddings[0]
+    return embeddings
 
 
-def _get_embedding_openai(text: str, config) -> list[float]:
-    """Get embedding using OpenAI-compatible API."""
+def _get_embeddings_openai(texts: list[str], config) -> list[list[float]]:
+    """Get embeddings using OpenAI-compatible API."""
     from openai import OpenAI
 
     # Use embedding-specific settings if provided, otherwise fall back to LLM settings
@@ -219,7 +383,7 @@ def _get_embedding_openai(text: str, config) -> list[float]:
 
     try:
         response = retry_call(
-            lambda: client.embeddings.create(model=config.embedding.model, input=[text]),
+            lambda: client.embeddings.create(model=config.embedding.model, input=texts),
             max_retries=max_retries, retry_cfg=retry_cfg,
             is_retryable_fn=is_retryable_openai_error, provider="openai-embedding",
             label=config.embedding.model,
@@ -227,11 +391,12 @@ def _get_embedding_openai(text: str, config) -> list[float]:
     except Exception as e:
         raise RuntimeError(f"Embedding request failed: {e}")
 
-    return response.data[0].embedding
+    # Results carry their input index; don't rely on response ordering
+    return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
 
 
-def _get_embedding_local(text: str, config) -> list[float]:
-    """Get embedding using sentence-transformers locally."""
+def _get_embeddings_local(texts: list[str], config) -> list[list[float]]:
+    """Get embeddings using sentence-transformers locally."""
     global _local_model
 
     try:
@@ -246,8 +411,8 @@ def _get_embedding_local(text: str, config) -> list[float]:
     if _local_model is None:
         _local_model = SentenceTransformer(config.embedding.model)
 
-    embedding = _local_model.encode(text)
-    return embedding.tolist()
+    embeddings = _local_model.encode(texts, batch_size=32)
+    return embeddings.tolist()
 
 
 def cosine_similarity(a: list[float], b: list[float]) -> float:
@@ -260,6 +425,40 @@ def cosine_similarity(a: list[float], b: list[float]) -> float:
     return dot / (norm_a * norm_b)
 
 
+def top_similar(
+    query_embedding: list[float],
+    rows: Iterable[tuple[Any, Sequence[float], float | None]],
+    limit: int,
+) -> list[tuple[float, Any]]:
+    """Select the rows whose embeddings are most similar to a query.
+
+    Rows are consumed lazily and only the best ``limit`` are kept, so callers
+    can stream rows straight from a database cursor. Rows that carry their
+    precomputed L2 norm cost one dot product each; a None norm is computed.
+
+    Args:
+        query_embedding: Query vector
+        rows: Iterable of (key, embedding vector, norm or None) tuples
+        limit: Maximum number of results
+
+    Returns:
+        List of (cosine similarity, key) pairs, most similar first
+    """
+    query_norm = math.hypot(*query_embedding)
+    unit_query = [x / query_norm for x in query_embedding] if query_norm else []
+
+    def scored() -> Iterator[tuple[float, Any]]:
+        for key, vector, norm in rows:
+            if norm is None:
+                norm = math.hypot(*vector)
+            if unit_query and norm:
+                yield sum(map(operator.mul, unit_query, vector)) / norm, key
+            else:
+                yield 0.0, key
+
+    return heapq.nlargest(limit, scored(), key=operator.itemgetter(0))
+
+
 def store_memory(content: str, source: str | None = None) -> int:
     """Store a memory with its embedding.
 
@@ -307,7 +506,7 @@ def search_memories(query: str, limit: int = 5) -> list[dict]:
     Raises:
         RuntimeError: If embeddings are disabled
     """
-    query_embedding = get_embedding(query)
+    query_embedding = get_embedding_cached(query)
 
     conn = _get_connection()
     try:
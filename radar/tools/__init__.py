@@ -21,6 +21,27 @@ _external_tool_mtimes: dict[str, float] = {}
 # Plugin name -> set of tool names registered by that plugin
 _plugin_tools: dict[str, set[str]] = {}
 
+# Read-only tools whose result the LLM loop may reuse when the model repeats
+# an identical call within one chat() turn, and for how long (seconds)
+CACHEABLE_TOOLS: dict[str, float] = {
+    "web_search": 300.0,
+    "weather": 600.0,
+}
+
+# Tools with no side effects, which the LLM loop may run concurrently when
+# the model requests several in one turn
+PARALLEL_SAFE_TOOLS: frozenset[str] = frozenset({
+    "calendar",
+    "github",
+    "list_directory",
+    "pdf_extract",
+    "read_file",
+    "recall",
+    "search_documents",
+    "weather",
+    "web_search",
+})
+
 
 def _build_tool_schema(name: str, description: str, parameters: dict[str, Any]) -> dict:
     """Build a tool schema dict from name, description, and parameters."""
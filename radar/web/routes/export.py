@@ -1,7 +1,7 @@
 """Conversation export API endpoint."""
 
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 
 router = APIRouter()
 
@@ -9,7 +9,7 @@ router = APIRouter()
 @router.get("/api/export/{conversation_id}")
 async def export_conversation(conversation_id: str, format: str = "json"):
     """Export a conversation as JSON or Markdown."""
-    from radar.export import export_json, export_markdown
+    from radar.export import iter_export_json, iter_export_markdown
 
     if format not in ("json", "markdown"):
         return JSONResponse(
@@ -19,11 +19,11 @@ async def export_conversation(conversation_id: str, format: str = "json"):
 
     try:
         if format == "json":
-            content = export_json(conversation_id)
+            content = iter_export_json(conversation_id)
             media_type = "application/json"
             ext = "json"
         else:
-            content = export_markdown(conversation_id)
+            content = iter_export_markdown(conversation_id)
             media_type = "text/markdown"
             ext = "md"
     except ValueError:
@@ -33,8 +33,5 @@ async def export_conversation(conversation_id: str, format: str = "json"):
         )
 
     filename = f"conversation-{conversation_id[:8]}.{ext}"
-    return Response(
-        content=content,
-        media_type=media_type,
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    return StreamingResponse(content, media_type=media_type, headers=headers)
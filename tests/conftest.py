@@ -38,8 +38,15 @@ def isolated_data_dir(tmp_path, monkeypatch):
     radar.config._config = None
     radar.config.reset_data_paths()
 
+    # Drop embeddings cached by earlier tests (possibly from mocks)
+    from radar.semantic import clear_embedding_cache, close_shared_connections
+    clear_embedding_cache()
+
     yield data_dir
 
+    # Don't leave connections open to the deleted data directory
+    close_shared_connections()
+
     # Cleanup happens automatically via monkeypatch (env var)
     # and tmp_path (directory deletion)
 
@@ -75,11 +82,12 @@ def personalities_dir(isolated_data_dir):
 def mock_llm(monkeypatch):
     """Mock LLM responder for integration tests.
 
-    Patches httpx.post so the real chat() tool loop in radar/llm.py
-    executes but responses are scripted via add_response().
+    Patches httpx.post and httpx.Client.post so the real chat() tool loop
+    in radar/llm.py executes but responses are scripted via add_response().
     """
     from tests.mock_llm import MockLLMResponder
 
     responder = MockLLMResponder()
     monkeypatch.setattr("httpx.post", responder.mock_post)
+    monkeypatch.setattr("httpx.Client.post", responder.mock_post)
     return responder
@@ -1,10 +1,11 @@
 """Mock LLM responder for integration tests.
 
-Replaces httpx.post at the HTTP layer so the real chat() tool loop
+Replaces httpx.post / httpx.Client.post at the HTTP layer so the real chat() tool loop
 in radar/llm.py still executes, but responses are scripted.
 """
 
 import copy
+import json
 
 import httpx
 
@@ -35,7 +36,7 @@ class MockLLMResponder:
         })
 
     def mock_post(self, url, **kwargs):
-        """Drop-in replacement for httpx.post.
+        """Drop-in replacement for httpx.post and httpx.Client.post.
 
         Records the call and returns the next queued response.
         """
@@ -69,5 +70,9 @@ class MockLLMResponder:
             The messages list from the request payload.
         """
         call = self._calls[call_index]
-        payload = call["kwargs"].get("json", {})
+        kwargs = call["kwargs"]
+        if "content" in kwargs:
+            payload = json.loads(kwargs["content"])
+        else:
+            payload = kwargs.get("json", {})
         return payload.get("messages", [])
@@ -1,5 +1,7 @@
 """Tests for radar/config.py — paths, parsing, env overrides, loading."""
 
+import dataclasses
+import sys
 import warnings
 from pathlib import Path
 
@@ -25,6 +27,14 @@ from radar.config import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _reset_config_warnings():
+    """Config warnings fire once per process; re-arm them for each test."""
+    radar.config.schema._warned.clear()
+    yield
+    radar.config.schema._warned.clear()
+
+
 # ── DataPaths ──────────────────────────────────────────────────────
 
 
@@ -47,6 +57,11 @@ class TestDataPaths:
         paths.set_base_dir(str(tmp_path / "override"))
         assert paths._base_dir == tmp_path / "override"
 
+    def test_set_base_dir_expands_home(self):
+        paths = DataPaths()
+        paths.set_base_dir("~/radar-data")
+        assert paths._base_dir == Path.home() / "radar-data"
+
     def test_set_base_dir_empty_string_no_op(self):
         paths = DataPaths()
         paths.set_base_dir("")
@@ -76,6 +91,23 @@ class TestDataPaths:
         paths = get_data_paths()
         assert paths.personalities.is_dir()
 
+    def test_subpaths_memoized(self, isolated_data_dir):
+        paths = get_data_paths()
+        assert paths.conversations is paths.conversations
+        assert paths.db is paths.db
+
+    def test_db_str(self, isolated_data_dir):
+        paths = get_data_paths()
+        assert paths.db_str == str(isolated_data_dir / "memory.db")
+
+    def test_set_base_dir_clears_subpaths(self, tmp_path):
+        paths = DataPaths()
+        paths.set_base_dir(str(tmp_path / "first"))
+        assert paths.tools == tmp_path / "first" / "tools"
+        paths.set_base_dir(str(tmp_path / "second"))
+        assert paths.tools == tmp_path / "second" / "tools"
+        assert paths.tools.is_dir()
+
 
 # ── Config.from_dict ───────────────────────────────────────────────
 
@@ -194,6 +226,20 @@ class TestConfigFromDict:
         with pytest.warns(UserWarning, match="API key found in config"):
             Config.from_dict({"llm": {"api_key": "sk-secret"}})
 
+    @pytest.mark.parametrize("entry", ["from_dict", "from_dict_cached"])
+    def test_warning_points_at_caller(self, entry):
+        with pytest.warns(DeprecationWarning) as record:
+            getattr(Config, entry)({"embedding_model": f"{entry}-embed"})
+        assert record[0].filename == __file__
+
+    def test_warnings_fire_once_per_process(self):
+        with pytest.warns(DeprecationWarning):
+            Config.from_dict({"embedding_model": "first-embed"})
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            cfg = Config.from_dict({"embedding_model": "second-embed"})
+        assert cfg.embedding.model == "second-embed"
+
     def test_ollama_section_ignored_when_llm_present(self):
         cfg = Config.from_dict({
             "llm": {"provider": "openai", "model": "gpt-4o"},
@@ -226,12 +272,93 @@ class TestConfigFromDict:
         assert cfg.retry.embedding_retries is False
         assert cfg.retry.url_monitor_retries is False
 
+    def test_section_builders_match_class_defaults(self):
+        schema = radar.config.schema
+        for name, build in schema._SECTION_BUILDERS.items():
+            assert build({}) == schema._CONFIG_SECTIONS[name]()
+
+    def test_section_builder_ignores_unknown_keys(self):
+        build = radar.config.schema._SECTION_BUILDERS["web"]
+        assert build({"port": 9000, "bogus": 1}) == WebConfig(port=9000)
+
+    def test_string_values_interned(self):
+        model = "".join(["interned-", "model"])
+        personality = "".join(["interned-", "personality"])
+        cfg = Config.from_dict({"llm": {"model": model}, "personality": personality})
+        assert cfg.llm.model is sys.intern("interned-model")
+        assert cfg.personality is sys.intern("interned-personality")
+
+    def test_sections_resolved_from_type_hints(self):
+        sections = radar.config.schema._CONFIG_SECTIONS
+        assert sections["llm"] is LLMConfig
+        assert sections["retry"] is RetryConfig
+        assert "system_prompt" not in sections
+        assert "watch_paths" not in sections
+
     def test_retry_partial_override(self):
         cfg = Config.from_dict({"retry": {"max_retries": 0}})
         assert cfg.retry.max_retries == 0
         assert cfg.retry.base_delay == 1.0  # default preserved
 
 
+class TestConfigFrozen:
+    """Config dataclasses are immutable; changes go through replace()."""
+
+    def test_assignment_raises(self):
+        cfg = Config()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            cfg.personality = "other"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            cfg.llm.model = "other"
+
+    def test_env_overrides_return_new_config(self, monkeypatch):
+        monkeypatch.setenv("RADAR_LLM_MODEL", "env-model")
+        original = Config()
+        cfg = _apply_env_overrides(original)
+        assert cfg is not original
+        assert original.llm.model == "qwen3:latest"
+        assert cfg.llm.model == "env-model"
+
+    def test_set_config_replaces_global(self, isolated_data_dir):
+        radar.config._config = None
+        cfg = dataclasses.replace(get_config(), personality="creative")
+        radar.config.set_config(cfg)
+        assert get_config() is cfg
+
+
+class TestConfigFromDictCached:
+    """Config.from_dict_cached reuses parses of identical data."""
+
+    def test_matches_from_dict(self):
+        data = {"llm": {"model": "cached-model"}, "web": {"port": 9001}}
+        assert Config.from_dict_cached(data) == Config.from_dict(data)
+
+    def test_returns_shared_instance(self):
+        data = {"llm": {"model": "shared-model"}}
+        assert Config.from_dict_cached(data) is Config.from_dict_cached(data)
+
+    def test_deprecation_warning_only_on_miss(self):
+        data = {"embedding_model": "cache-warn-embed"}
+        with pytest.warns(DeprecationWarning):
+            Config.from_dict_cached(data)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            cfg = Config.from_dict_cached(data)
+        assert cfg.embedding.model == "cache-warn-embed"
+
+    def test_changed_data_reparsed(self):
+        c1 = Config.from_dict_cached({"tools": {"extra_dirs": ["/a"]}})
+        c2 = Config.from_dict_cached({"tools": {"extra_dirs": ["/b"]}})
+        assert c1.tools.extra_dirs == ["/a"]
+        assert c2.tools.extra_dirs == ["/b"]
+
+    def test_equal_values_of_different_types_not_shared(self):
+        c1 = Config.from_dict_cached({"web": {"port": 9002}})
+        c2 = Config.from_dict_cached({"web": {"port": 9002.0}})
+        assert c1 is not c2
+        assert type(c2.web.port) is float
+
+
 # ── _apply_env_overrides ──────────────────────────────────────────
 
 
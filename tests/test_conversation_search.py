@@ -87,6 +87,57 @@ class TestConversationToText:
         lines = text.split("\n")
         assert any("20" in line and "-" in line for line in lines[:2])
 
+    def test_skips_blank_and_malformed_lines(self, isolated_data_dir):
+        from radar.config import get_data_paths
+        from radar.conversation_search import conversation_to_text
+
+        path = get_data_paths().conversations / "malformed.jsonl"
+        path.write_bytes(
+            b'{"role": "user", "content": "First", "timestamp": "2025-01-02T03:04:05"}\r\n'
+            b"\n   \n"
+            b"not json\n"
+            b"\xff\xfe\n"
+            b'{"role": "assistant", "content": "Second"}'
+        )
+
+        text = conversation_to_text("malformed")
+        assert text.startswith("# Conversation malforme - 2025-01-02")
+        assert "## User\nFirst" in text
+        assert "## Assistant\nSecond" in text
+
+    def test_exact_layout(self, isolated_data_dir):
+        from radar.config import get_data_paths
+        from radar.conversation_search import conversation_to_text
+
+        messages = [
+            {"role": "user", "content": "Weather?", "timestamp": "2025-03-04T05:06:07"},
+            {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {"function": {"name": "weather", "arguments": {"city": "Oslo", "days": 2}}},
+                    {"function": {"name": "time", "arguments": "now"}},
+                ],
+            },
+            {"role": "tool", "content": "raw"},
+            {"role": "assistant", "content": ""},
+            {"role": "assistant", "content": "Cold.", "tool_calls": [{"function": {"name": "x"}}]},
+        ]
+        path = get_data_paths().conversations / "layout-test.jsonl"
+        path.write_text("".join(json.dumps(m) + "\n" for m in messages))
+
+        assert conversation_to_text("layout-test") == (
+            "# Conversation layout-t - 2025-03-04\n"
+            "\n## User\nWeather?\n"
+            '\n## Assistant\n[Tool: weather(city="Oslo", days=2)]\n[Tool: time(now)]\n'
+            "\n## Assistant\n[Tool: x()]\nCold.\n"
+        )
+
+    def test_missing_conversation_returns_empty(self, isolated_data_dir):
+        from radar.conversation_search import conversation_to_text
+
+        assert conversation_to_text("does-not-exist") == ""
+
 
 # --- Indexing Tests ---
 
@@ -125,6 +176,35 @@ class TestConversationIndexing:
         assert result2["indexed"] == 0
         assert result2["skipped"] >= 1
 
+    def test_unchanged_files_skip_text_conversion(self, isolated_data_dir):
+        from radar.conversation_search import index_conversations
+
+        cid = create_conversation()
+        add_message(cid, "user", "Hello")
+        index_conversations()
+
+        with patch("radar.conversation_search.conversation_to_text") as mock_convert:
+            result = index_conversations()
+
+        mock_convert.assert_not_called()
+        assert result["skipped"] >= 1
+        assert result["indexed"] == 0
+
+    def test_batch_commit_counts_skipped_files(self, isolated_data_dir):
+        from radar.conversation_search import index_conversations
+
+        for _ in range(2):
+            cid = create_conversation()
+            add_message(cid, "user", "Hello")
+        create_conversation()  # Empty: no text to index
+        index_conversations()
+
+        with patch("radar.documents._commit_bulk_batch") as mock_batch:
+            result = index_conversations()
+
+        assert result["indexed"] == 0
+        assert [c.args[1] for c in mock_batch.call_args_list] == [1, 2, 3]
+
     def test_reindexes_on_change(self, isolated_data_dir):
         from radar.conversation_search import index_conversations
 
@@ -1,5 +1,6 @@
 """Tests for document indexing and search."""
 
+import dataclasses
 import sqlite3
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -83,6 +84,17 @@ class TestChunking:
         assert len(chunks) == 1
         assert chunks[0] == text
 
+    def test_chunk_preamble_and_heading_like_lines(self):
+        from radar.documents import chunk_markdown
+
+        text = "Intro text.\n#hashtag is not a heading\n# First\nBody one.\n####### Too deep\n## Second\nBody two."
+        chunks = chunk_markdown(text, chunk_size=45, overlap_pct=0.0)
+        assert chunks == [
+            "Intro text.\n#hashtag is not a heading",
+            "# First\nBody one.\n####### Too deep",
+            "## Second\nBody two.",
+        ]
+
 
 # --- Collection CRUD Tests ---
 
@@ -126,6 +138,21 @@ class TestCollectionCRUD:
         assert colls[0]["file_count"] == 0
         assert colls[0]["chunk_count"] == 0
 
+    def test_list_collections_counts_indexed_files(self, docs_dir, doc_conn, isolated_data_dir):
+        from radar.documents import create_collection, index_collection, list_collections
+
+        create_collection("docs", str(docs_dir), "*.md")
+        create_collection("empty", "/tmp/empty")
+        index_collection("docs")
+
+        colls = {c["name"]: c for c in list_collections()}
+        chunk_total = doc_conn.execute("SELECT COUNT(*) FROM document_chunks").fetchone()[0]
+        assert colls["docs"]["file_count"] == 3
+        assert colls["docs"]["chunk_count"] == chunk_total >= 3
+        assert colls["empty"]["file_count"] == 0
+        assert colls["empty"]["chunk_count"] == 0
+        assert [c["name"] for c in list_collections()] == ["docs", "empty"]
+
     def test_delete_collection(self, doc_conn, isolated_data_dir):
         from radar.documents import create_collection, delete_collection, get_collection
 
@@ -165,6 +192,86 @@ class TestCollectionCRUD:
         conn2.close()
 
 
+class TestConnections:
+    def test_adds_embedding_scale_to_legacy_chunks_table(self, isolated_data_dir):
+        import radar.documents as documents
+        from radar.config import get_data_paths
+
+        legacy = sqlite3.connect(get_data_paths().db_str)
+        legacy.execute(
+            "CREATE TABLE document_chunks (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "file_id INTEGER NOT NULL, chunk_index INTEGER NOT NULL, "
+            "content TEXT NOT NULL, embedding BLOB)"
+        )
+        legacy.commit()
+        legacy.close()
+
+        documents._initialized_dbs.clear()
+        conn = documents._get_connection()
+        try:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(document_chunks)")}
+        finally:
+            conn.close()
+        assert {"embedding_scale", "embedding_norm"} <= columns
+
+    def test_document_tables_initialized_once_per_db(self, isolated_data_dir):
+        import radar.documents as documents
+
+        with patch.object(
+            documents, "_init_document_tables", wraps=documents._init_document_tables
+        ) as mock_init:
+            documents._initialized_dbs.clear()
+            for _ in range(3):
+                documents._get_connection().close()
+
+        assert mock_init.call_count == 1
+
+    def test_foreign_key_lookups_use_indexes(self, doc_conn):
+        def plan(sql, params):
+            return " ".join(row[3] for row in doc_conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+
+        assert "idx_document_files_collection" in plan(
+            "SELECT id FROM document_files WHERE collection_id = ?", (1,)
+        )
+        assert "idx_document_chunks_file" in plan(
+            "DELETE FROM document_chunks WHERE file_id = ?", (1,)
+        )
+        assert "idx_document_chunks_embedded" in plan(
+            "SELECT dc.id, dc.embedding FROM document_chunks dc "
+            "JOIN document_files df ON dc.file_id = df.id "
+            "WHERE dc.embedding IS NOT NULL AND df.collection_id IN (?)",
+            (1,),
+        )
+
+    def test_base_schema_initialized_once_per_db(self, isolated_data_dir):
+        import radar.semantic as semantic
+
+        with patch.object(semantic, "_init_db", wraps=semantic._init_db) as mock_init:
+            semantic._initialized_dbs.clear()
+            for _ in range(3):
+                semantic._get_connection().close()
+
+        assert mock_init.call_count == 1
+
+    def test_hybrid_search_opens_one_connection(self, docs_dir, isolated_data_dir):
+        import radar.documents as documents
+
+        documents.create_collection("conn-test", str(docs_dir), "*.md")
+        documents.index_collection("conn-test")
+
+        with (
+            patch.object(
+                documents, "_get_connection", wraps=documents._get_connection
+            ) as mock_connect,
+            patch("radar.semantic.get_embeddings", side_effect=TestSemanticSearch._fake_embeddings),
+            patch("radar.semantic.is_embedding_available", return_value=True),
+        ):
+            results = documents.search_hybrid("SQLite storage", collection="conn-test")
+
+        assert mock_connect.call_count == 1
+        assert results and all(r["search_type"] == "hybrid" for r in results)
+
+
 # --- Indexing Tests ---
 
 
@@ -221,6 +328,100 @@ class TestIndexing:
         results2 = search_fts("Getting Started")
         assert len(results2) == 0
 
+    def test_index_file_embeds_chunks_in_one_call(self, docs_dir, doc_conn, isolated_data_dir):
+        from radar.documents import create_collection, index_file
+
+        coll_id = create_collection("test", str(docs_dir))
+        (docs_dir / "long.md").write_text(
+            "\n\n".join(f"# Section {i}\n\n" + "text " * 40 for i in range(5))
+        )
+
+        with patch(
+            "radar.semantic.get_embeddings",
+            side_effect=lambda texts: [[1.0, 0.0]] * len(texts),
+        ) as mock_embed:
+            chunks_created = index_file(doc_conn, coll_id, docs_dir / "long.md", chunk_size=250)
+        doc_conn.commit()
+
+        assert chunks_created > 1
+        mock_embed.assert_called_once()
+        assert len(mock_embed.call_args[0][0]) == chunks_created
+        missing = doc_conn.execute(
+            "SELECT COUNT(*) FROM document_chunks WHERE embedding IS NULL"
+        ).fetchone()[0]
+        assert missing == 0
+
+    def test_index_collection_embeds_files_concurrently(self, docs_dir, isolated_data_dir):
+        import threading
+
+        from radar.documents import _get_connection, create_collection, index_collection
+
+        create_collection("test", str(docs_dir), "*.md")
+        calling_threads = set()
+
+        def fake_embeddings(texts):
+            calling_threads.add(threading.get_ident())
+            if any("nested" in t for t in texts):
+                raise RuntimeError("provider down")
+            return [[1.0, 0.0]] * len(texts)
+
+        with patch("radar.semantic.get_embeddings", side_effect=fake_embeddings):
+            result = index_collection("test")
+
+        assert result["files_indexed"] == 3
+        assert threading.get_ident() not in calling_threads
+
+        conn = _get_connection()
+        try:
+            rows = conn.execute(
+                "SELECT df.file_path, dc.embedding IS NOT NULL AS embedded "
+                "FROM document_files df JOIN document_chunks dc ON dc.file_id = df.id "
+                "ORDER BY df.id"
+            ).fetchall()
+        finally:
+            conn.close()
+        # Written in sorted path order; a failed embedding still indexes the file
+        paths = [row["file_path"] for row in rows]
+        assert paths == sorted(paths)
+        assert {Path(row["file_path"]).name: bool(row["embedded"]) for row in rows} == {
+            "nested.md": False,
+            "notes.md": True,
+            "readme.md": True,
+        }
+
+    def test_file_hash_is_sha256_of_contents(self, tmp_path):
+        import hashlib
+
+        from radar.documents import _file_hash
+
+        path = tmp_path / "big.bin"
+        data = bytes(range(256)) * 5000  # spans several read blocks
+        path.write_bytes(data)
+        assert _file_hash(path) == hashlib.sha256(data).hexdigest()
+
+    def test_index_file_skips_hash_when_stat_unchanged(self, docs_dir, doc_conn, isolated_data_dir):
+        import os
+
+        import radar.documents as documents
+
+        coll_id = documents.create_collection("test", str(docs_dir))
+        readme = docs_dir / "readme.md"
+        documents.index_file(doc_conn, coll_id, readme, generate_embeddings=False)
+
+        with patch.object(documents, "_file_hash", wraps=documents._file_hash) as mock_hash:
+            assert documents.index_file(doc_conn, coll_id, readme, generate_embeddings=False) == 0
+            mock_hash.assert_not_called()
+
+            # Touched with the same content: hashed once, then stat is current again
+            st = readme.stat()
+            os.utime(readme, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            assert documents.index_file(doc_conn, coll_id, readme, generate_embeddings=False) == 0
+            assert documents.index_file(doc_conn, coll_id, readme, generate_embeddings=False) == 0
+            assert mock_hash.call_count == 1
+
+        assert documents.is_file_unchanged(doc_conn, readme)
+        assert not documents.is_file_unchanged(doc_conn, docs_dir / "notes.md")
+
     def test_index_file_reindexes_on_change(self, docs_dir, doc_conn, isolated_data_dir):
         from radar.documents import create_collection, index_file
 
@@ -272,6 +473,76 @@ class TestIndexing:
         result = index_collection("stale-test")
         assert result["files_removed"] == 1
 
+    def test_stale_removal_scoped_to_collection(self, docs_dir, isolated_data_dir):
+        from radar.documents import _get_connection, create_collection, index_collection
+
+        create_collection("all-md", str(docs_dir), "*.md")
+        create_collection("nested-only", str(docs_dir / "deep"), "*.md")
+        index_collection("all-md")
+        index_collection("nested-only")
+
+        (docs_dir / "notes.md").unlink()
+        assert index_collection("nested-only")["files_removed"] == 0
+        assert index_collection("all-md")["files_removed"] == 1
+
+        conn = _get_connection()
+        try:
+            paths = {
+                Path(row[0]).name
+                for row in conn.execute("SELECT file_path FROM document_files")
+            }
+            orphans = conn.execute(
+                "SELECT COUNT(*) FROM document_chunks "
+                "WHERE file_id NOT IN (SELECT id FROM document_files)"
+            ).fetchone()[0]
+        finally:
+            conn.close()
+        assert paths == {"readme.md", "nested.md"}
+        assert orphans == 0
+
+    def test_index_collection_commits_in_batches(self, docs_dir, isolated_data_dir, monkeypatch):
+        import radar.documents
+        from radar.documents import _get_connection, create_collection, index_collection
+
+        monkeypatch.setattr(radar.documents, "INDEX_COMMIT_BATCH", 1)
+        create_collection("batch-test", str(docs_dir), "*.md")
+
+        result = index_collection("batch-test")
+        assert result["files_indexed"] == 3
+
+        conn = _get_connection()
+        try:
+            files = conn.execute("SELECT COUNT(*) FROM document_files").fetchone()[0]
+            chunks = conn.execute("SELECT COUNT(*) FROM document_chunks").fetchone()[0]
+        finally:
+            conn.close()
+        assert files == 3
+        assert chunks == result["chunks_created"]
+
+    def test_first_index_rebuilds_fts_and_restores_triggers(self, docs_dir, isolated_data_dir):
+        from radar.documents import _get_connection, create_collection, index_collection, search_fts
+
+        create_collection("fts-bulk", str(docs_dir), "*.md")
+        index_collection("fts-bulk")
+
+        conn = _get_connection()
+        try:
+            triggers = {
+                row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='trigger'"
+                )
+            }
+        finally:
+            conn.close()
+        assert {"document_chunks_ai", "document_chunks_ad", "document_chunks_au"} <= triggers
+        assert search_fts("deeply nested")
+
+        # Incremental re-index goes through the restored triggers
+        (docs_dir / "notes.md").write_text("# Notes\n\nNow mentions zeppelins.")
+        index_collection("fts-bulk")
+        assert search_fts("zeppelins")
+        assert not search_fts("SQLite storage")
+
     def test_index_nonexistent_collection(self, isolated_data_dir):
         from radar.documents import index_collection
 
@@ -286,6 +557,72 @@ class TestIndexing:
             index_collection("bad-path")
 
 
+# --- Embedding Cache Tests ---
+
+
+class TestEmbeddingCache:
+    def test_repeated_texts_fetched_once(self, isolated_data_dir):
+        from radar.semantic import get_embedding_cached, get_embeddings_cached
+
+        with patch(
+            "radar.semantic.get_embeddings",
+            side_effect=lambda texts: [[float(len(t))] for t in texts],
+        ) as mock_embed:
+            first = get_embeddings_cached(["alpha", "beta"])
+            second = get_embeddings_cached(["beta", "gamma", "alpha"])
+            query = get_embedding_cached("gamma")
+
+        assert first == [[5.0], [4.0]]
+        assert second == [[4.0], [5.0], [5.0]]
+        assert query == [5.0]
+        assert [c[0][0] for c in mock_embed.call_args_list] == [["alpha", "beta"], ["gamma"]]
+
+    def test_model_change_misses_cache(self, isolated_data_dir):
+        import radar.config
+        from radar.config import get_config, set_config
+        from radar.semantic import get_embeddings_cached
+
+        with patch(
+            "radar.semantic.get_embeddings",
+            side_effect=lambda texts: [[1.0] for _ in texts],
+        ) as mock_embed:
+            get_embeddings_cached(["same text"])
+            config = get_config()
+            set_config(dataclasses.replace(
+                config, embedding=dataclasses.replace(config.embedding, model="other-model")
+            ))
+            get_embeddings_cached(["same text"])
+            radar.config._config = None
+
+        assert mock_embed.call_count == 2
+
+    def test_persistent_cache_survives_process_cache_clear(
+        self, docs_dir, doc_conn, isolated_data_dir
+    ):
+        from radar.documents import create_collection, index_file
+        from radar.semantic import clear_embedding_cache
+
+        coll_id = create_collection("test", str(docs_dir))
+        (docs_dir / "first.md").write_text("# Shared\n\nIdentical content in both files.")
+        (docs_dir / "second.md").write_text("# Shared\n\nIdentical content in both files.")
+
+        with patch(
+            "radar.semantic.get_embeddings",
+            side_effect=lambda texts: [[1.0, 0.0] for _ in texts],
+        ) as mock_embed:
+            index_file(doc_conn, coll_id, docs_dir / "first.md")
+            clear_embedding_cache()
+            index_file(doc_conn, coll_id, docs_dir / "second.md")
+        doc_conn.commit()
+
+        assert mock_embed.call_count == 1
+        assert doc_conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0] == 1
+        embedded = doc_conn.execute(
+            "SELECT COUNT(*) FROM document_chunks WHERE embedding IS NOT NULL"
+        ).fetchone()[0]
+        assert embedded == 2
+
+
 # --- FTS Search Tests ---
 
 
@@ -332,6 +669,214 @@ class TestFTSSearch:
         assert results == []
 
 
+# --- Semantic Search Tests ---
+
+
+class TestSemanticSearch:
+    @staticmethod
+    def _fake_embeddings(texts):
+        # Two axes: "storage" vs everything else
+        return [[1.0, 0.0] if "SQLite" in t or "storage" in t else [0.0, 1.0] for t in texts]
+
+    @pytest.fixture(autouse=True)
+    def indexed_docs(self, docs_dir, isolated_data_dir):
+        from radar.documents import create_collection, index_collection
+
+        create_collection("semantic-test", str(docs_dir), "*.md")
+        with patch("radar.semantic.get_embeddings", side_effect=self._fake_embeddings):
+            index_collection("semantic-test")
+
+    def test_semantic_ranks_most_similar_first(self):
+        from radar.documents import search_semantic
+
+        with patch("radar.semantic.get_embeddings", side_effect=self._fake_embeddings):
+            results = search_semantic("storage", limit=2)
+
+        assert len(results) == 2
+        assert "SQLite" in results[0]["content"]
+        assert results[0]["similarity"] == pytest.approx(1.0)
+        assert results[1]["similarity"] == pytest.approx(0.0)
+        assert results[0]["file_path"].endswith("notes.md")
+        assert results[0]["collection"] == "semantic-test"
+        assert results[0]["search_type"] == "semantic"
+
+    def test_chunks_store_int8_embeddings(self):
+        from radar.documents import _get_connection
+
+        conn = _get_connection()
+        try:
+            rows = conn.execute(
+                "SELECT embedding, embedding_scale, embedding_norm FROM document_chunks"
+            ).fetchall()
+        finally:
+            conn.close()
+        assert rows
+        for row in rows:
+            assert len(row["embedding"]) == 2  # one byte per dimension
+            assert row["embedding_scale"] == pytest.approx(1 / 127)
+            assert row["embedding_norm"] == pytest.approx(127.0)
+
+    def test_search_uses_stored_norms(self):
+        from radar.documents import search_semantic
+
+        with (
+            patch("radar.semantic.get_embeddings", side_effect=self._fake_embeddings),
+            patch("radar.semantic.math.hypot", wraps=__import__("math").hypot) as mock_hypot,
+        ):
+            search_semantic("storage", limit=2)
+
+        mock_hypot.assert_called_once()  # the query vector only
+
+    def test_legacy_float32_rows_still_searchable(self):
+        from radar.documents import _get_connection, search_semantic
+        from radar.semantic import _serialize_embedding
+
+        conn = _get_connection()
+        try:
+            chunk_id = conn.execute(
+                "SELECT id FROM document_chunks WHERE content LIKE '%Nested%'"
+            ).fetchone()[0]
+            conn.execute(
+                "UPDATE document_chunks SET embedding = ?, embedding_scale = NULL, "
+                "embedding_norm = NULL WHERE id = ?",
+                (_serialize_embedding([0.9, 0.1]), chunk_id),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        with patch("radar.semantic.get_embeddings", side_effect=self._fake_embeddings):
+            results = search_semantic("storage", limit=2)
+
+        assert results[1]["chunk_id"] == chunk_id
+        assert results[1]["similarity"] == pytest.approx(0.9 / (0.82 ** 0.5))
+
+    def test_quantize_embedding_round_trip(self):
+        from radar.semantic import _decode_embedding, _quantize_embedding
+
+        data, scale = _quantize_embedding([0.5, -0.25, 0.0, 0.125])
+        assert len(data) == 4
+        decoded = [x * scale for x in _decode_embedding(data, scale)]
+        assert decoded == pytest.approx([0.5, -0.25, 0.0, 0.125], abs=0.5 / 127)
+        assert _quantize_embedding([0.0, 0.0]) == (b"\x00\x00", 0.0)
+
+    def test_top_similar_keeps_best_in_order(self):
+        from radar.semantic import top_similar
+
+        rows = [
+            ("a", [0.0, 1.0], 1.0),
+            ("b", [1.0, 0.0], None),
+            ("c", [1.0, 1.0], 2 ** 0.5),
+            ("d", [0.0, 0.0], None),
+        ]
+        top = top_similar([2.0, 0.0], iter(rows), 2)
+
+        assert [key for _, key in top] == ["b", "c"]
+        assert top[1][0] == pytest.approx(2 ** -0.5)
+
+
+class TestAnnIndex:
+    def test_small_collection_has_no_index(self, docs_dir, isolated_data_dir):
+        from radar import ann_index
+        from radar.documents import create_collection, index_collection
+
+        coll_id = create_collection("small", str(docs_dir), "*.md")
+        with patch("radar.semantic.get_embeddings", side_effect=TestSemanticSearch._fake_embeddings):
+            index_collection("small")
+
+        assert list(ann_index.index_path(coll_id, 2).parent.glob("*.hnsw")) == []
+
+    def test_missing_hnswlib_falls_back_to_scan(self, docs_dir, isolated_data_dir):
+        from radar import ann_index
+        from radar.documents import create_collection, index_collection, search_semantic
+
+        create_collection("fallback", str(docs_dir), "*.md")
+        with (
+            patch.object(ann_index, "_import_hnswlib", return_value=None),
+            patch.object(ann_index, "ANN_MIN_CHUNKS", 1),
+            patch("radar.semantic.get_embeddings", side_effect=TestSemanticSearch._fake_embeddings),
+        ):
+            index_collection("fallback")
+            results = search_semantic("storage", collection="fallback", limit=1)
+
+        assert "SQLite" in results[0]["content"]
+
+    def test_search_uses_hnsw_index(self, docs_dir, isolated_data_dir):
+        pytest.importorskip("hnswlib")
+        from radar import ann_index
+        from radar.documents import (
+            create_collection,
+            delete_collection,
+            index_collection,
+            search_semantic,
+        )
+
+        coll_id = create_collection("ann", str(docs_dir), "*.md")
+        with (
+            patch.object(ann_index, "ANN_MIN_CHUNKS", 1),
+            patch("radar.semantic.get_embeddings", side_effect=TestSemanticSearch._fake_embeddings),
+        ):
+            index_collection("ann")
+            assert ann_index.index_path(coll_id, 2).exists()
+            with patch("radar.semantic.top_similar") as mock_scan:
+                results = search_semantic("storage", collection="ann", limit=1)
+
+        mock_scan.assert_not_called()
+        assert "SQLite" in results[0]["content"]
+        assert results[0]["similarity"] == pytest.approx(1.0)
+
+        delete_collection("ann")
+        assert not ann_index.index_path(coll_id, 2).exists()
+
+    def test_concurrent_queries_keep_their_search_width(self, isolated_data_dir):
+        import threading
+        import time
+        from types import SimpleNamespace
+
+        from radar import ann_index
+
+        class FakeIndex:
+            def __init__(self, space, dim):
+                self.ef = None
+
+            def load_index(self, path):
+                pass
+
+            def get_current_count(self):
+                return 1000
+
+            def set_ef(self, ef):
+                self.ef = ef
+
+            def knn_query(self, vectors, k):
+                ef = self.ef
+                time.sleep(0.01)  # Give other threads a chance to call set_ef
+                assert self.ef == ef == max(k * 4, 50)
+                return [list(range(k))], [[0.0] * k]
+
+        path = ann_index.index_path(7, 2)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+        errors = []
+
+        def query(k):
+            try:
+                ann_index.query_index(7, [1.0, 0.0], k)
+            except AssertionError as e:
+                errors.append(e)
+
+        fake_hnswlib = SimpleNamespace(Index=FakeIndex)
+        with patch.object(ann_index, "_import_hnswlib", return_value=fake_hnswlib):
+            threads = [threading.Thread(target=query, args=(k,)) for k in (5, 50, 100) * 3]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        ann_index.remove_index(7)
+
+        assert errors == []
+
+
 # --- Hybrid Search Tests ---
 
 
@@ -360,6 +905,71 @@ class TestHybridSearch:
         # All should have search_type "hybrid"
         assert all(r["search_type"] == "hybrid" for r in results)
 
+    def test_hybrid_rrf_fusion(self):
+        import radar.documents as documents
+
+        fts = [{"chunk_id": 1, "bm25_rank": -2.0}, {"chunk_id": 2, "bm25_rank": -1.0}]
+        semantic = [{"chunk_id": 3, "similarity": 0.9}, {"chunk_id": 1, "similarity": 0.8}]
+        with (
+            patch.object(documents, "search_fts", return_value=fts),
+            patch.object(documents, "search_semantic", return_value=semantic),
+            patch("radar.semantic.is_embedding_available", return_value=True),
+        ):
+            results = documents.search_hybrid("fusion", limit=2)
+
+        assert [r["chunk_id"] for r in results] == [1, 3]
+        assert results[0]["score"] == pytest.approx(0.4 / 61 + 0.6 / 62)
+        assert results[0]["bm25_rank"] == -2.0  # fields from the first list it appeared in
+        assert results[1]["score"] == pytest.approx(0.6 / 61)
+        assert all(r["search_type"] == "hybrid" for r in results)
+
+    def test_hybrid_caches_repeated_queries(self, docs_dir):
+        import radar.documents as documents
+
+        with (
+            patch("radar.semantic.is_embedding_available", return_value=False),
+            patch.object(documents, "search_fts", wraps=documents.search_fts) as mock_fts,
+        ):
+            first = documents.search_hybrid("documentation")
+            first[0]["content"] = "mutated by caller"
+            second = documents.search_hybrid("documentation")
+            assert mock_fts.call_count == 1
+            assert second[0]["content"] != "mutated by caller"
+
+            documents.search_hybrid("documentation", limit=3)
+            assert mock_fts.call_count == 2
+
+            # Re-indexing changed files invalidates cached results
+            (docs_dir / "extra.md").write_text("# Extra\n\nMore documentation.")
+            documents.index_collection("hybrid-test")
+            third = documents.search_hybrid("documentation")
+            assert mock_fts.call_count == 3
+            assert len(third) > len(second)
+
+    def test_hybrid_cache_expires(self, monkeypatch):
+        import radar.documents as documents
+
+        with (
+            patch("radar.semantic.is_embedding_available", return_value=False),
+            patch.object(documents, "search_fts", wraps=documents.search_fts) as mock_fts,
+        ):
+            documents.search_hybrid("documentation")
+            monkeypatch.setattr(documents, "_SEARCH_CACHE_TTL", 0.0)
+            documents.search_hybrid("documentation")
+        assert mock_fts.call_count == 2
+
+    def test_hybrid_does_not_cache_failed_semantic_search(self):
+        import radar.documents as documents
+
+        with (
+            patch("radar.semantic.is_embedding_available", return_value=True),
+            patch.object(documents, "search_semantic", side_effect=RuntimeError("down")),
+            patch.object(documents, "search_fts", wraps=documents.search_fts) as mock_fts,
+        ):
+            assert documents.search_hybrid("documentation")
+            documents.search_hybrid("documentation")
+        assert mock_fts.call_count == 2
+
 
 # --- Tool Tests ---
 
@@ -385,10 +995,12 @@ class TestSearchDocumentsTool:
         assert "No results" in result
 
     def test_search_documents_disabled(self, isolated_data_dir):
-        from radar.config import get_config
+        from radar.config import get_config, set_config
 
         config = get_config()
-        config.documents.enabled = False
+        set_config(dataclasses.replace(
+            config, documents=dataclasses.replace(config.documents, enabled=False)
+        ))
 
         from radar.tools.search_documents import search_documents
 
@@ -440,10 +1052,12 @@ class TestManageDocumentsTool:
         assert "1 collections" in result
 
     def test_manage_disabled(self, isolated_data_dir):
-        from radar.config import get_config
+        from radar.config import get_config, set_config
 
         config = get_config()
-        config.documents.enabled = False
+        set_config(dataclasses.replace(
+            config, documents=dataclasses.replace(config.documents, enabled=False)
+        ))
 
         from radar.tools.manage_documents import manage_documents
 
@@ -473,10 +1087,12 @@ class TestRecallIntegration:
         create_collection("recall-test", str(docs_dir), "*.md")
         index_collection("recall-test")
 
-        from radar.config import get_config
+        from radar.config import get_config, set_config
 
         config = get_config()
-        config.documents.enabled = True
+        set_config(dataclasses.replace(
+            config, documents=dataclasses.replace(config.documents, enabled=True)
+        ))
 
         # Patch at the import location in the recall module (top-level imports)
         with patch("radar.tools.recall.is_embedding_available", return_value=True), \
@@ -496,10 +1112,12 @@ class TestRecallIntegration:
         assert "Document result text" in result
 
     def test_recall_works_without_documents(self, isolated_data_dir):
-        from radar.config import get_config
+        from radar.config import get_config, set_config
 
         config = get_config()
-        config.documents.enabled = False
+        set_config(dataclasses.replace(
+            config, documents=dataclasses.replace(config.documents, enabled=False)
+        ))
 
         with patch("radar.tools.recall.is_embedding_available", return_value=True), \
              patch("radar.tools.recall.search_memories", return_value=[]):
@@ -7,7 +7,13 @@ from unittest.mock import patch, MagicMock
 import pytest
 from click.testing import CliRunner
 
-from radar.export import export_json, export_markdown
+from radar.export import (
+    export_json,
+    export_markdown,
+    iter_export_json,
+    iter_export_markdown,
+    write_export_markdown,
+)
 
 
 # ---- Fixtures ----
@@ -109,6 +115,48 @@ class TestExportJson:
         with pytest.raises(ValueError, match="Conversation not found"):
             export_json("nonexistent-conv-id")
 
+    def test_matches_json_dumps_of_messages(self, sample_conversation):
+        from radar.memory import get_messages
+
+        expected = [
+            {k: v for k, v in msg.items() if k != "id"}
+            for msg in get_messages(sample_conversation)
+        ]
+        assert export_json(sample_conversation) == json.dumps(expected, indent=2)
+
+    def test_empty_conversation_matches_json_dumps(self, empty_conversation):
+        assert export_json(empty_conversation) == json.dumps([], indent=2)
+
+    def test_stdlib_fallback_without_orjson(self, sample_conversation, monkeypatch):
+        import radar.export
+
+        expected = export_json(sample_conversation)
+        monkeypatch.setattr(radar.export, "_orjson", None)
+        assert json.loads(export_json(sample_conversation)) == json.loads(expected)
+
+    def test_orjson_output_matches_stdlib_layout(self, sample_conversation, monkeypatch):
+        import radar.export
+
+        orjson = pytest.importorskip("orjson")
+        monkeypatch.setattr(radar.export, "_orjson", orjson)
+        fast = export_json(sample_conversation)
+        monkeypatch.setattr(radar.export, "_orjson", None)
+        assert fast == export_json(sample_conversation)
+
+    def test_orjson_falls_back_for_wide_integers(self, monkeypatch):
+        import radar.export
+
+        orjson = pytest.importorskip("orjson")
+        monkeypatch.setattr(radar.export, "_orjson", orjson)
+        assert radar.export._dumps_indented({"n": 2**70}) == json.dumps({"n": 2**70}, indent=2)
+
+    def test_iter_yields_one_chunk_per_message(self, sample_conversation):
+        from radar.memory import get_messages
+
+        chunks = list(iter_export_json(sample_conversation))
+        assert len(chunks) == len(get_messages(sample_conversation)) + 2
+        assert "".join(chunks) == export_json(sample_conversation)
+
 
 # ---- TestExportMarkdown ----
 
@@ -149,6 +197,58 @@ class TestExportMarkdown:
         with pytest.raises(ValueError, match="Conversation not found"):
             export_markdown("nonexistent-conv-id")
 
+    def test_iter_chunks_join_to_full_export(self, sample_conversation):
+        chunks = list(iter_export_markdown(sample_conversation))
+        assert len(chunks) > 2
+        assert "".join(chunks) == export_markdown(sample_conversation)
+        assert export_markdown(sample_conversation).endswith("\n")
+
+    def test_write_to_file_object(self, sample_conversation, tmp_path):
+        out_path = tmp_path / "export.md"
+        with open(out_path, "w") as f:
+            write_export_markdown(sample_conversation, f)
+        assert out_path.read_text() == export_markdown(sample_conversation)
+
+    def test_every_line_is_newline_terminated(self, sample_conversation):
+        result = export_markdown(sample_conversation)
+        assert result.endswith("\n")
+        assert not result.endswith("\n\n")
+
+    def test_repeated_tool_args_serialized_once(self):
+        from radar.export import _dump_args
+
+        cache: dict[str, str] = {}
+        first = _dump_args({"location": "Seattle"}, cache)
+        assert _dump_args({"location": "Seattle"}, cache) is first
+        assert first == json.dumps({"location": "Seattle"}, indent=2)
+        # Values that compare equal but serialize differently stay distinct
+        assert _dump_args({"n": 1}, cache) == '{\n  "n": 1\n}'
+        assert _dump_args({"n": True}, cache) == '{\n  "n": true\n}'
+        assert _dump_args({"n": 1.0}, cache) == '{\n  "n": 1.0\n}'
+
+    def test_iter_missing_conversation_raises_before_iterating(self, conversations_dir):
+        with pytest.raises(ValueError, match="Conversation not found"):
+            iter_export_markdown("nonexistent-conv-id")
+
+    def test_first_message_yielded_before_file_is_read(self, sample_conversation):
+        import radar.memory
+
+        read = []
+        real_iter_messages = radar.memory.iter_messages
+
+        def counting_iter_messages(conversation_id):
+            for msg in real_iter_messages(conversation_id):
+                read.append(msg)
+                yield msg
+
+        with patch("radar.memory.iter_messages", counting_iter_messages):
+            chunks = iter_export_markdown(sample_conversation)
+            next(chunks)  # Header
+            first = next(chunks)
+            assert "What is the weather?" in first
+            assert len(read) == 1
+            chunks.close()
+
 
 # ---- TestExportCli ----
 
@@ -158,7 +258,7 @@ class TestExportCli:
         from radar.cli import cli
 
         runner = CliRunner()
-        with patch("radar.export.export_json", return_value='[{"role": "user"}]') as mock_export:
+        with patch("radar.export.iter_export_json", return_value=iter(['[{"role": "user"}]'])) as mock_export:
             result = runner.invoke(cli, ["export", sample_conversation, "-f", "json"])
         assert result.exit_code == 0
         assert '[{"role": "user"}]' in result.output
@@ -168,7 +268,7 @@ class TestExportCli:
         from radar.cli import cli
 
         runner = CliRunner()
-        with patch("radar.export.export_markdown", return_value="# Conversation\n") as mock_export:
+        with patch("radar.export.iter_export_markdown", return_value=iter(["# Conversation", "\n"])) as mock_export:
             result = runner.invoke(cli, ["export", sample_conversation, "-f", "markdown"])
         assert result.exit_code == 0
         assert "# Conversation" in result.output
@@ -179,7 +279,7 @@ class TestExportCli:
 
         output_file = tmp_path / "export.json"
         runner = CliRunner()
-        with patch("radar.export.export_json", return_value='[]'):
+        with patch("radar.export.iter_export_json", return_value=iter(["[", "]"])):
             result = runner.invoke(cli, ["export", sample_conversation, "-o", str(output_file)])
         assert result.exit_code == 0
         assert "Exported to" in result.output
@@ -189,7 +289,7 @@ class TestExportCli:
         from radar.cli import cli
 
         runner = CliRunner()
-        with patch("radar.export.export_json", side_effect=ValueError("Conversation not found: bad-id")):
+        with patch("radar.export.iter_export_json", side_effect=ValueError("Conversation not found: bad-id")):
             result = runner.invoke(cli, ["export", "bad-id"])
         assert result.exit_code == 1
         assert "Error" in result.output
@@ -209,7 +309,7 @@ class TestExportWebRoute:
         return patch("radar.web._requires_auth", return_value=(False, ""))
 
     def test_json_export_returns_200(self, client, sample_conversation):
-        with self._no_auth(), patch("radar.export.export_json", return_value='[]'):
+        with self._no_auth(), patch("radar.export.iter_export_json", return_value=iter(["[", "]"])):
             resp = client.get(f"/api/export/{sample_conversation}?format=json")
         assert resp.status_code == 200
         assert "content-disposition" in resp.headers
@@ -217,9 +317,10 @@ class TestExportWebRoute:
         assert ".json" in resp.headers["content-disposition"]
 
     def test_markdown_export_returns_200(self, client, sample_conversation):
-        with self._no_auth(), patch("radar.export.export_markdown", return_value="# Conv\n"):
+        with self._no_auth(), patch("radar.export.iter_export_markdown", return_value=iter(["# Conv", "\n"])):
             resp = client.get(f"/api/export/{sample_conversation}?format=markdown")
         assert resp.status_code == 200
+        assert resp.text == "# Conv\n"
         assert ".md" in resp.headers["content-disposition"]
 
     def test_invalid_format_returns_400(self, client):
@@ -228,11 +329,11 @@ class TestExportWebRoute:
         assert resp.status_code == 400
 
     def test_missing_conversation_returns_404(self, client):
-        with self._no_auth(), patch("radar.export.export_json", side_effect=ValueError("not found")):
+        with self._no_auth(), patch("radar.export.iter_export_json", side_effect=ValueError("not found")):
             resp = client.get("/api/export/missing-id?format=json")
         assert resp.status_code == 404
 
     def test_content_disposition_uses_id_prefix(self, client, sample_conversation):
-        with self._no_auth(), patch("radar.export.export_json", return_value='[]'):
+        with self._no_auth(), patch("radar.export.iter_export_json", return_value=iter(["[", "]"])):
             resp = client.get(f"/api/export/{sample_conversation}?format=json")
         assert f"conversation-{sample_conversation[:8]}" in resp.headers["content-disposition"]
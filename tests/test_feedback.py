@@ -3,11 +3,16 @@
 import pytest
 from radar.feedback import (
     store_feedback,
+    store_feedback_many,
     get_unprocessed_feedback,
     get_all_feedback,
+    iter_all_feedback,
+    iter_pending_suggestions,
+    iter_unprocessed_feedback,
     mark_feedback_processed,
     get_feedback_summary,
     store_suggestion,
+    store_suggestions_many,
     get_pending_suggestions,
     get_suggestion,
     approve_suggestion,
@@ -96,6 +101,30 @@ class TestFeedback:
         assert summary["positive"] >= 2
         assert summary["negative"] >= 1
 
+    def test_get_feedback_summary_counts_unprocessed(self):
+        """Summary counts change exactly with new and processed feedback."""
+        before = get_feedback_summary()
+        fb_id = store_feedback("test-conv-sum-1", 0, "positive")
+        store_feedback("test-conv-sum-2", 0, "negative")
+        mark_feedback_processed([fb_id])
+
+        after = get_feedback_summary()
+        assert after["total"] == before["total"] + 2
+        assert after["positive"] == before["positive"] + 1
+        assert after["negative"] == before["negative"] + 1
+        assert after["unprocessed"] == before["unprocessed"] + 1
+
+    def test_feedback_summary_uses_covering_index(self):
+        conn = _get_connection()
+        plan = " ".join(
+            row[3] for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT sentiment, processed, COUNT(*) "
+                "FROM feedback GROUP BY sentiment, processed"
+            )
+        )
+        conn.close()
+        assert "COVERING INDEX idx_feedback_summary" in plan
+
     def test_delete_feedback(self):
         """Test deleting feedback."""
         fb_id = store_feedback("test-conv-10", 0, "positive")
@@ -168,6 +197,129 @@ class TestSuggestions:
         assert "already" in message.lower()
 
 
+class TestApproveSuggestion:
+    """Tests for applying approved suggestions to personality files."""
+
+    def test_add_appends_after_trimmed_content(self, personalities_dir):
+        path = personalities_dir / "test-approve.md"
+        path.write_text("# Test\n\nBe helpful.\n\n  \n")
+        sug_id = store_suggestion("test-approve", "add", "Be concise.")
+
+        success, _ = approve_suggestion(sug_id)
+        assert success is True
+        assert path.read_text() == "# Test\n\nBe helpful.\n\nBe concise.\n"
+        assert get_suggestion(sug_id)["status"] == "approved"
+
+    def test_add_trims_whitespace_spanning_read_chunks(self, personalities_dir, monkeypatch):
+        import radar.feedback
+
+        monkeypatch.setattr(radar.feedback, "_READ_CHUNK", 4)
+        path = personalities_dir / "test-approve.md"
+        path.write_text("# Test" + " \n" * 9)
+        sug_id = store_suggestion("test-approve", "add", "More.")
+
+        approve_suggestion(sug_id)
+        assert path.read_text() == "# Test\n\nMore.\n"
+
+    def test_add_keeps_crlf_line_endings(self, personalities_dir):
+        path = personalities_dir / "test-approve.md"
+        path.write_bytes(b"# Test\r\n\r\nBe helpful.\r\n\r\n")
+        sug_id = store_suggestion("test-approve", "add", "Be concise.\nBe kind.")
+
+        approve_suggestion(sug_id)
+        assert path.read_bytes() == b"# Test\r\n\r\nBe helpful.\r\n\r\nBe concise.\r\nBe kind.\r\n"
+
+    def test_add_trims_only_ascii_whitespace(self, personalities_dir):
+        path = personalities_dir / "test-approve.md"
+        path.write_text("# Test\n\nBe helpful.\u00a0\n \n", encoding="utf-8")
+        sug_id = store_suggestion("test-approve", "add", "More.")
+
+        approve_suggestion(sug_id)
+        assert path.read_text(encoding="utf-8") == "# Test\n\nBe helpful.\u00a0\n\nMore.\n"
+
+    def test_add_to_empty_file(self, personalities_dir):
+        path = personalities_dir / "test-approve.md"
+        path.write_text("")
+        sug_id = store_suggestion("test-approve", "add", "First.")
+
+        approve_suggestion(sug_id)
+        assert path.read_text() == "\n\nFirst.\n"
+
+    def test_modify_keeps_front_matter(self, personalities_dir, monkeypatch):
+        import radar.feedback
+
+        monkeypatch.setattr(radar.feedback, "_READ_CHUNK", 4)
+        path = personalities_dir / "test-approve.md"
+        path.write_text("---\nmodel: test\n---\n# Old Body\n")
+        sug_id = store_suggestion("test-approve", "modify", "# New Body\n")
+
+        approve_suggestion(sug_id)
+        assert path.read_text() == "---\nmodel: test\n---\n# New Body\n"
+        assert [p.name for p in personalities_dir.iterdir()] == ["test-approve.md"]
+
+    def test_modify_keeps_symlink_and_mode(self, personalities_dir, tmp_path):
+        import os
+        import stat
+
+        target = tmp_path / "shared.md"
+        target.write_text("---\nmodel: test\n---\n# Old Body\n")
+        target.chmod(0o640)
+        link = personalities_dir / "test-approve.md"
+        link.symlink_to(target)
+        sug_id = store_suggestion("test-approve", "modify", "# New Body\n")
+
+        approve_suggestion(sug_id)
+        assert link.is_symlink()
+        assert target.read_text() == "---\nmodel: test\n---\n# New Body\n"
+        assert stat.S_IMODE(os.stat(target).st_mode) == 0o640
+
+    def test_modify_with_own_front_matter_skips_read(self, personalities_dir, monkeypatch):
+        import radar.feedback
+
+        def fail(path):
+            raise AssertionError("front matter should not be read")
+
+        monkeypatch.setattr(radar.feedback, "_read_front_matter", fail)
+        path = personalities_dir / "test-approve.md"
+        path.write_text("---\nmodel: old\n---\n# Old\n")
+        sug_id = store_suggestion("test-approve", "modify", "---\nmodel: new\n---\n# New\n")
+
+        approve_suggestion(sug_id)
+        assert path.read_text() == "---\nmodel: new\n---\n# New\n"
+
+    def test_modify_without_closing_front_matter(self, personalities_dir):
+        path = personalities_dir / "test-approve.md"
+        path.write_text("---\nmodel: test\n# No closing\n")
+        sug_id = store_suggestion("test-approve", "modify", "# New Body\n")
+
+        approve_suggestion(sug_id)
+        assert path.read_text() == "# New Body\n"
+
+    def test_remove_deletes_content(self, personalities_dir):
+        path = personalities_dir / "test-approve.md"
+        path.write_text("# Test\n\nBe verbose.\nBe kind.\n")
+        sug_id = store_suggestion("test-approve", "remove", "Be verbose.\n")
+
+        approve_suggestion(sug_id)
+        assert path.read_text() == "# Test\n\nBe kind.\n"
+
+    def test_read_front_matter_matches_preserve(self, tmp_path):
+        from radar.feedback import _preserve_front_matter, _read_front_matter
+
+        for text in [
+            "---\nmodel: a\n---\nbody",
+            "# no front matter",
+            "---\nunclosed",
+            "--",
+            "",
+        ]:
+            path = tmp_path / "p.md"
+            path.write_text(text)
+            assert _preserve_front_matter(_read_front_matter(path), "# New") == (
+                _preserve_front_matter(text, "# New")
+            )
+
+
 class TestTools:
     """Tests for the feedback-related tools."""
 
@@ -206,3 +358,153 @@ class TestTools:
 
         result = analyze_feedback()
         assert "insufficient" in result.lower() or "need at least" in result.lower()
+
+
+class TestIterators:
+    """Tests for the streaming row iterators."""
+
+    def test_iter_unprocessed_matches_list(self):
+        store_feedback("test-iter-1", 0, "positive")
+        store_feedback("test-iter-2", 0, "negative")
+
+        it = iter_unprocessed_feedback()
+        assert not isinstance(it, list)
+        assert list(it) == get_unprocessed_feedback()
+
+    def test_iter_all_respects_limit(self):
+        for i in range(3):
+            store_feedback(f"test-iter-{i}", i, "positive")
+        assert len(list(iter_all_feedback(limit=2))) == 2
+        assert list(iter_all_feedback()) == get_all_feedback()
+
+    def test_iter_pending_suggestions_matches_list(self):
+        store_suggestion("test-iter", "add", "Be brief")
+        assert list(iter_pending_suggestions()) == get_pending_suggestions()
+
+
+class TestBulkStore:
+    """Tests for the executemany-based bulk store helpers."""
+
+    def test_store_feedback_many(self):
+        count = store_feedback_many([
+            {"conversation_id": "test-bulk-1", "message_index": 0, "sentiment": "positive"},
+            {
+                "conversation_id": "test-bulk-2",
+                "message_index": 3,
+                "sentiment": "negative",
+                "user_comment": "Too long",
+            },
+        ])
+        assert count == 2
+
+        stored = {f["conversation_id"]: f for f in get_all_feedback()}
+        assert stored["test-bulk-1"]["sentiment"] == "positive"
+        assert stored["test-bulk-2"]["message_index"] == 3
+        assert stored["test-bulk-2"]["user_comment"] == "Too long"
+
+    def test_store_feedback_many_rejects_batch_with_invalid_sentiment(self):
+        with pytest.raises(ValueError):
+            store_feedback_many([
+                {"conversation_id": "test-bulk-3", "message_index": 0, "sentiment": "positive"},
+                {"conversation_id": "test-bulk-4", "message_index": 0, "sentiment": "neutral"},
+            ])
+        assert not [f for f in get_all_feedback() if f["conversation_id"].startswith("test-bulk")]
+
+    def test_store_feedback_many_empty(self):
+        assert store_feedback_many([]) == 0
+
+    def test_store_suggestions_many(self):
+        count = store_suggestions_many([
+            {"personality_name": "test-bulk", "suggestion_type": "add", "content": "Be brief"},
+            {
+                "personality_name": "test-bulk",
+                "suggestion_type": "remove",
+                "content": "Be verbose",
+                "reason": "Feedback",
+                "source": "feedback_analysis",
+            },
+        ])
+        assert count == 2
+
+        pending = [s for s in get_pending_suggestions() if s["personality_name"] == "test-bulk"]
+        assert {s["suggestion_type"] for s in pending} == {"add", "remove"}
+        sources = {s["suggestion_type"]: s["source"] for s in pending}
+        assert sources == {"add": "llm_tool", "remove": "feedback_analysis"}
+
+    def test_store_suggestions_many_rejects_invalid_type(self):
+        with pytest.raises(ValueError):
+            store_suggestions_many([
+                {"personality_name": "test-bulk", "suggestion_type": "rename", "content": "x"},
+            ])
+
+
+class TestSharedConnection:
+    """Tests for the long-lived connection used by feedback helpers."""
+
+    def test_helpers_reuse_one_connection(self):
+        from radar.semantic import _get_shared_connection
+
+        assert _get_shared_connection() is _get_shared_connection()
+
+    def test_connection_is_per_thread(self):
+        import threading
+
+        from radar.semantic import _get_shared_connection
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(_get_shared_connection()))
+        thread.start()
+        thread.join()
+        assert other[0] is not _get_shared_connection()
+
+    def test_exited_threads_connections_are_closed(self):
+        import sqlite3
+        import threading
+
+        from radar.semantic import _get_shared_connection
+
+        opened = []
+        for _ in range(2):
+            thread = threading.Thread(target=lambda: opened.append(_get_shared_connection()))
+            thread.start()
+            thread.join()
+        # The second thread's connection replaced the first's
+        with pytest.raises(sqlite3.ProgrammingError):
+            opened[0].execute("SELECT 1")
+
+    def test_data_directory_change_replaces_connection(self, tmp_path, monkeypatch):
+        import sqlite3
+
+        import radar.config
+        from radar.semantic import _get_shared_connection
+
+        first = _get_shared_connection()
+        other = tmp_path / "other_data"
+        other.mkdir()
+        monkeypatch.setenv("RADAR_DATA_DIR", str(other))
+        radar.config.reset_data_paths()
+        assert _get_shared_connection() is not first
+        with pytest.raises(sqlite3.ProgrammingError):
+            first.execute("SELECT 1")
+
+    def test_close_shared_connections(self):
+        import sqlite3
+
+        from radar.semantic import _get_shared_connection, close_shared_connections
+
+        conn = _get_shared_connection()
+        close_shared_connections()
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        assert _get_shared_connection() is not conn
+
+    def test_writes_are_committed(self):
+        from radar.semantic import _get_shared_connection
+
+        fb_id = store_feedback("test-conv-shared", 0, "positive")
+
+        conn = _get_connection()
+        row = conn.execute("SELECT id FROM feedback WHERE id = ?", (fb_id,)).fetchone()
+        conn.close()
+        assert row is not None
+        assert not _get_shared_connection().in_transaction
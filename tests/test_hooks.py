@@ -118,6 +118,217 @@ class TestHookRegistration:
         run_pre_tool_hooks("test", {})
         assert calls == ["low", "mid", "high"]
 
+    def test_populated_bitmask_tracks_registry(self):
+        import radar.hooks as hooks
+
+        assert hooks._populated == 0
+        register_hook(HookRegistration(
+            name="f", hook_point=HookPoint.FILTER_TOOLS,
+            callback=lambda tools: tools, source="plugin:x",
+        ))
+        register_hook(HookRegistration(
+            name="p", hook_point=HookPoint.PRE_TOOL_CALL,
+            callback=lambda tn, args: HookResult(),
+        ))
+        assert hooks._populated == hooks._FILTER_TOOLS_BIT | hooks._PRE_TOOL_CALL_BIT
+
+        unregister_hook("p")
+        assert hooks._populated == hooks._FILTER_TOOLS_BIT
+        unregister_hooks_by_source("plugin:x")
+        assert hooks._populated == 0
+
+        register_hook(HookRegistration(
+            name="p", hook_point=HookPoint.PRE_TOOL_CALL,
+            callback=lambda tn, args: HookResult(blocked=True),
+        ))
+        assert run_pre_tool_hooks("t", {}).blocked
+        clear_all_hooks()
+        assert hooks._populated == 0
+        assert not run_pre_tool_hooks("t", {}).blocked
+
+    def test_list_hooks_cache_invalidated_on_change(self):
+        import radar.hooks as hooks
+
+        register_hook(HookRegistration(
+            name="a", hook_point=HookPoint.FILTER_TOOLS,
+            callback=lambda tools: tools, source="plugin:x",
+        ))
+        first = list_hooks()
+        first[0]["name"] = "mutated"
+        assert hooks._list_cache is not None
+        assert [h["name"] for h in list_hooks()] == ["a"]
+
+        register_hook(HookRegistration(
+            name="b", hook_point=HookPoint.FILTER_TOOLS,
+            callback=lambda tools: tools,
+        ))
+        assert [h["name"] for h in list_hooks()] == ["a", "b"]
+        unregister_hook("b")
+        assert [h["name"] for h in list_hooks()] == ["a"]
+        unregister_hooks_by_source("plugin:x")
+        assert list_hooks() == []
+
+    def test_hook_unregistering_itself_mid_dispatch(self, caplog):
+        calls = []
+
+        def first(tools):
+            calls.append("first")
+            unregister_hook("first")
+            return tools
+
+        def failing(tools):
+            calls.append("failing")
+            raise RuntimeError("boom")
+
+        register_hook(HookRegistration(
+            name="first", hook_point=HookPoint.FILTER_TOOLS, callback=first, priority=10,
+        ))
+        register_hook(HookRegistration(
+            name="failing", hook_point=HookPoint.FILTER_TOOLS, callback=failing, priority=20,
+        ))
+
+        with caplog.at_level("WARNING", logger="radar.hooks"):
+            run_filter_tools_hooks([])
+        assert calls == ["first", "failing"]
+        assert "'failing'" in caplog.text
+
+        run_filter_tools_hooks([])
+        assert calls == ["first", "failing", "failing"]
+
+    def test_unregister_filters_in_place(self):
+        import radar.hooks as hooks
+
+        for name, source in [("a", "plugin:x"), ("b", "plugin:y"), ("c", "plugin:x")]:
+            register_hook(HookRegistration(
+                name=name, hook_point=HookPoint.FILTER_TOOLS,
+                callback=lambda tools: tools, source=source,
+            ))
+        hooks_list = hooks._hooks[HookPoint.FILTER_TOOLS]
+        cached = list_hooks()
+
+        assert unregister_hooks_by_source("plugin:none") == 0
+        assert unregister_hook("missing") is False
+        assert hooks._list_cache is not None  # no-op leaves the cache alone
+        assert list_hooks() == cached
+
+        assert unregister_hooks_by_source("plugin:x") == 2
+        assert hooks._hooks[HookPoint.FILTER_TOOLS] is hooks_list
+        assert [h.name for h in hooks_list] == ["b"]
+        assert unregister_hook("b") is True
+        assert hooks_list == []
+        assert HookPoint.FILTER_TOOLS not in hooks._hooks
+
+    def test_concurrent_registration_while_dispatching(self):
+        import threading
+
+        stop = threading.Event()
+        errors = []
+
+        def dispatch():
+            while not stop.is_set():
+                try:
+                    run_filter_tools_hooks([])
+                except Exception as e:  # pragma: no cover - failure path
+                    errors.append(e)
+
+        reader = threading.Thread(target=dispatch)
+        reader.start()
+
+        def register_many(prefix):
+            for i in range(200):
+                register_hook(HookRegistration(
+                    name=f"{prefix}{i}", hook_point=HookPoint.FILTER_TOOLS,
+                    callback=lambda tools: tools, priority=i % 7,
+                ))
+
+        writers = [threading.Thread(target=register_many, args=(p,)) for p in "ab"]
+        for t in writers:
+            t.start()
+        for t in writers:
+            t.join()
+        stop.set()
+        reader.join()
+
+        assert errors == []
+        hooks = list_hooks()
+        assert len(hooks) == 400
+        priorities = [h["priority"] for h in hooks]
+        assert priorities == sorted(priorities)
+
+    def test_return_values_checked_by_type(self):
+        """Only the documented return types take effect; look-alikes are ignored."""
+
+        class Blocker(HookResult):
+            pass
+
+        class LooksBlocked:
+            blocked = True
+            message = "not a HookResult"
+
+        class ToolList(list):
+            pass
+
+        register_hook(HookRegistration(
+            name="lookalike", hook_point=HookPoint.PRE_TOOL_CALL,
+            callback=lambda tn, args: LooksBlocked(), priority=10,
+        ))
+        register_hook(HookRegistration(
+            name="subclass", hook_point=HookPoint.PRE_TOOL_CALL,
+            callback=lambda tn, args: Blocker(blocked=True, message="sub"), priority=20,
+        ))
+        register_hook(HookRegistration(
+            name="filter", hook_point=HookPoint.FILTER_TOOLS,
+            callback=lambda tools: ToolList(tools[:1]),
+        ))
+
+        result = run_pre_tool_hooks("t", {})
+        assert result.blocked and result.message == "sub"
+        assert run_filter_tools_hooks([{"a": 1}, {"b": 2}]) == [{"a": 1}]
+
+    def test_registrations_are_immutable_slotted(self):
+        import dataclasses
+
+        reg = HookRegistration(
+            name="r", hook_point=HookPoint.FILTER_TOOLS, callback=lambda tools: tools,
+        )
+        assert not hasattr(reg, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            reg.priority = 1
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            HookResult().blocked = True
+        assert len({reg, dataclasses.replace(reg)}) == 1
+
+    def test_registry_entries_created_lazily(self):
+        import radar.hooks as hooks
+
+        assert dict(hooks._hooks) == {}
+        run_pre_tool_hooks("t", {})
+        run_filter_tools_hooks([])
+        assert dict(hooks._hooks) == {}
+
+        register_hook(HookRegistration(
+            name="late", hook_point=HookPoint.HEARTBEAT_COLLECT, callback=lambda: [],
+        ))
+        register_hook(HookRegistration(
+            name="early", hook_point=HookPoint.PRE_TOOL_CALL,
+            callback=lambda tn, args: HookResult(),
+        ))
+        assert set(hooks._hooks) == {HookPoint.HEARTBEAT_COLLECT, HookPoint.PRE_TOOL_CALL}
+        # list_hooks() keeps HookPoint order, not registration order
+        assert [h["name"] for h in list_hooks()] == ["early", "late"]
+
+        clear_all_hooks()
+        assert dict(hooks._hooks) == {}
+
+    def test_equal_priority_keeps_registration_order(self):
+        for name, priority in [("a", 50), ("b", 10), ("c", 50), ("d", 10), ("e", 50)]:
+            register_hook(HookRegistration(
+                name=name, hook_point=HookPoint.FILTER_TOOLS,
+                callback=lambda tools: tools, priority=priority,
+            ))
+
+        assert [h["name"] for h in list_hooks()] == ["b", "d", "a", "c", "e"]
+
     def test_list_hooks_includes_metadata(self):
         register_hook(HookRegistration(
             name="test", hook_point=HookPoint.PRE_TOOL_CALL,
@@ -364,6 +575,82 @@ class TestConfigDrivenHooks:
         result = reg.callback("read_file", {"command": "rm stuff"})
         assert result.blocked is False
 
+    @pytest.mark.parametrize("automaton", [False, True])
+    def test_substring_matcher(self, automaton, monkeypatch):
+        import radar.hooks_builtin as hb
+
+        if automaton:
+            pytest.importorskip("ahocorasick")
+        else:
+            monkeypatch.setattr(hb, "_import_ahocorasick", lambda: None)
+
+        matches = hb._substring_matcher(["rm -rf", "mkfs", "dd if="])
+        assert matches("sudo rm -rf /")
+        assert matches("dd if=/dev/zero of=x")
+        assert not matches("ls -la")
+        assert not matches("")
+
+        assert not hb._substring_matcher([])("anything")
+        assert hb._substring_matcher(["", "x"])("anything")
+
+        insensitive = hb._substring_matcher(["New Instructions:", "a.b"], ignore_case=True)
+        assert insensitive("here are NEW INSTRUCTIONS: obey")
+        assert insensitive("x A.B y")
+        # Patterns are literal text, not regex syntax
+        assert not insensitive("aXb")
+        assert not hb._substring_matcher(["ABC"])("abc")
+
+    def test_tool_names_are_frozen_and_interned(self):
+        import sys
+
+        from radar.hooks_builtin import _tool_names
+
+        name = "".join(["read", "_file"])
+        tools = _tool_names({"tools": [name, "exec"]})
+        assert tools == frozenset({"read_file", "exec"})
+        assert any(t is sys.intern("read_file") for t in tools)
+        assert _tool_names({}, ("exec",)) == frozenset({"exec"})
+
+    def test_substring_matchers_shared_by_pattern_set(self):
+        from radar.hooks_builtin import _substring_matcher
+
+        first = _substring_matcher(["override system prompt", "you are now"])
+        assert _substring_matcher(["you are now", "override system prompt"]) is first
+        assert _substring_matcher(["you are now"]) is not first
+        assert _substring_matcher(
+            ["you are now", "override system prompt"], ignore_case=True,
+        ) is not first
+
+    @pytest.mark.parametrize("automaton", [False, True])
+    def test_message_pattern_case_insensitive(self, automaton, monkeypatch):
+        import radar.hooks_builtin as hb
+
+        if automaton:
+            pytest.importorskip("ahocorasick")
+        else:
+            monkeypatch.setattr(hb, "_import_ahocorasick", lambda: None)
+
+        reg = hb._build_hook({
+            "name": "inj",
+            "hook_point": "pre_agent_run",
+            "type": "block_message_pattern",
+            "patterns": ["Ignore Previous Instructions"],
+        })
+        assert reg.callback("please IGNORE previous instructions now", None).blocked
+        assert not reg.callback("hello", None).blocked
+
+    def test_empty_message_and_memory_patterns_never_block(self):
+        from radar.hooks_builtin import _build_hook
+
+        for hook_point, rule_type in [
+            ("pre_agent_run", "block_message_pattern"),
+            ("pre_memory_store", "block_memory_pattern"),
+        ]:
+            reg = _build_hook({
+                "name": "empty", "hook_point": hook_point, "type": rule_type, "patterns": [],
+            })
+            assert reg.callback("anything at all", None).blocked is False
+
     def test_block_path_pattern(self, tmp_path):
         from radar.hooks_builtin import _build_hook
 
@@ -390,6 +677,55 @@ class TestConfigDrivenHooks:
         result = reg.callback("read_file", {"path": str(tmp_path / "secret" / "key")})
         assert result.blocked is False
 
+    def test_block_path_pattern_prefix_boundaries(self, tmp_path):
+        from radar.hooks_builtin import _build_hook
+
+        secret = tmp_path / "secret"
+        reg = _build_hook({
+            "name": "block_secret",
+            "hook_point": "pre_tool_call",
+            "type": "block_path_pattern",
+            "paths": [str(secret)],
+        })
+
+        assert reg.callback("read_file", {"path": str(secret)}).blocked
+        assert reg.callback("read_file", {"file_path": str(secret / "a" / "b")}).blocked
+        assert reg.callback("read_file", {"path": str(tmp_path / "x" / ".." / "secret" / "k")}).blocked
+        # A sibling sharing the name prefix is not inside the blocked dir
+        assert not reg.callback("read_file", {"path": str(tmp_path / "secret-notes")}).blocked
+
+    def test_block_path_pattern_root(self, tmp_path):
+        from radar.hooks_builtin import _build_hook
+
+        reg = _build_hook({
+            "name": "block_everything",
+            "hook_point": "pre_tool_call",
+            "type": "block_path_pattern",
+            "paths": ["/", str(tmp_path), str(tmp_path)],
+        })
+
+        assert reg.callback("read_file", {"path": "/"}).blocked
+        assert reg.callback("read_file", {"path": str(tmp_path / "a")}).blocked
+
+    def test_block_path_pattern_follows_new_symlinks(self, tmp_path):
+        from radar.hooks_builtin import _build_hook
+
+        secret = tmp_path / "secret"
+        secret.mkdir()
+        reg = _build_hook({
+            "name": "block_secret",
+            "hook_point": "pre_tool_call",
+            "type": "block_path_pattern",
+            "paths": [str(secret)],
+        })
+        link = tmp_path / "link"
+        link.mkdir()
+        assert not reg.callback("read_file", {"path": str(link)}).blocked
+
+        link.rmdir()
+        link.symlink_to(secret)
+        assert reg.callback("read_file", {"path": str(link)}).blocked
+
     def test_block_tool(self):
         from radar.hooks_builtin import _build_hook
 
@@ -412,6 +748,59 @@ class TestConfigDrivenHooks:
         result = reg.callback("read_file", {})
         assert result.blocked is False
 
+    @pytest.mark.parametrize("rule_type,key", [
+        ("block_command_pattern", "patterns"),
+        ("block_path_pattern", "paths"),
+        ("block_tool", "tools"),
+    ])
+    def test_pre_tool_rules_with_nothing_to_block(self, rule_type, key):
+        from radar.hooks_builtin import _build_hook
+
+        reg = _build_hook({
+            "name": "empty",
+            "hook_point": "pre_tool_call",
+            "type": rule_type,
+            key: [],
+        })
+        for tool in ("exec", "read_file", "write_file"):
+            args = {"command": "rm -rf /", "path": "/etc/passwd"}
+            assert reg.callback(tool, args).blocked is False
+
+    def test_pre_tool_rules_share_blocked_result(self):
+        from radar.hooks_builtin import _build_hook
+
+        reg = _build_hook({
+            "name": "block_tools",
+            "hook_point": "pre_tool_call",
+            "type": "block_tool",
+            "tools": ["exec"],
+            "message": "tool disabled",
+        })
+        first = reg.callback("exec", {})
+        assert first.blocked is True
+        assert first.message == "tool disabled"
+        assert reg.callback("exec", {}) is first
+
+    def test_allow_paths_share_empty_result(self):
+        from radar.hooks_builtin import _EMPTY_RESULT, _build_hook
+
+        rules = [
+            ("pre_tool_call", "block_tool", ("read_file", {})),
+            ("pre_tool_call", "block_command_pattern", ("exec", {"command": "ls"})),
+            ("pre_agent_run", "block_message_pattern", ("hello", None)),
+            ("pre_memory_store", "block_memory_pattern", ("likes tea", None)),
+        ]
+        for hook_point, rule_type, args in rules:
+            reg = _build_hook({
+                "name": rule_type,
+                "hook_point": hook_point,
+                "type": rule_type,
+                "tools": ["exec"],
+                "patterns": ["rm -rf", "ignore previous"],
+            })
+            assert reg.callback(*args) is _EMPTY_RESULT
+        assert _EMPTY_RESULT.blocked is False
+
     def test_log_callback(self):
         from unittest.mock import patch
 
@@ -423,10 +812,9 @@ class TestConfigDrivenHooks:
             "type": "log",
             "log_level": "info",
         }
-        reg = _build_hook(rule)
-        assert reg is not None
-
         with patch("radar.logging.log") as mock_log:
+            reg = _build_hook(rule)
+            assert reg is not None
             reg.callback("exec_command", {"command": "ls"}, "output", True)
             mock_log.assert_called_once()
             args = mock_log.call_args
@@ -456,10 +844,7 @@ class TestConfigDrivenHooks:
         ]
 
         # At 23:00 (in window) - exec_command should be removed
-        from datetime import datetime
-
-        with patch("radar.hooks_builtin.datetime") as mock_dt:
-            mock_dt.now.return_value = datetime(2024, 1, 1, 23, 0)
+        with patch("radar.hooks_builtin._local_hour", return_value=23):
             result = reg.callback(tools)
             names = [t["function"]["name"] for t in result]
             assert "exec_command" not in names
@@ -486,13 +871,57 @@ class TestConfigDrivenHooks:
         ]
 
         # At 14:00 (outside window) - all tools present
-        from datetime import datetime
-
-        with patch("radar.hooks_builtin.datetime") as mock_dt:
-            mock_dt.now.return_value = datetime(2024, 1, 1, 14, 0)
+        with patch("radar.hooks_builtin._local_hour", return_value=14):
             result = reg.callback(tools)
             assert len(result) == 2
 
+    def test_time_restrict_same_day_window(self):
+        from unittest.mock import patch
+
+        from radar.hooks_builtin import _build_hook
+
+        reg = _build_hook({
+            "name": "work_hours",
+            "hook_point": "filter_tools",
+            "type": "time_restrict",
+            "start_hour": 9,
+            "end_hour": 17,
+            "tools": ["exec_command"],
+        })
+        tools = [{"function": {"name": "exec_command"}}]
+        for hour, expected in [(8, 1), (9, 0), (16, 0), (17, 1)]:
+            with patch("radar.hooks_builtin._local_hour", return_value=hour):
+                assert len(reg.callback(tools)) == expected
+
+    def test_local_hour_calls_localtime_once_per_hour(self, monkeypatch):
+        import time
+
+        import radar.hooks_builtin as hb
+
+        clock = [time.mktime((2024, 1, 1, 13, 59, 0, 0, 1, -1))]
+        calls = []
+        real_localtime = time.localtime
+
+        def localtime(secs):
+            calls.append(secs)
+            return real_localtime(secs)
+
+        monkeypatch.setattr(hb, "_hour_cache", (0.0, 0.0, 0))
+        monkeypatch.setattr(hb.time, "time", lambda: clock[0])
+        monkeypatch.setattr(hb.time, "localtime", localtime)
+
+        assert hb._local_hour() == 13
+        clock[0] += 30
+        assert hb._local_hour() == 13
+        assert len(calls) == 1
+
+        clock[0] += 30  # 14:00:00
+        assert hb._local_hour() == 14
+        assert len(calls) == 2
+
+        clock[0] -= 7200  # clock set back to 12:00
+        assert hb._local_hour() == 12
+
     def test_allowlist(self):
         from radar.hooks_builtin import _build_hook
 
@@ -532,6 +961,47 @@ class TestConfigDrivenHooks:
         names = [t["function"]["name"] for t in result]
         assert names == ["read_file"]
 
+    def test_filter_rules_tolerate_tools_without_function(self):
+        from radar.hooks_builtin import _build_hook
+
+        tools = [{"type": "function"}, {"function": {"name": "read_file"}}]
+        allow = _build_hook({
+            "name": "allow", "hook_point": "filter_tools",
+            "type": "allowlist", "tools": ["read_file"],
+        })
+        deny = _build_hook({
+            "name": "deny", "hook_point": "filter_tools",
+            "type": "denylist", "tools": ["read_file"],
+        })
+        assert allow.callback(tools) == [tools[1]]
+        assert deny.callback(tools) == [tools[0]]
+
+    @pytest.mark.parametrize("rule_type,expected", [
+        ("allowlist", []),
+        ("denylist", ["exec_command", "read_file"]),
+        ("time_restrict", ["exec_command", "read_file"]),
+    ])
+    def test_empty_tool_list_rules(self, rule_type, expected):
+        from unittest.mock import patch
+
+        from radar.hooks_builtin import _build_hook
+
+        reg = _build_hook({
+            "name": "empty",
+            "hook_point": "filter_tools",
+            "type": rule_type,
+            "start_hour": 0,
+            "end_hour": 24,
+            "tools": [],
+        })
+        tools = [
+            {"function": {"name": "exec_command"}},
+            {"function": {"name": "read_file"}},
+        ]
+        with patch("radar.hooks_builtin._local_hour", return_value=12):
+            result = reg.callback(tools)
+        assert [t["function"]["name"] for t in result] == expected
+
     def test_unknown_hook_point(self):
         from radar.hooks_builtin import _build_hook
 
@@ -543,6 +1013,17 @@ class TestConfigDrivenHooks:
         reg = _build_hook(rule)
         assert reg is None
 
+    def test_hook_point_accepts_enum_member(self):
+        from radar.hooks_builtin import _build_hook
+
+        reg = _build_hook({
+            "name": "enum_point",
+            "hook_point": HookPoint.PRE_TOOL_CALL,
+            "type": "block_tool",
+            "tools": ["exec"],
+        })
+        assert reg.hook_point is HookPoint.PRE_TOOL_CALL
+
     def test_unknown_rule_type(self):
         from radar.hooks_builtin import _build_hook
 
@@ -558,8 +1039,7 @@ class TestConfigDrivenHooks:
         """Test loading hooks from config."""
         from radar.config.schema import Config, HooksConfig
 
-        mock_config = Config()
-        mock_config.hooks = HooksConfig(
+        mock_config = Config(hooks=HooksConfig(
             enabled=True,
             rules=[
                 {
@@ -577,7 +1057,7 @@ class TestConfigDrivenHooks:
                     "tools": ["exec_command"],
                 },
             ],
-        )
+        ))
 
         # Patch at source module since hooks_builtin does lazy import inside function body
         monkeypatch.setattr("radar.config.get_config", lambda: mock_config)
@@ -593,10 +1073,9 @@ class TestConfigDrivenHooks:
         """When hooks.enabled is False, no hooks are loaded."""
         from radar.config.schema import Config, HooksConfig
 
-        mock_config = Config()
-        mock_config.hooks = HooksConfig(enabled=False, rules=[
+        mock_config = Config(hooks=HooksConfig(enabled=False, rules=[
             {"name": "x", "hook_point": "pre_tool_call", "type": "block_tool", "tools": ["exec_command"]},
-        ])
+        ]))
 
         # Patch at source module since hooks_builtin does lazy import inside function body
         monkeypatch.setattr("radar.config.get_config", lambda: mock_config)
@@ -609,8 +1088,7 @@ class TestConfigDrivenHooks:
         """When hooks enabled but no rules configured, default safety rules are applied."""
         from radar.config.schema import Config, HooksConfig
 
-        mock_config = Config()
-        mock_config.hooks = HooksConfig(enabled=True, rules=[])
+        mock_config = Config(hooks=HooksConfig(enabled=True, rules=[]))
 
         monkeypatch.setattr("radar.config.get_config", lambda: mock_config)
 
@@ -624,12 +1102,22 @@ class TestConfigDrivenHooks:
         assert "block_injection_phrases" in names
         assert "anti_memory_poisoning" in names
 
+    def test_default_safety_rules_are_read_only(self):
+        from radar.hooks_builtin import DEFAULT_SAFETY_RULES, _rules_fingerprint
+
+        rule = DEFAULT_SAFETY_RULES[0]
+        with pytest.raises(TypeError):
+            rule["patterns"] = []
+        assert isinstance(rule["patterns"], tuple)
+        # Fingerprints match an equivalent plain-dict copy
+        plain = [dict(r, patterns=list(r["patterns"])) for r in DEFAULT_SAFETY_RULES]
+        assert _rules_fingerprint(DEFAULT_SAFETY_RULES) == _rules_fingerprint(plain)
+
     def test_user_rules_override_defaults(self, monkeypatch):
         """When user configures rules, defaults are NOT applied."""
         from radar.config.schema import Config, HooksConfig
 
-        mock_config = Config()
-        mock_config.hooks = HooksConfig(
+        mock_config = Config(hooks=HooksConfig(
             enabled=True,
             rules=[
                 {
@@ -639,7 +1127,7 @@ class TestConfigDrivenHooks:
                     "tools": ["exec_command"],
                 },
             ],
-        )
+        ))
 
         monkeypatch.setattr("radar.config.get_config", lambda: mock_config)
 
@@ -650,6 +1138,43 @@ class TestConfigDrivenHooks:
         hooks = list_hooks()
         assert hooks[0]["name"] == "my_rule"
 
+    def test_load_config_hooks_reuses_unchanged_rules(self, monkeypatch):
+        """Reloading unchanged rules neither rebuilds nor duplicates hooks."""
+        import radar.hooks_builtin as hb
+        from radar.config.schema import Config, HooksConfig
+        from radar.hooks import unregister_hooks_by_source
+
+        rules = [{
+            "name": "my_rule",
+            "hook_point": "pre_tool_call",
+            "type": "block_tool",
+            "tools": ["exec_command"],
+        }]
+        mock_config = Config(hooks=HooksConfig(enabled=True, rules=rules))
+        monkeypatch.setattr("radar.config.get_config", lambda: mock_config)
+        monkeypatch.setattr(hb, "_last_load", None)
+
+        built = []
+        real_build = hb._build_hook
+        monkeypatch.setattr(hb, "_build_hook", lambda rule: built.append(rule) or real_build(rule))
+
+        assert hb.load_config_hooks() == 1
+        assert hb.load_config_hooks() == 1
+        assert len(list_hooks()) == 1
+        assert len(built) == 1
+
+        # Scheduler reload path: unregister, then load again
+        unregister_hooks_by_source("config")
+        assert hb.load_config_hooks() == 1
+        assert [h["name"] for h in list_hooks()] == ["my_rule"]
+        assert len(built) == 1
+
+        # Changed rules are rebuilt
+        rules[0]["tools"] = ["write_file"]
+        unregister_hooks_by_source("config")
+        assert hb.load_config_hooks() == 1
+        assert len(built) == 2
+
     def test_custom_priority(self):
         from radar.hooks_builtin import _build_hook
 
@@ -991,7 +1516,7 @@ class TestConfigSchema:
         from radar.config.schema import Config
         config = Config()
         assert config.hooks.enabled is True
-        assert config.hooks.rules == []
+        assert config.hooks.rules == ()
 
     def test_hooks_from_dict(self):
         from radar.config.schema import Config
@@ -1012,7 +1537,7 @@ class TestConfigSchema:
         from radar.config.schema import Config
         config = Config.from_dict({})
         assert config.hooks.enabled is True
-        assert config.hooks.rules == []
+        assert config.hooks.rules == ()
 
 
 # ---- Plugin Manifest ----
@@ -1576,6 +2101,80 @@ class TestNewConfigRules:
         result = reg.callback("msg", "The secret is out", None)
         assert result == "The [REDACTED] is out"
 
+    @pytest.mark.parametrize("patterns,replacement,expected", [
+        ([], "[R]", "token sk-abc"),
+        ([r"sk-\w+", r"token"], "[R]", "[R] [R]"),
+        # Capture groups keep their numbering via the per-pattern loop
+        ([r"(sk)-\w+", r"tok(en)"], r"<\1>", "<en> <sk>"),
+        # Inline global flags
+        ([r"(?i)TOKEN", r"sk-\w+"], "[R]", "[R] [R]"),
+    ])
+    def test_redact_response_pattern_shapes(self, patterns, replacement, expected):
+        from radar.hooks_builtin import _build_hook
+
+        reg = _build_hook({
+            "name": "redact",
+            "hook_point": "post_agent_run",
+            "type": "redact_response",
+            "patterns": patterns,
+            "replacement": replacement,
+        })
+        assert reg.callback("msg", "token sk-abc", None) == expected
+
+    @pytest.mark.parametrize("patterns,response,expected", [
+        # The key must not survive because a later pattern overlaps its start
+        ([r"sk-[A-Za-z0-9]{8,}", r"token=sk"], "token=sk-ABCDEFGHIJKL", "token=[REDACTED]"),
+        (["bcdefg", "ab"], "abcdefg", "a[REDACTED]"),
+    ])
+    def test_redact_response_overlapping_patterns(self, patterns, response, expected):
+        """Patterns apply one after another, each to the previous output."""
+        from radar.hooks_builtin import _build_hook
+
+        reg = _build_hook({
+            "name": "redact",
+            "hook_point": "post_agent_run",
+            "type": "redact_response",
+            "patterns": patterns,
+        })
+        assert reg.callback("msg", response, None) == expected
+
+    def test_redact_response_prefers_re2(self, monkeypatch):
+        import re
+        import types
+
+        import radar.hooks_builtin as hb
+
+        compiled = []
+
+        def compile(source):
+            if "(?=" in source:
+                raise ValueError("lookahead not supported")
+            compiled.append(source)
+            return re.compile(source)
+
+        fake_re2 = types.SimpleNamespace(compile=compile)
+        monkeypatch.setattr(hb, "_import_re2", lambda: fake_re2)
+
+        reg = hb._build_hook({
+            "name": "redact",
+            "hook_point": "post_agent_run",
+            "type": "redact_response",
+            "patterns": [r"sk-\w+", r"token"],
+            "replacement": "[R]",
+        })
+        assert reg.callback("msg", "token sk-abc", None) == "[R] [R]"
+        assert compiled == [r"sk-\w+", "token"]
+
+        # Constructs re2 rejects fall back to re
+        reg = hb._build_hook({
+            "name": "redact",
+            "hook_point": "post_agent_run",
+            "type": "redact_response",
+            "patterns": [r"sk-(?=\w)\w+"],
+            "replacement": "[R]",
+        })
+        assert reg.callback("msg", "key sk-abc", None) == "key [R]"
+
     def test_log_agent(self):
         from unittest.mock import patch
 
@@ -1587,10 +2186,9 @@ class TestNewConfigRules:
             "type": "log_agent",
             "log_level": "info",
         }
-        reg = _build_hook(rule)
-        assert reg is not None
-
         with patch("radar.logging.log") as mock_log:
+            reg = _build_hook(rule)
+            assert reg is not None
             reg.callback("msg", "response", "conv123")
             mock_log.assert_called_once()
             assert mock_log.call_args[0][0] == "info"
@@ -1643,6 +2241,18 @@ class TestNewConfigRules:
         assert filtered[0]["content"] == "User likes blue"
         assert filtered[1]["content"] == "User lives in Seattle"
 
+    def test_filter_memory_pattern_empty_patterns(self):
+        from radar.hooks_builtin import _build_hook
+
+        reg = _build_hook({
+            "name": "noop",
+            "hook_point": "post_memory_search",
+            "type": "filter_memory_pattern",
+            "exclude_patterns": [],
+        })
+        results = [{"content": "anything"}, {}]
+        assert reg.callback("query", results) == results
+
     def test_log_heartbeat(self):
         from unittest.mock import patch
 
@@ -1654,16 +2264,14 @@ class TestNewConfigRules:
             "type": "log_heartbeat",
             "log_level": "info",
         }
-        reg = _build_hook(rule)
-        assert reg is not None
-
         with patch("radar.logging.log") as mock_log:
+            reg = _build_hook(rule)
+            assert reg is not None
             reg.callback(3, True, None)
             mock_log.assert_called_once()
             assert "success" in mock_log.call_args[0][1]
             assert "3 events" in mock_log.call_args[0][1]
 
-        with patch("radar.logging.log") as mock_log:
             reg.callback(0, False, "timeout")
             assert "failure" in mock_log.call_args[0][1]
             assert "timeout" in mock_log.call_args[0][1]
@@ -1738,8 +2346,7 @@ class TestNewConfigRules:
         """Test loading new hook types from config."""
         from radar.config.schema import Config, HooksConfig
 
-        mock_config = Config()
-        mock_config.hooks = HooksConfig(
+        mock_config = Config(hooks=HooksConfig(
             enabled=True,
             rules=[
                 {
@@ -1775,7 +2382,7 @@ class TestNewConfigRules:
                     "log_level": "info",
                 },
             ],
-        )
+        ))
 
         monkeypatch.setattr("radar.config.get_config", lambda: mock_config)
 
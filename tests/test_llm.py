@@ -1,6 +1,8 @@
 """Tests for radar/llm.py — LLM client, format conversion, tool loops."""
 
 import json
+import threading
+import time
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
@@ -17,6 +19,7 @@ from radar.llm import (
     _is_rate_limit_error,
     _openai_message_to_dict,
     chat,
+    chat_many,
 )
 
 
@@ -25,11 +28,15 @@ from radar.llm import (
 
 def _make_config(provider="ollama", model="test-model", base_url="http://localhost:11434",
                  fallback_model="", max_tool_iterations=10,
-                 max_retries=0, llm_retries=True):
+                 max_retries=0, llm_retries=True, cache_enabled=False,
+                 parallel_tool_calls=True, stream=False, prompt_cache_hints=False):
     """Build a minimal config-like object for LLM tests."""
     llm = SimpleNamespace(
         provider=provider, model=model, base_url=base_url,
         api_key="", fallback_model=fallback_model,
+        cache_enabled=cache_enabled, cache_max_entries=1000,
+        parallel_tool_calls=parallel_tool_calls, stream=stream,
+        prompt_cache_hints=prompt_cache_hints,
     )
     retry = SimpleNamespace(
         max_retries=max_retries, base_delay=0.01, max_delay=0.05,
@@ -38,6 +45,13 @@ def _make_config(provider="ollama", model="test-model", base_url="http://localho
     return SimpleNamespace(llm=llm, max_tool_iterations=max_tool_iterations, retry=retry)
 
 
+@pytest.fixture(autouse=True)
+def _fresh_openai_clients(monkeypatch):
+    """Keep cached OpenAI clients (often mocks) from leaking between tests."""
+    from radar import llm
+    monkeypatch.setattr(llm, "_openai_clients", {})
+
+
 def _make_ollama_response(content, tool_calls=None, status_code=200):
     """Build a mock httpx.Response for Ollama chat."""
     message = {"role": "assistant", "content": content}
@@ -46,10 +60,19 @@ def _make_ollama_response(content, tool_calls=None, status_code=200):
     resp = MagicMock(spec=httpx.Response)
     resp.status_code = status_code
     resp.json.return_value = {"message": message}
+    resp.content = json.dumps({"message": message}).encode()
     resp.raise_for_status = MagicMock()
     return resp
 
 
+def _sent_payload(call):
+    """Decode the JSON body of a recorded Ollama post call."""
+    kwargs = call[1]
+    if "content" in kwargs:
+        return json.loads(kwargs["content"])
+    return kwargs["json"]
+
+
 def _make_openai_message(content, tool_calls=None):
     """Build a mock OpenAI ChatCompletionMessage."""
     msg = SimpleNamespace(role="assistant", content=content, tool_calls=tool_calls)
@@ -104,6 +127,15 @@ class TestConvertToolsToOpenai:
     def test_empty_list(self):
         assert _convert_tools_to_openai([]) == []
 
+    def test_conversion_reused_per_schema(self):
+        schema = {"function": {"name": "weather", "description": "d", "parameters": {}}}
+        other = {"function": {"name": "weather", "description": "new", "parameters": {}}}
+
+        first = _convert_tools_to_openai([schema])[0]
+        assert _convert_tools_to_openai([schema])[0] is first
+        # A different schema object (e.g. a reloaded tool) is converted afresh
+        assert _convert_tools_to_openai([other])[0]["function"]["description"] == "new"
+
 
 # ── Message conversion ─────────────────────────────────────────────
 
@@ -138,6 +170,20 @@ class TestConvertMessagesToOpenai:
         result = _convert_messages_to_openai(msgs)
         assert result[0]["tool_calls"][0]["function"]["arguments"] == '{"key": "val"}'
 
+    def test_plain_messages_reused(self):
+        msgs = [{"role": "user", "content": "Hi"}]
+        assert _convert_messages_to_openai(msgs)[0] is msgs[0]
+
+    def test_extra_keys_dropped(self):
+        msgs = [{"role": "user", "content": "Hi", "images": ["x"]}]
+        assert _convert_messages_to_openai(msgs) == [{"role": "user", "content": "Hi"}]
+
+    def test_many_tool_calls_get_sequential_ids(self):
+        calls = [{"function": {"name": "t", "arguments": {}}} for _ in range(40)]
+        result = _convert_messages_to_openai([{"role": "assistant", "content": "", "tool_calls": calls}])
+        ids = [tc["id"] for tc in result[0]["tool_calls"]]
+        assert ids == [f"call_{i}" for i in range(40)]
+
 
 class TestConvertMessagesFromOpenai:
     """_convert_messages_from_openai reverses the conversion."""
@@ -206,10 +252,10 @@ class TestConvertOpenaiToOllamaFormat:
 
 
 class TestChatOllama:
-    """_chat_ollama tool loop with mocked httpx.post."""
+    """_chat_ollama tool loop with a mocked HTTP client."""
 
     @patch("radar.llm._log_api_call")
-    @patch("radar.llm.httpx.post")
+    @patch("radar.llm.httpx.Client.post")
     def test_simple_response(self, mock_post, mock_log):
         mock_post.return_value = _make_ollama_response("Hello!")
         config = _make_config()
@@ -223,7 +269,7 @@ class TestChatOllama:
     @patch("radar.llm._log_api_call")
     @patch("radar.llm.execute_tool", return_value="tool result")
     @patch("radar.llm.get_tools_schema", return_value=[{"function": {"name": "t"}}])
-    @patch("radar.llm.httpx.post")
+    @patch("radar.llm.httpx.Client.post")
     def test_tool_call_loop(self, mock_post, mock_schema, mock_exec, mock_log):
         # First call returns tool call, second returns final answer
         tool_call_resp = _make_ollama_response("", tool_calls=[
@@ -245,7 +291,7 @@ class TestChatOllama:
     @patch("radar.llm._log_api_call")
     @patch("radar.llm.execute_tool", return_value="result")
     @patch("radar.llm.get_tools_schema", return_value=[{"function": {"name": "t"}}])
-    @patch("radar.llm.httpx.post")
+    @patch("radar.llm.httpx.Client.post")
     def test_max_iterations_cap(self, mock_post, mock_schema, mock_exec, mock_log):
         # Always return tool calls — should stop at max_tool_iterations
         tool_resp = _make_ollama_response("", tool_calls=[
@@ -262,7 +308,7 @@ class TestChatOllama:
         assert mock_post.call_count == 3
 
     @patch("radar.llm._log_api_call")
-    @patch("radar.llm.httpx.post", side_effect=httpx.TimeoutException("timeout"))
+    @patch("radar.llm.httpx.Client.post", side_effect=httpx.TimeoutException("timeout"))
     def test_timeout_error(self, mock_post, mock_log):
         config = _make_config()
         with pytest.raises(RuntimeError, match="timed out"):
@@ -272,7 +318,7 @@ class TestChatOllama:
             )
 
     @patch("radar.llm._log_api_call")
-    @patch("radar.llm.httpx.post", side_effect=httpx.ConnectError("refused"))
+    @patch("radar.llm.httpx.Client.post", side_effect=httpx.ConnectError("refused"))
     def test_connect_error(self, mock_post, mock_log):
         config = _make_config()
         with pytest.raises(RuntimeError, match="Cannot connect"):
@@ -283,7 +329,7 @@ class TestChatOllama:
 
     @patch("radar.llm._log_api_call")
     @patch("radar.llm._log_fallback")
-    @patch("radar.llm.httpx.post")
+    @patch("radar.llm.httpx.Client.post")
     def test_rate_limit_fallback(self, mock_post, mock_fallback_log, mock_log):
         # First call raises 429, second succeeds with fallback model
         error_response = MagicMock(spec=httpx.Response)
@@ -297,17 +343,19 @@ class TestChatOllama:
         mock_post.side_effect = [rate_limit_exc, success_resp]
 
         config = _make_config(fallback_model="fallback-model")
+        on_fallback = MagicMock()
         msg, _ = _chat_ollama(
             [{"role": "user", "content": "hi"}],
-            use_tools=False, config=config,
+            use_tools=False, config=config, on_fallback=on_fallback,
         )
         assert msg["content"] == "Fallback answer!"
+        on_fallback.assert_called_once_with("fallback-model")
         # Verify the second call used fallback model
-        second_call_payload = mock_post.call_args_list[1][1]["json"]
+        second_call_payload = _sent_payload(mock_post.call_args_list[1])
         assert second_call_payload["model"] == "fallback-model"
 
     @patch("radar.llm._log_api_call")
-    @patch("radar.llm.httpx.post")
+    @patch("radar.llm.httpx.Client.post")
     def test_no_fallback_without_config(self, mock_post, mock_log):
         error_response = MagicMock(spec=httpx.Response)
         error_response.status_code = 429
@@ -325,7 +373,7 @@ class TestChatOllama:
     @patch("radar.llm._log_api_call")
     @patch("radar.llm.execute_tool", return_value="parsed ok")
     @patch("radar.llm.get_tools_schema", return_value=[{"function": {"name": "t"}}])
-    @patch("radar.llm.httpx.post")
+    @patch("radar.llm.httpx.Client.post")
     def test_tool_args_string_parsed(self, mock_post, mock_schema, mock_exec, mock_log):
         """Tool arguments that arrive as a JSON string are parsed to dict."""
         tool_resp = _make_ollama_response("", tool_calls=[
@@ -342,7 +390,7 @@ class TestChatOllama:
         mock_exec.assert_called_once_with("search", {"q": "hello"})
 
     @patch("radar.llm._log_api_call")
-    @patch("radar.llm.httpx.post")
+    @patch("radar.llm.httpx.Client.post")
     def test_model_override(self, mock_post, mock_log):
         mock_post.return_value = _make_ollama_response("ok")
         config = _make_config(model="default-model")
@@ -351,10 +399,271 @@ class TestChatOllama:
             use_tools=False, config=config,
             model_override="override-model",
         )
-        payload = mock_post.call_args[1]["json"]
+        payload = _sent_payload(mock_post.call_args)
         assert payload["model"] == "override-model"
 
 
+    @patch("radar.llm._log_api_call")
+    @patch("radar.llm.execute_tool", return_value="result")
+    @patch("radar.llm.get_tools_schema", return_value=[{"function": {"name": "t"}}])
+    @patch("radar.llm.httpx.Client.post")
+    def test_repeated_cacheable_call_runs_once(self, mock_post, mock_schema, mock_exec, mock_log):
+        search = {"function": {"name": "web_search", "arguments": {"query": "x"}}}
+        write = {"function": {"name": "write_file", "arguments": {"path": "a", "content": "b"}}}
+        mock_post.side_effect = [
+            _make_ollama_response("", tool_calls=[search, write]),
+            _make_ollama_response("", tool_calls=[search, write]),
+            _make_ollama_response("done"),
+        ]
+
+        msg, history = _chat_ollama(
+            [{"role": "user", "content": "go"}],
+            use_tools=True, config=_make_config(),
+        )
+        assert msg["content"] == "done"
+        names = [c.args[0] for c in mock_exec.call_args_list]
+        assert names == ["web_search", "write_file", "write_file"]
+        assert [m["content"] for m in history if m["role"] == "tool"] == ["result"] * 4
+
+
+class TestChatOllamaStream:
+    """_chat_ollama with llm.stream assembles the reply from NDJSON chunks."""
+
+    @staticmethod
+    def _client(monkeypatch, *bodies, status_code=200):
+        from radar import llm
+
+        replies = list(bodies)
+        sent = []
+
+        def handler(request):
+            sent.append(json.loads(request.content))
+            return httpx.Response(status_code, content=replies.pop(0))
+
+        monkeypatch.setattr(llm, "_http_client", httpx.Client(transport=httpx.MockTransport(handler)))
+        return sent
+
+    @staticmethod
+    def _ndjson(*chunks):
+        return "\n".join(json.dumps(c) for c in chunks).encode()
+
+    @patch("radar.llm._log_api_call")
+    def test_content_assembled(self, mock_log, monkeypatch):
+        sent = self._client(monkeypatch, self._ndjson(
+            {"message": {"role": "assistant", "content": "Hel"}, "done": False},
+            {"message": {"role": "assistant", "content": "lo!"}, "done": False},
+            {"message": {"role": "assistant", "content": ""}, "done": True},
+        ))
+        msg, messages = _chat_ollama(
+            [{"role": "user", "content": "hi"}], use_tools=False, config=_make_config(stream=True),
+        )
+        assert msg == {"role": "assistant", "content": "Hello!"}
+        assert messages[-1] is msg
+        assert sent[0]["stream"] is True
+
+    @patch("radar.llm._log_api_call")
+    @patch("radar.llm.execute_tool", return_value="Sunny")
+    @patch("radar.llm.get_tools_schema", return_value=[{"function": {"name": "weather"}}])
+    def test_tool_calls_collected(self, mock_schema, mock_exec, mock_log, monkeypatch):
+        call = {"function": {"name": "weather", "arguments": {"city": "NYC"}}}
+        self._client(
+            monkeypatch,
+            self._ndjson(
+                {"message": {"role": "assistant", "content": "", "tool_calls": [call]}, "done": False},
+                {"message": {"role": "assistant", "content": ""}, "done": True},
+            ),
+            self._ndjson({"message": {"role": "assistant", "content": "It's sunny"}, "done": True}),
+        )
+        msg, messages = _chat_ollama(
+            [{"role": "user", "content": "weather"}], use_tools=True, config=_make_config(stream=True),
+        )
+        mock_exec.assert_called_once_with("weather", {"city": "NYC"})
+        assert messages[1]["tool_calls"] == [call]
+        assert msg["content"] == "It's sunny"
+
+    def test_ndjson_split_across_chunks(self):
+        from radar.llm import _iter_ndjson
+
+        response = MagicMock()
+        response.iter_bytes.return_value = [b'{"a": 1}\n{"b"', b': 2}\n\n', b'{"c": 3}']
+        assert list(_iter_ndjson(response)) == [{"a": 1}, {"b": 2}, {"c": 3}]
+
+    @patch("radar.llm._log_api_call")
+    def test_error_status_raises(self, mock_log, monkeypatch):
+        self._client(monkeypatch, b"model not found", status_code=404)
+        with pytest.raises(RuntimeError, match="404 - model not found"):
+            _chat_ollama(
+                [{"role": "user", "content": "hi"}], use_tools=False, config=_make_config(stream=True),
+            )
+
+    @patch("radar.llm._log_api_call")
+    def test_midstream_error_raises(self, mock_log, monkeypatch):
+        self._client(monkeypatch, self._ndjson({"error": "out of memory"}))
+        with pytest.raises(RuntimeError, match="out of memory"):
+            _chat_ollama(
+                [{"role": "user", "content": "hi"}], use_tools=False, config=_make_config(stream=True),
+            )
+
+
+class TestRunToolCalls:
+    """_run_tool_calls runs read-only batches concurrently, in call order."""
+
+    def test_read_only_batch_runs_concurrently(self):
+        import threading
+
+        from radar.llm import _run_tool_calls
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_execute(name, args):
+            barrier.wait()  # deadlocks (times out) unless both run at once
+            return f"{name}:{args['q']}"
+
+        calls = [("web_search", {"q": "a"}), ("read_file", {"q": "b"})]
+        with patch("radar.llm.execute_tool", side_effect=fake_execute):
+            assert _run_tool_calls(calls, {}, parallel=True) == ["web_search:a", "read_file:b"]
+
+    @pytest.mark.parametrize("calls,parallel", [
+        ([("write_file", {"q": "a"}), ("read_file", {"q": "b"})], True),
+        ([("web_search", {"q": "a"}), ("read_file", {"q": "b"})], False),
+    ])
+    def test_other_batches_run_serially(self, calls, parallel):
+        import threading
+
+        from radar.llm import _run_tool_calls
+
+        threads = []
+
+        def fake_execute(name, args):
+            threads.append(threading.current_thread())
+            return name
+
+        with patch("radar.llm.execute_tool", side_effect=fake_execute):
+            assert _run_tool_calls(calls, {}, parallel=parallel) == [c[0] for c in calls]
+        assert threads == [threading.current_thread()] * 2
+
+
+class TestHttpClient:
+    """_chat_ollama sends every request through one shared httpx.Client."""
+
+    def test_client_is_shared(self, monkeypatch):
+        from radar import llm
+
+        monkeypatch.setattr(llm, "_http_client", None)
+        client = llm._get_http_client()
+        try:
+            assert isinstance(client, httpx.Client)
+            assert llm._get_http_client() is client
+        finally:
+            client.close()
+
+    @patch("radar.llm._log_api_call")
+    def test_requests_reuse_client(self, mock_log, monkeypatch):
+        from radar import llm
+
+        client = MagicMock()
+        client.post.return_value = _make_ollama_response("Hello!")
+        monkeypatch.setattr(llm, "_http_client", client)
+
+        for _ in range(2):
+            _chat_ollama([{"role": "user", "content": "hi"}], use_tools=False, config=_make_config())
+        assert client.post.call_count == 2
+
+
+class TestJsonCodec:
+    """Ollama bodies and tool arguments use orjson when it is installed."""
+
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    def test_chat_body_splices_tools(self, monkeypatch, use_orjson):
+        from radar import llm
+
+        orjson = pytest.importorskip("orjson") if use_orjson else None
+        monkeypatch.setattr(llm, "_orjson", orjson)
+        tools = [{"function": {"name": "t", "description": "caf\u00e9"}}]
+        payload = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "stream": False}
+
+        body = llm._chat_body(payload, llm._dumpb(tools))
+
+        assert json.loads(body) == {**payload, "tools": tools}
+        assert json.loads(llm._chat_body(payload)) == payload
+
+    def test_stdlib_fallback_without_orjson(self, monkeypatch):
+        from radar import llm
+
+        monkeypatch.setattr(llm, "_orjson", None)
+        assert llm._loads(b'{"a": 1}') == {"a": 1}
+        assert llm._dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+
+    def test_orjson_falls_back_for_wide_integers(self, monkeypatch):
+        from radar import llm
+
+        orjson = pytest.importorskip("orjson")
+        monkeypatch.setattr(llm, "_orjson", orjson)
+        assert json.loads(llm._dumpb({"n": 2**70})) == {"n": 2**70}
+
+    @patch("radar.llm._log_api_call")
+    @patch("radar.llm.execute_tool", return_value="Sunny")
+    @patch("radar.llm.get_tools_schema", return_value=[{"function": {"name": "weather"}}])
+    @patch("radar.llm.httpx.Client.post")
+    def test_tools_encoded_once_per_call(self, mock_post, mock_schema, mock_exec, mock_log):
+        from radar import llm
+
+        tools = mock_schema.return_value
+        tool_call = {"function": {"name": "weather", "arguments": {}}}
+        mock_post.side_effect = [
+            _make_ollama_response("", tool_calls=[tool_call]),
+            _make_ollama_response("It's sunny"),
+        ]
+        with patch("radar.llm._dumpb", wraps=llm._dumpb) as spy:
+            _chat_ollama([{"role": "user", "content": "weather"}], use_tools=True,
+                         config=_make_config())
+
+        assert [c.args[0] for c in spy.call_args_list].count(tools) == 1
+        for call in mock_post.call_args_list:
+            assert _sent_payload(call)["tools"] == tools
+
+    def test_invalid_arguments_raise_json_error(self, monkeypatch):
+        from radar import llm
+
+        orjson = pytest.importorskip("orjson")
+        monkeypatch.setattr(llm, "_orjson", orjson)
+        with pytest.raises(json.JSONDecodeError):
+            llm._loads("{not json")
+
+
+class TestExecuteToolCached:
+    """_execute_tool_cached reuses fresh results of read-only tools."""
+
+    @patch("radar.llm.execute_tool", side_effect=["Error: timeout", "ok", "later"])
+    def test_errors_are_not_reused(self, mock_exec):
+        from radar.llm import _execute_tool_cached
+
+        results = {}
+        assert _execute_tool_cached("weather", {"location": "x"}, results) == "Error: timeout"
+        assert _execute_tool_cached("weather", {"location": "x"}, results) == "ok"
+        assert _execute_tool_cached("weather", {"location": "x"}, results) == "ok"
+        assert mock_exec.call_count == 2
+
+    @patch("radar.llm.execute_tool", side_effect=["first", "second"])
+    def test_stale_results_rerun(self, mock_exec, monkeypatch):
+        from radar import llm
+
+        clock = [1000.0]
+        monkeypatch.setattr(llm.time, "monotonic", lambda: clock[0])
+        results = {}
+        assert llm._execute_tool_cached("web_search", {"query": "q"}, results) == "first"
+        clock[0] += llm.CACHEABLE_TOOLS["web_search"]
+        assert llm._execute_tool_cached("web_search", {"query": "q"}, results) == "second"
+
+    @patch("radar.llm.execute_tool", side_effect=["a", "b"])
+    def test_argument_order_does_not_matter(self, mock_exec):
+        from radar.llm import _execute_tool_cached
+
+        results = {}
+        _execute_tool_cached("web_search", {"query": "q", "limit": 3}, results)
+        assert _execute_tool_cached("web_search", {"limit": 3, "query": "q"}, results) == "a"
+
+
 # ── _chat_openai ───────────────────────────────────────────────────
 
 
@@ -403,6 +712,67 @@ class TestChatOpenai:
         assert msg["content"] == "It's sunny!"
         mock_exec.assert_called_once_with("weather", {"city": "NYC"})
 
+    @patch("radar.llm._log_api_call")
+    @patch("radar.llm.execute_tool", return_value="tool result")
+    @patch("radar.llm.get_tools_schema", return_value=[
+        {"function": {"name": "t", "description": "test", "parameters": {}}}
+    ])
+    def test_history_returned_in_ollama_format(self, mock_schema, mock_exec, mock_log):
+        """The returned history matches a full conversion back from OpenAI format."""
+        mock_client = MagicMock()
+        tc = _make_openai_tool_call("call_1", "weather", '{"city": "NYC"}')
+        mock_client.chat.completions.create.side_effect = [
+            SimpleNamespace(choices=[SimpleNamespace(message=_make_openai_message("", [tc]))]),
+            SimpleNamespace(choices=[SimpleNamespace(message=_make_openai_message("Sunny"))]),
+        ]
+        messages = [{"role": "user", "content": "weather"}]
+
+        with patch("openai.OpenAI", return_value=mock_client):
+            _, history = _chat_openai(messages, use_tools=True, config=_make_config(provider="openai"))
+
+        # The client was handed the live OpenAI-format history list
+        sent = mock_client.chat.completions.create.call_args[1]["messages"]
+        assert history == _convert_messages_from_openai(sent)
+        assert history[2] == {"role": "tool", "content": "tool result"}
+
+    @patch("radar.llm._log_api_call")
+    @patch("radar.llm.get_tools_schema", return_value=[
+        {"function": {"name": "b", "description": "", "parameters": {}}},
+        {"function": {"name": "a", "description": "", "parameters": {}}},
+    ])
+    def test_tools_sent_sorted_by_name(self, mock_schema, mock_log):
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=_make_openai_message("ok"))]
+        )
+        with patch("openai.OpenAI", return_value=mock_client):
+            _chat_openai([{"role": "user", "content": "hi"}], use_tools=True,
+                         config=_make_config(provider="openai"))
+        tools = mock_client.chat.completions.create.call_args[1]["tools"]
+        assert [t["function"]["name"] for t in tools] == ["a", "b"]
+
+    @pytest.mark.parametrize("hints", [False, True])
+    @patch("radar.llm._log_api_call")
+    def test_prompt_cache_hints(self, mock_log, hints):
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=_make_openai_message("ok"))]
+        )
+        messages = [{"role": "system", "content": "Be brief."}, {"role": "user", "content": "hi"}]
+        with patch("openai.OpenAI", return_value=mock_client):
+            _, history = _chat_openai(messages, use_tools=False,
+                                      config=_make_config(provider="openai", prompt_cache_hints=hints))
+
+        system = mock_client.chat.completions.create.call_args[1]["messages"][0]
+        if hints:
+            assert system["content"] == [
+                {"type": "text", "text": "Be brief.", "cache_control": {"type": "ephemeral"}},
+            ]
+        else:
+            assert system["content"] == "Be brief."
+        assert messages[0] == {"role": "system", "content": "Be brief."}
+        assert history[0] is messages[0]
+
     @patch("radar.llm._log_api_call")
     @patch("radar.llm._log_fallback")
     def test_rate_limit_fallback(self, mock_fallback_log, mock_log):
@@ -419,12 +789,37 @@ class TestChatOpenai:
         ]
 
         config = _make_config(provider="openai", fallback_model="fallback")
+        on_fallback = MagicMock()
         with patch("openai.OpenAI", return_value=mock_client):
             msg, _ = _chat_openai(
                 [{"role": "user", "content": "hi"}],
-                use_tools=False, config=config,
+                use_tools=False, config=config, on_fallback=on_fallback,
             )
         assert msg["content"] == "Fallback!"
+        on_fallback.assert_called_once_with("fallback")
+
+
+class TestOpenaiClientCache:
+    """_chat_openai reuses one SDK client per (base_url, api_key)."""
+
+    @patch("radar.llm._log_api_call")
+    def test_client_reused_per_endpoint_and_key(self, mock_log):
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=_make_openai_message("ok"))]
+        )
+        config = _make_config(provider="openai", base_url="http://proxy:4000")
+        messages = [{"role": "user", "content": "hi"}]
+
+        with patch("openai.OpenAI", return_value=mock_client) as mock_cls:
+            _chat_openai(messages, use_tools=False, config=config)
+            _chat_openai(messages, use_tools=False, config=config)
+            assert mock_cls.call_count == 1
+            mock_cls.assert_called_with(base_url="http://proxy:4000", api_key="not-needed")
+
+            _chat_openai(messages, use_tools=False, config=config, api_key_override="sk-other")
+            assert mock_cls.call_count == 2
+            mock_cls.assert_called_with(base_url="http://proxy:4000", api_key="sk-other")
 
 
 # ── chat() dispatch ────────────────────────────────────────────────
@@ -448,6 +843,137 @@ class TestChatDispatch:
         mock_openai.assert_called_once()
 
 
+# ── chat() reply cache ────────────────────────────────────────────
+
+
+class TestChatMany:
+    """chat_many() runs independent conversations concurrently."""
+
+    @patch("radar.llm.chat")
+    def test_results_in_input_order(self, mock_chat):
+        threads = set()
+
+        def fake_chat(messages, **kwargs):
+            threads.add(threading.get_ident())
+            time.sleep(0.05 if messages[0]["content"] == "0" else 0)
+            return {"content": messages[0]["content"]}, messages
+
+        mock_chat.side_effect = fake_chat
+        conversations = [[{"role": "user", "content": str(i)}] for i in range(4)]
+
+        results = chat_many(conversations, model_override="m")
+
+        assert [msg["content"] for msg, _ in results] == ["0", "1", "2", "3"]
+        assert len(threads) > 1
+        for call in mock_chat.call_args_list:
+            assert call.kwargs == {"use_tools": False, "model_override": "m"}
+
+    @patch("radar.llm.chat", return_value=({"content": "ok"}, []))
+    def test_single_conversation_runs_inline(self, mock_chat):
+        assert chat_many([[{"role": "user", "content": "hi"}]]) == [({"content": "ok"}, [])]
+        mock_chat.assert_called_once()
+
+    @patch("radar.llm.chat")
+    def test_error_raised_after_all_finish(self, mock_chat):
+        def fake_chat(messages, **kwargs):
+            if messages[0]["content"] == "bad":
+                raise RuntimeError("Ollama error: 500")
+            return {"content": "ok"}, messages
+
+        mock_chat.side_effect = fake_chat
+        with pytest.raises(RuntimeError, match="500"):
+            chat_many([[{"role": "user", "content": "bad"}], [{"role": "user", "content": "ok"}]])
+        assert mock_chat.call_count == 2
+
+
+class TestChatCache:
+    """chat() replays cached replies when llm.cache_enabled is set."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self, isolated_data_dir):
+        from radar.llm_cache import reset_llm_cache
+        reset_llm_cache()
+        yield
+        reset_llm_cache()
+
+    @patch("radar.llm.get_config")
+    @patch("radar.llm._chat_ollama")
+    def test_replays_plain_reply(self, mock_ollama, mock_config):
+        mock_config.return_value = _make_config(cache_enabled=True)
+        messages = [{"role": "user", "content": "hi"}]
+        reply = {"role": "assistant", "content": "hello"}
+        mock_ollama.return_value = (reply, messages + [reply])
+
+        first = chat(list(messages), use_tools=False)
+        second = chat(list(messages), use_tools=False)
+
+        mock_ollama.assert_called_once()
+        assert second == first
+        assert second[0] is not reply  # callers get their own copy
+
+    @patch("radar.llm.get_config")
+    @patch("radar.llm._chat_ollama")
+    def test_does_not_cache_tool_turns(self, mock_ollama, mock_config):
+        mock_config.return_value = _make_config(cache_enabled=True)
+        messages = [{"role": "user", "content": "weather?"}]
+        history = messages + [
+            {"role": "assistant", "content": "", "tool_calls": [{"function": {"name": "weather"}}]},
+            {"role": "tool", "content": "sunny"},
+            {"role": "assistant", "content": "It's sunny"},
+        ]
+        mock_ollama.return_value = (history[-1], history)
+
+        chat(list(messages), use_tools=False)
+        chat(list(messages), use_tools=False)
+
+        assert mock_ollama.call_count == 2
+
+    @patch("radar.llm.get_config")
+    @patch("radar.llm._chat_ollama")
+    def test_does_not_cache_fallback_replies(self, mock_ollama, mock_config):
+        """A reply from the fallback model is not stored under the primary's key."""
+        mock_config.return_value = _make_config(cache_enabled=True, fallback_model="small")
+        messages = [{"role": "user", "content": "hi"}]
+        reply = {"role": "assistant", "content": "hello from small"}
+
+        def fake_chat(msgs, use_tools, config, *, on_fallback, **kwargs):
+            on_fallback("small")
+            return reply, msgs + [reply]
+
+        mock_ollama.side_effect = fake_chat
+
+        chat(list(messages), use_tools=False)
+        chat(list(messages), use_tools=False)
+
+        assert mock_ollama.call_count == 2
+
+    @patch("radar.llm.get_config")
+    @patch("radar.llm._chat_ollama")
+    def test_key_includes_model(self, mock_ollama, mock_config):
+        mock_config.return_value = _make_config(cache_enabled=True)
+        messages = [{"role": "user", "content": "hi"}]
+        reply = {"role": "assistant", "content": "hello"}
+        mock_ollama.return_value = (reply, messages + [reply])
+
+        chat(list(messages), use_tools=False)
+        chat(list(messages), use_tools=False, model_override="other-model")
+
+        assert mock_ollama.call_count == 2
+
+    @patch("radar.llm.get_config")
+    @patch("radar.llm._chat_ollama")
+    def test_disabled_by_default(self, mock_ollama, mock_config):
+        mock_config.return_value = _make_config()
+        messages = [{"role": "user", "content": "hi"}]
+        reply = {"role": "assistant", "content": "hello"}
+        mock_ollama.return_value = (reply, messages + [reply])
+
+        chat(list(messages), use_tools=False)
+        chat(list(messages), use_tools=False)
+
+        assert mock_ollama.call_count == 2
+
+
 # ── _chat_ollama retry ────────────────────────────────────────────
 
 
@@ -457,7 +983,7 @@ class TestChatOllamaRetry:
     @patch("radar.llm.time.sleep")
     @patch("radar.llm.log_retry")
     @patch("radar.llm._log_api_call")
-    @patch("radar.llm.httpx.post")
+    @patch("radar.llm.httpx.Client.post")
     def test_retry_on_timeout_then_success(self, mock_post, mock_log, mock_log_retry, mock_sleep):
         """Timeout on first attempt, success on second."""
         success_resp = _make_ollama_response("Hello!")
@@ -475,7 +1001,27 @@ class TestChatOllamaRetry:
     @patch("radar.llm.time.sleep")
     @patch("radar.llm.log_retry")
     @patch("radar.llm._log_api_call")
-    @patch("radar.llm.httpx.post")
+    @patch("radar.llm.httpx.Client.post")
+    def test_retry_after_header_honored(self, mock_post, mock_log, mock_log_retry, mock_sleep):
+        """A 429 with Retry-After waits the requested time before retrying."""
+        limited = httpx.Response(429, headers={"Retry-After": "0.03"}, text="slow down")
+        mock_post.side_effect = [
+            httpx.HTTPStatusError("429", request=MagicMock(), response=limited),
+            _make_ollama_response("Hello!"),
+        ]
+
+        config = _make_config(max_retries=2)
+        msg, _ = _chat_ollama(
+            [{"role": "user", "content": "hi"}],
+            use_tools=False, config=config,
+        )
+        assert msg["content"] == "Hello!"
+        mock_sleep.assert_called_once_with(0.03)
+
+    @patch("radar.llm.time.sleep")
+    @patch("radar.llm.log_retry")
+    @patch("radar.llm._log_api_call")
+    @patch("radar.llm.httpx.Client.post")
     def test_no_retry_on_400(self, mock_post, mock_log, mock_log_retry, mock_sleep):
         """400 errors are not retryable — fails immediately."""
         error_response = MagicMock(spec=httpx.Response)
@@ -498,7 +1044,7 @@ class TestChatOllamaRetry:
     @patch("radar.llm.log_retry")
     @patch("radar.llm._log_api_call")
     @patch("radar.llm._log_fallback")
-    @patch("radar.llm.httpx.post")
+    @patch("radar.llm.httpx.Client.post")
     def test_retry_exhausted_then_fallback_on_429(self, mock_post, mock_fallback_log,
                                                    mock_log, mock_log_retry, mock_sleep):
         """429 retries exhaust, then fallback model is tried."""
@@ -520,12 +1066,12 @@ class TestChatOllamaRetry:
         # 3 attempts on primary (1 + 2 retries) + 1 on fallback
         assert mock_post.call_count == 4
         # Verify fallback model was used in the last call
-        last_payload = mock_post.call_args_list[3][1]["json"]
+        last_payload = _sent_payload(mock_post.call_args_list[3])
         assert last_payload["model"] == "fallback-model"
 
     @patch("radar.llm.time.sleep")
     @patch("radar.llm._log_api_call")
-    @patch("radar.llm.httpx.post")
+    @patch("radar.llm.httpx.Client.post")
     def test_retries_disabled(self, mock_post, mock_log, mock_sleep):
         """With max_retries=0, no retry happens."""
         mock_post.side_effect = httpx.TimeoutException("timeout")
@@ -541,7 +1087,7 @@ class TestChatOllamaRetry:
 
     @patch("radar.llm.time.sleep")
     @patch("radar.llm._log_api_call")
-    @patch("radar.llm.httpx.post")
+    @patch("radar.llm.httpx.Client.post")
     def test_retries_disabled_via_flag(self, mock_post, mock_log, mock_sleep):
         """With llm_retries=False, no retry even with max_retries > 0."""
         mock_post.side_effect = httpx.TimeoutException("timeout")
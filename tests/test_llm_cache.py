@@ -0,0 +1,124 @@
+"""Tests for radar/llm_cache.py — on-disk LLM reply cache."""
+
+import json
+
+import pytest
+
+from radar import llm_cache
+from radar.llm_cache import (
+    cache_key,
+    cache_stats,
+    get_cached_reply,
+    reset_llm_cache,
+    store_reply,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(isolated_data_dir):
+    reset_llm_cache()
+    yield
+    reset_llm_cache()
+
+
+def _reply(text):
+    return [{"role": "assistant", "content": text}]
+
+
+class TestCacheKey:
+    def test_stable_for_equal_requests(self):
+        msgs = [{"role": "user", "content": "hi", "extra": 1}]
+        reordered = [{"extra": 1, "content": "hi", "role": "user"}]
+        assert cache_key("ollama", "u", "m", msgs, []) == cache_key("ollama", "u", "m", reordered, [])
+
+    @pytest.mark.parametrize("field", range(5))
+    def test_every_input_changes_key(self, field):
+        args = ["ollama", "http://x", "model", [{"role": "user", "content": "hi"}], []]
+        base = cache_key(*args)
+        changed = list(args)
+        changed[field] = [{"changed": True}] if field >= 3 else "other"
+        assert cache_key(*changed) != base
+
+
+class TestStoreAndGet:
+    def test_miss_then_hit(self):
+        assert get_cached_reply("k") is None
+        store_reply("k", _reply("hello"), max_entries=10)
+        assert get_cached_reply("k") == _reply("hello")
+        assert cache_stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+    def test_returns_copies(self):
+        reply = _reply("hello")
+        store_reply("k", reply, max_entries=10)
+        reply[0]["content"] = "mutated"
+        got = get_cached_reply("k")
+        got[0]["content"] = "mutated again"
+        assert get_cached_reply("k") == _reply("hello")
+
+    def test_evicts_least_recently_used(self):
+        store_reply("a", _reply("a"), max_entries=2)
+        store_reply("b", _reply("b"), max_entries=2)
+        get_cached_reply("a")  # a is now the most recently used
+        store_reply("c", _reply("c"), max_entries=2)
+
+        assert get_cached_reply("b") is None
+        assert get_cached_reply("a") == _reply("a")
+        assert get_cached_reply("c") == _reply("c")
+
+
+class TestPersistence:
+    def test_survives_reload(self, isolated_data_dir):
+        store_reply("k", _reply("hello"), max_entries=10)
+        assert (isolated_data_dir / "llm_cache" / "k.json").exists()
+
+        reset_llm_cache()
+        assert get_cached_reply("k") == _reply("hello")
+        assert cache_stats()["entries"] == 1
+
+    def test_store_writes_only_its_entry(self, isolated_data_dir):
+        store_reply("a", _reply("a"), max_entries=10)
+        entry_a = isolated_data_dir / "llm_cache" / "a.json"
+        before = entry_a.read_bytes()
+        store_reply("b", _reply("b"), max_entries=10)
+        assert entry_a.read_bytes() == before
+        assert sorted(p.name for p in entry_a.parent.iterdir()) == ["a.json", "b.json"]
+
+    def test_eviction_trims_below_limit(self):
+        for i in range(11):
+            store_reply(str(i), _reply(str(i)), max_entries=10)
+        # Trimmed to 90% of the limit, dropping the oldest entries
+        assert cache_stats()["entries"] == 9
+        assert get_cached_reply("1") is None
+        assert get_cached_reply("2") == _reply("2")
+
+    def test_corrupt_entry_is_a_miss(self, isolated_data_dir):
+        (isolated_data_dir / "llm_cache").mkdir(exist_ok=True)
+        (isolated_data_dir / "llm_cache" / "k.json").write_text("{not json")
+        assert get_cached_reply("k") is None
+        store_reply("k", _reply("hello"), max_entries=10)
+        assert json.loads((isolated_data_dir / "llm_cache" / "k.json").read_text()) == _reply("hello")
+
+    def test_entry_counts_follow_the_data_directory(self, tmp_path, monkeypatch):
+        import radar.config
+
+        for i in range(3):
+            store_reply(str(i), _reply(str(i)), max_entries=10)
+
+        other = tmp_path / "other_data"
+        other.mkdir()
+        monkeypatch.setenv("RADAR_DATA_DIR", str(other))
+        radar.config.reset_data_paths()
+        assert cache_stats()["entries"] == 0
+        store_reply("x", _reply("x"), max_entries=1)
+        # Not evicted on the strength of the first directory's count
+        assert get_cached_reply("x") == _reply("x")
+        assert cache_stats()["entries"] == 1
+
+    def test_unwritable_directory_is_ignored(self, isolated_data_dir, monkeypatch):
+        def fail(*args, **kwargs):
+            raise OSError("read-only")
+
+        monkeypatch.setattr(llm_cache.os, "replace", fail)
+        store_reply("k", _reply("hello"), max_entries=10)
+        assert get_cached_reply("k") is None
+        assert list((isolated_data_dir / "llm_cache").iterdir()) == []
@@ -348,6 +348,23 @@ class TestGetMessagesForDisplay:
         assert display[0]["content"] == "hello"
         assert "id" in display[0]
 
+    def test_includes_raw_timestamp(self, isolated_data_dir):
+        cid = create_conversation()
+        add_message(cid, "user", "hello")
+        raw = get_messages(cid)
+        display = get_messages_for_display(cid)
+        assert display[0]["timestamp"] == raw[0]["timestamp"]
+
+    def test_results_matched_within_their_turn(self, isolated_data_dir):
+        cid = create_conversation()
+        for result in ("first", "second"):
+            add_message(cid, "assistant", None, tool_calls=[
+                {"function": {"name": "weather", "arguments": {}}, "id": "call_1"},
+            ])
+            add_message(cid, "tool", result, tool_call_id="call_1")
+        display = get_messages_for_display(cid)
+        assert [m["tool_calls"][0]["result"] for m in display] == ["first", "second"]
+
 
 class TestCountToolCallsToday:
     """count_tool_calls_today scans today's conversations."""
@@ -1,5 +1,6 @@
 """Tests for directory-based personality format and context documents."""
 
+import dataclasses
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -260,7 +261,7 @@ class TestLoadContextTool:
         """Helper to set active personality via config mock."""
         import radar.config
         original_config = radar.config.get_config()
-        original_config.personality = name
+        radar.config.set_config(dataclasses.replace(original_config, personality=name))
 
     def test_load_context_returns_content(self, personalities_dir, monkeypatch):
         """load_context returns full body with frontmatter stripped."""
@@ -1,11 +1,19 @@
 """Tests for radar/retry.py — exponential backoff, retryable error detection."""
 
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from unittest.mock import MagicMock
 
 import httpx
 import pytest
 
-from radar.retry import compute_delay, is_retryable_httpx_error, is_retryable_openai_error
+from radar.retry import (
+    compute_delay,
+    compute_retry_delay,
+    is_retryable_httpx_error,
+    is_retryable_openai_error,
+    retry_after_seconds,
+)
 
 
 # ── compute_delay ─────────────────────────────────────────────────
@@ -49,6 +57,52 @@ class TestComputeDelay:
 # ── is_retryable_httpx_error ──────────────────────────────────────
 
 
+# ── Retry-After ───────────────────────────────────────────────────
+
+
+def _status_error(status_code, headers=None):
+    response = httpx.Response(status_code, headers=headers or {})
+    return httpx.HTTPStatusError(str(status_code), request=MagicMock(), response=response)
+
+
+class TestRetryAfter:
+    """retry_after_seconds / compute_retry_delay honor Retry-After."""
+
+    def test_seconds(self):
+        assert retry_after_seconds(_status_error(429, {"Retry-After": "7"})) == 7.0
+
+    def test_http_date(self):
+        when = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+        delay = retry_after_seconds(_status_error(503, {"Retry-After": when}))
+        assert 55 <= delay <= 60
+
+    def test_past_date_is_zero(self):
+        exc = _status_error(429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        assert retry_after_seconds(exc) == 0.0
+
+    @pytest.mark.parametrize("exc", [
+        _status_error(429),
+        _status_error(429, {"Retry-After": "soon"}),
+        httpx.TimeoutException("timeout"),
+        Exception("no response"),
+    ])
+    def test_absent_or_invalid(self, exc):
+        assert retry_after_seconds(exc) is None
+
+    def test_openai_style_error(self):
+        exc = Exception("Rate limit")
+        exc.response = httpx.Response(429, headers={"retry-after": "2"})
+        assert retry_after_seconds(exc) == 2.0
+
+    def test_retry_after_capped_at_max_delay(self):
+        exc = _status_error(429, {"Retry-After": "3600"})
+        assert compute_retry_delay(exc, 0, base_delay=1.0, max_delay=30.0) == 30.0
+
+    def test_falls_back_to_backoff(self):
+        delay = compute_retry_delay(_status_error(429), 2, base_delay=1.0, max_delay=30.0)
+        assert 0 <= delay <= 4.0
+
+
 class TestIsRetryableHttpxError:
     """is_retryable_httpx_error classifies httpx exceptions."""
 
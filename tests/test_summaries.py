@@ -1,5 +1,6 @@
 """Tests for conversation summaries."""
 
+import dataclasses
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -443,21 +444,25 @@ class TestStoreConversationSummaryTool:
 
 class TestHeartbeatIntegration:
     def test_check_summary_due_returns_none_when_disabled(self, isolated_data_dir):
-        from radar.config import get_config
+        from radar.config import get_config, set_config
         from radar.summaries import check_summary_due
 
         config = get_config()
-        config.summaries.enabled = False
+        set_config(dataclasses.replace(
+            config, summaries=dataclasses.replace(config.summaries, enabled=False)
+        ))
 
         result = check_summary_due("daily")
         assert result is None
 
     def test_check_summary_due_returns_none_before_time(self, isolated_data_dir):
-        from radar.config import get_config
+        from radar.config import get_config, set_config
         from radar.summaries import check_summary_due
 
         config = get_config()
-        config.summaries.daily_summary_time = "23:59"
+        set_config(dataclasses.replace(
+            config, summaries=dataclasses.replace(config.summaries, daily_summary_time="23:59")
+        ))
 
         # Unless it's actually 23:59, this should return None
         now = datetime.now()
@@ -466,11 +471,13 @@ class TestHeartbeatIntegration:
             assert result is None
 
     def test_check_summary_due_skips_existing(self, summaries_dir, sample_conversations, isolated_data_dir):
-        from radar.config import get_config
+        from radar.config import get_config, set_config
         from radar.summaries import check_summary_due, write_summary
 
         config = get_config()
-        config.summaries.daily_summary_time = "00:00"
+        set_config(dataclasses.replace(
+            config, summaries=dataclasses.replace(config.summaries, daily_summary_time="00:00")
+        ))
 
         today = datetime.now().strftime("%Y-%m-%d")
         write_summary("daily", today, "Already exists")
@@ -479,11 +486,13 @@ class TestHeartbeatIntegration:
         assert result is None
 
     def test_check_summary_due_returns_data(self, summaries_dir, sample_conversations, isolated_data_dir):
-        from radar.config import get_config
+        from radar.config import get_config, set_config
         from radar.summaries import check_summary_due
 
         config = get_config()
-        config.summaries.daily_summary_time = "00:00"
+        set_config(dataclasses.replace(
+            config, summaries=dataclasses.replace(config.summaries, daily_summary_time="00:00")
+        ))
 
         result = check_summary_due("daily")
         # Should return formatted conversations (unless no conversations today)
@@ -203,7 +203,7 @@ class TestToolsConfig:
         from radar.config import ToolsConfig
 
         tc = ToolsConfig()
-        assert tc.extra_dirs == []
+        assert tc.extra_dirs == ()
 
     def test_extra_dirs_from_dict(self):
         from radar.config import Config
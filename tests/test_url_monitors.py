@@ -1,5 +1,6 @@
 """Tests for URL monitor CRUD, fetching, diffing, and tools."""
 
+import dataclasses
 import hashlib
 import json
 import zlib
@@ -231,10 +232,12 @@ class TestFetchAndDiff:
 
     def test_compute_diff_truncation(self):
         from radar.url_monitors import compute_diff
-        from radar.config import get_config
+        from radar.config import get_config, set_config
 
         config = get_config()
-        config.web_monitor.max_diff_length = 50
+        set_config(dataclasses.replace(
+            config, web_monitor=dataclasses.replace(config.web_monitor, max_diff_length=50)
+        ))
 
         old = "\n".join(f"line{i}" for i in range(100))
         new = "\n".join(f"changed{i}" for i in range(100))
@@ -289,10 +292,12 @@ class TestFetchAndDiff:
     @patch("radar.url_monitors.httpx.get")
     def test_fetch_content_size_limit(self, mock_get):
         from radar.url_monitors import fetch_url_content
-        from radar.config import get_config
+        from radar.config import get_config, set_config
 
         config = get_config()
-        config.web_monitor.max_content_size = 100
+        set_config(dataclasses.replace(
+            config, web_monitor=dataclasses.replace(config.web_monitor, max_content_size=100)
+        ))
 
         mock_resp = MagicMock()
         mock_resp.status_code = 200
@@ -420,10 +425,12 @@ class TestCheckMonitor:
     @patch("radar.url_monitors.httpx.get")
     def test_auto_pause_after_max_errors(self, mock_get):
         from radar.url_monitors import create_monitor, get_monitor, check_monitor
-        from radar.config import get_config
+        from radar.config import get_config, set_config
 
         config = get_config()
-        config.web_monitor.max_error_count = 2
+        set_config(dataclasses.replace(
+            config, web_monitor=dataclasses.replace(config.web_monitor, max_error_count=2)
+        ))
 
         mock_get.side_effect = Exception("fail")
 